@@ -0,0 +1,126 @@
+"""
+Comparación de resultados de benchmarks.suite contra una línea base.
+
+Uso:
+    python -m benchmarks.comparar base.json resultados.json [--tolerancia 0.10]
+
+Termina con código 1 si alguna métrica empeoró más que la tolerancia.
+"""
+import argparse
+import json
+import sys
+from typing import Any, Dict, List, Optional
+
+# Métricas comparadas: (nombre, ruta dentro de la medición de un escenario)
+METRICAS = (
+    ('tiempo_mediana_ms', ('tiempo_ms', 'mediana')),
+    ('asignado_pico_kb', ('asignado_pico_kb',)),
+    ('rss_pico_kb', ('rss_pico_kb',)),
+)
+# Diferencia absoluta mínima para considerar una regresión (evita marcar
+# como regresión el ruido de escenarios que tardan o asignan muy poco)
+MINIMOS = {'tiempo_mediana_ms': 1.0, 'asignado_pico_kb': 64.0, 'rss_pico_kb': 1024.0}
+
+
+def _valor(medicion: Dict[str, Any], ruta: tuple) -> Optional[float]:
+    """Valor de una métrica, o None si falta."""
+    for clave in ruta:
+        if not isinstance(medicion, dict) or medicion.get(clave) is None:
+            return None
+        medicion = medicion[clave]
+    return float(medicion)
+
+
+def comparar(base: Dict[str, Any], actual: Dict[str, Any],
+             tolerancia: float = 0.10) -> List[Dict[str, Any]]:
+    """
+    Compara las métricas de los escenarios presentes en ambos resultados.
+
+    Args:
+        base: Resultados de referencia
+        actual: Resultados nuevos
+        tolerancia: Aumento relativo permitido (0.10 = 10 %); además el
+            aumento absoluto debe superar MINIMOS
+
+    Returns:
+        List[Dict[str, Any]]: Una entrada por escenario y métrica con
+        'escenario', 'metrica', 'base', 'actual', 'cambio' (relativo) y
+        'regresion'
+    """
+    diferencias = []
+    escenarios_base = base.get('escenarios', {})
+    for escenario, medicion in actual.get('escenarios', {}).items():
+        if escenario not in escenarios_base:
+            continue
+        for metrica, ruta in METRICAS:
+            anterior = _valor(escenarios_base[escenario], ruta)
+            nuevo = _valor(medicion, ruta)
+            if anterior is None or nuevo is None:
+                continue
+            cambio = (nuevo - anterior) / anterior if anterior else 0.0
+            diferencias.append({
+                'escenario': escenario,
+                'metrica': metrica,
+                'base': anterior,
+                'actual': nuevo,
+                'cambio': round(cambio, 4),
+                'regresion': cambio > tolerancia and nuevo - anterior > MINIMOS[metrica],
+            })
+    return diferencias
+
+
+def formatear(diferencias: List[Dict[str, Any]]) -> str:
+    """
+    Tabla de texto con las diferencias.
+
+    Args:
+        diferencias: Resultado de comparar()
+
+    Returns:
+        str: Una línea por escenario y métrica
+    """
+    lineas = [f"{'escenario':<30} {'métrica':<18} {'base':>12} {'actual':>12} {'cambio':>8}"]
+    for d in diferencias:
+        marca = '  REGRESIÓN' if d['regresion'] else ''
+        lineas.append(
+            f"{d['escenario']:<30} {d['metrica']:<18} {d['base']:>12.1f} "
+            f"{d['actual']:>12.1f} {d['cambio']:>+8.1%}{marca}"
+        )
+    return '\n'.join(lineas)
+
+
+def advertencias(base: Dict[str, Any], actual: Dict[str, Any]) -> List[str]:
+    """
+    Diferencias de carga o entorno que invalidan la comparación.
+
+    Args:
+        base: Resultados de referencia
+        actual: Resultados nuevos
+
+    Returns:
+        List[str]: Una advertencia por dato de 'meta' distinto
+    """
+    claves = ('clientes', 'servicios', 'semilla', 'python', 'sqlite')
+    meta_base, meta_actual = base.get('meta', {}), actual.get('meta', {})
+    return [f"{clave}: {meta_base.get(clave)} -> {meta_actual.get(clave)}"
+            for clave in claves if meta_base.get(clave) != meta_actual.get(clave)]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('base', help="Resultados de referencia (JSON)")
+    parser.add_argument('actual', help="Resultados nuevos (JSON)")
+    parser.add_argument('--tolerancia', type=float, default=0.10,
+                        help="Aumento relativo tolerado (por defecto 0.10)")
+    args = parser.parse_args()
+
+    with open(args.base, encoding='utf-8') as archivo:
+        base = json.load(archivo)
+    with open(args.actual, encoding='utf-8') as archivo:
+        actual = json.load(archivo)
+
+    for advertencia in advertencias(base, actual):
+        print(f"Advertencia: distinto {advertencia}", file=sys.stderr)
+    diferencias = comparar(base, actual, args.tolerancia)
+    print(formatear(diferencias))
+    sys.exit(1 if any(d['regresion'] for d in diferencias) else 0)
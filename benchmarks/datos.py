@@ -0,0 +1,222 @@
+"""
+Generador reproducible de datos sintéticos para los benchmarks.
+
+Las filas dependen solo de la semilla y de la cantidad pedida: dos
+ejecuciones con los mismos parámetros producen exactamente la misma base.
+Los DNI y teléfonos cumplen utils.validators; los estados, costos y fechas
+siguen distribuciones parecidas a las de un taller real (mayoría de
+servicios completados, costos log-normales, más ingresos recientes).
+
+Uso:
+    python -m benchmarks.datos --clientes 100000 --servicios 500000 --db bench.db
+"""
+import argparse
+import os
+import random
+from datetime import date, timedelta
+from typing import Any, Dict, Iterator, List, Optional
+
+NOMBRES = [
+    'María', 'José', 'Ana', 'Juan', 'Lucía', 'Carlos', 'Sofía', 'Luis', 'Valentina',
+    'Jorge', 'Camila', 'Miguel', 'Martina', 'Diego', 'Paula', 'Pablo', 'Laura',
+    'Javier', 'Florencia', 'Andrés', 'Julieta', 'Ricardo', 'Agustina', 'Fernando'
+]
+APELLIDOS = [
+    'González', 'Rodríguez', 'Gómez', 'Fernández', 'López', 'Díaz', 'Martínez',
+    'Pérez', 'García', 'Sánchez', 'Romero', 'Sosa', 'Álvarez', 'Torres', 'Ruiz',
+    'Ramírez', 'Flores', 'Acosta', 'Benítez', 'Medina', 'Herrera', 'Suárez'
+]
+EQUIPOS = [
+    'Notebook', 'PC de escritorio', 'Impresora', 'Monitor', 'Celular', 'Tablet',
+    'Router', 'Consola', 'Televisor', 'Fuente de alimentación'
+]
+TAREAS = [
+    'no enciende', 'cambio de pantalla', 'limpieza y mantenimiento', 'reinstalación',
+    'cambio de batería', 'falla intermitente', 'actualización de hardware',
+    'recuperación de datos', 'revisión general', 'reemplazo de conector'
+]
+
+# Estado -> peso relativo en la distribución
+PESOS_ESTADO = {'PENDIENTE': 0.12, 'EN_PROCESO': 0.13, 'COMPLETADO': 0.65, 'CANCELADO': 0.10}
+PROPORCION_BAJA_CLIENTES = 0.03
+PROPORCION_BAJA_SERVICIOS = 0.02
+PROPORCION_SIN_ESTIMADA = 0.2
+DIAS_HISTORIA = 730
+
+# Multiplicador primo, coprimo con el rango: índice -> DNI único de 8 dígitos
+_RANGO_DNI = 90_000_000
+_MULTIPLICADOR_DNI = 48271
+
+
+def dni_sintetico(indice: int, semilla: int) -> str:
+    """
+    DNI único para cada índice menor a 90 millones.
+
+    Args:
+        indice: Posición del cliente (desde 0)
+        semilla: Semilla del conjunto de datos
+
+    Returns:
+        str: DNI de 8 dígitos
+    """
+    return str(10_000_000 + (indice * _MULTIPLICADOR_DNI + semilla) % _RANGO_DNI)
+
+
+def _telefono(rng: random.Random) -> str:
+    """Teléfono en alguno de los formatos habituales (8 a 13 dígitos)."""
+    numero = rng.randrange(10_000_000, 100_000_000)
+    formato = rng.random()
+    if formato < 0.5:
+        return f'11{numero}'
+    if formato < 0.8:
+        return f'(011) {numero // 10_000}-{numero % 10_000:04d}'
+    return f'15-{numero // 10_000}-{numero % 10_000:04d}'
+
+
+def generar_clientes(cantidad: int, semilla: int = 42,
+                     desde: int = 0) -> Iterator[Dict[str, Any]]:
+    """
+    Genera clientes sintéticos.
+
+    Args:
+        cantidad: Clientes a generar
+        semilla: Semilla del conjunto de datos
+        desde: Índice del primer cliente (para generar por tramos)
+
+    Yields:
+        Dict[str, Any]: Datos de cliente (formato de Cliente.from_dict)
+    """
+    for indice in range(desde, desde + cantidad):
+        rng = random.Random(semilla * 1_000_003 + indice)
+        yield {
+            'nombre': rng.choice(NOMBRES),
+            'apellido': rng.choice(APELLIDOS),
+            'dni': dni_sintetico(indice, semilla),
+            'telefono': _telefono(rng),
+            'baja': rng.random() < PROPORCION_BAJA_CLIENTES
+        }
+
+
+def generar_servicios(cantidad: int, cantidad_clientes: int, semilla: int = 42,
+                      hoy: Optional[date] = None,
+                      desde: int = 0) -> Iterator[Dict[str, Any]]:
+    """
+    Genera servicios sintéticos para clientes con id 1..cantidad_clientes.
+
+    Args:
+        cantidad: Servicios a generar
+        cantidad_clientes: Clientes existentes a los que asignar servicios
+        semilla: Semilla del conjunto de datos
+        hoy: Fecha de referencia (por defecto 2025-01-01, fija para que los
+            datos no cambien con el día de ejecución)
+        desde: Índice del primer servicio (para generar por tramos)
+
+    Yields:
+        Dict[str, Any]: Datos de servicio (formato de Servicio.from_dict)
+    """
+    hoy = hoy or date(2025, 1, 1)
+    estados = list(PESOS_ESTADO)
+    pesos = list(PESOS_ESTADO.values())
+
+    for indice in range(desde, desde + cantidad):
+        rng = random.Random(semilla * 2_000_003 + indice)
+        # Distribución triangular: más ingresos recientes que antiguos
+        antiguedad = int(rng.triangular(0, DIAS_HISTORIA, 0))
+        ingreso = hoy - timedelta(days=antiguedad)
+        estimada = None
+        if rng.random() >= PROPORCION_SIN_ESTIMADA:
+            estimada = (ingreso + timedelta(days=rng.randint(1, 30))).isoformat()
+        yield {
+            'descripcion': f'{rng.choice(EQUIPOS)}: {rng.choice(TAREAS)}',
+            'estado': rng.choices(estados, pesos)[0],
+            'fecha_ingreso': ingreso.isoformat(),
+            'fecha_estimada': estimada,
+            'costo': round(rng.lognormvariate(9.5, 0.8), 2),
+            # Clientes con más servicios que otros (sesgo hacia ids bajos)
+            'idCliente': 1 + int(cantidad_clientes * rng.random() ** 1.5),
+            'baja': rng.random() < PROPORCION_BAJA_SERVICIOS
+        }
+
+
+def _lotes(filas: Iterator[Dict[str, Any]], tamanio: int) -> Iterator[List[Dict[str, Any]]]:
+    """Agrupa un iterador de filas en listas de hasta tamanio elementos."""
+    lote: List[Dict[str, Any]] = []
+    for fila in filas:
+        lote.append(fila)
+        if len(lote) == tamanio:
+            yield lote
+            lote = []
+    if lote:
+        yield lote
+
+
+def poblar_base(clientes: int, servicios: int, semilla: int = 42,
+                lote: int = 10000) -> Dict[str, int]:
+    """
+    Carga los datos sintéticos en la base configurada en config.DB_PATH.
+
+    Usa las inserciones por lote de los controladores, así los triggers de
+    texto completo, resúmenes y rollups quedan igual que en producción.
+
+    Args:
+        clientes: Cantidad de clientes
+        servicios: Cantidad de servicios
+        semilla: Semilla del conjunto de datos
+        lote: Filas por transacción
+
+    Returns:
+        Dict[str, int]: Clientes y servicios insertados
+    """
+    from controllers.analitica_controller import AnaliticaController
+    from controllers.cliente_controller import ClienteController
+    from controllers.servicio_controller import ServicioController
+
+    cliente_controller = ClienteController()
+    servicio_controller = ServicioController()
+    insertados = {'clientes': 0, 'servicios': 0}
+
+    for filas in _lotes(generar_clientes(clientes, semilla), lote):
+        insertados['clientes'] += cliente_controller.insertar_clientes_lote(filas)['insertados']
+    for filas in _lotes(generar_servicios(servicios, clientes, semilla), lote):
+        insertados['servicios'] += servicio_controller.insertar_servicios_lote(filas)
+
+    AnaliticaController().actualizar_rollups()
+    return insertados
+
+
+def preparar_base(ruta: str, clientes: int, servicios: int, semilla: int = 42) -> bool:
+    """
+    Apunta la aplicación a ruta y la puebla si el archivo no existe.
+
+    Debe llamarse antes de crear cualquier controlador o DatabaseConnection.
+
+    Args:
+        ruta: Archivo SQLite del conjunto de datos
+        clientes: Cantidad de clientes
+        servicios: Cantidad de servicios
+        semilla: Semilla del conjunto de datos
+
+    Returns:
+        bool: True si la base se generó, False si se reutilizó una existente
+    """
+    import config
+
+    existia = os.path.exists(ruta)
+    config.DB_PATH = ruta
+    config.DB_DIR = os.path.dirname(ruta)
+    if not existia:
+        poblar_base(clientes, servicios, semilla)
+    return not existia
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--clientes', type=int, default=10000, help="Cantidad de clientes")
+    parser.add_argument('--servicios', type=int, default=50000, help="Cantidad de servicios")
+    parser.add_argument('--seed', type=int, default=42, help="Semilla")
+    parser.add_argument('--db', required=True, help="Archivo SQLite a crear")
+    args = parser.parse_args()
+    if os.path.exists(args.db):
+        parser.error(f"{args.db} ya existe")
+    preparar_base(args.db, args.clientes, args.servicios, args.seed)
+    print(f"Base generada en {args.db}")
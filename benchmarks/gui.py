@@ -0,0 +1,358 @@
+"""
+Benchmarks de la interfaz con los widgets reales, sin pantalla.
+
+Ejecuta las vistas bajo QT_QPA_PLATFORM=offscreen sobre una base sintética
+de benchmarks.datos y mide:
+
+- primer pintado: desde que se crea la vista hasta que la tabla (o el
+  gráfico) termina de pintarse por primera vez, con la memoria asignada
+  (tracemalloc) y el aumento de RSS que deja el widget;
+- llenado de tablas: ClienteView.cargar_clientes y
+  ServicioView.actualizar_tabla hasta repintar la tabla;
+- búsqueda: desde la última tecla en el cuadro de búsqueda hasta ver los
+  resultados pintados (incluye la espera de BusquedaDiferida), y el costo
+  de procesar cada tecla en el hilo de la interfaz;
+- Dashboard.cargar_estadisticas: tiempo bloqueando el hilo de la interfaz
+  y hasta ver las estadísticas aplicadas.
+
+El JSON tiene el mismo formato que benchmarks.suite, así que se compara con
+una línea base con benchmarks.comparar (o con --baseline).
+
+Uso:
+    python -m benchmarks.gui [--clientes 2000] [--servicios 10000] [--output gui.json]
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt6.QtCore import QEvent, QObject
+from PyQt6.QtTest import QTest
+from PyQt6.QtWidgets import QApplication, QWidget
+
+from benchmarks.datos import preparar_base
+from benchmarks.suite import (limpiar_caches, metadatos, repeticiones_validas,
+                              resumen_tiempos, rss_pico_kb)
+
+ANCHO, ALTO = 1200, 700
+TIMEOUT_S = 30.0
+
+
+class _DetectorPintado(QObject):
+    """Filtro de eventos que registra cuándo se pintó un widget."""
+
+    def __init__(self, widget: QWidget):
+        super().__init__()
+        self.pintado = False
+        widget.installEventFilter(self)
+
+    def eventFilter(self, objeto: QObject, evento: QEvent) -> bool:
+        if evento.type() == QEvent.Type.Paint:
+            self.pintado = True
+        return False
+
+
+def _esperar(condicion: Callable[[], bool], app: QApplication) -> None:
+    """Procesa eventos hasta que se cumpla la condición."""
+    limite = time.perf_counter() + TIMEOUT_S
+    while not condicion():
+        if time.perf_counter() > limite:
+            raise TimeoutError("La interfaz no respondió a tiempo")
+        app.processEvents()
+        time.sleep(0.0005)
+
+
+def _rss_actual_kb() -> Optional[int]:
+    """Memoria residente actual en KiB (solo Linux; None en otros sistemas)."""
+    try:
+        with open('/proc/self/statm') as archivo:
+            paginas = int(archivo.read().split()[1])
+        return paginas * os.sysconf('SC_PAGE_SIZE') // 1024
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _descartar(widget: QWidget, app: QApplication) -> None:
+    """Cierra y destruye un widget antes de la siguiente repetición."""
+    widget.close()
+    widget.deleteLater()
+    app.processEvents()
+    gc.collect()
+
+
+def _medicion(tiempos: List[float], **extra: Any) -> Dict[str, Any]:
+    """Medición en el formato de benchmarks.suite."""
+    return {'tiempo_ms': resumen_tiempos(tiempos), 'rss_pico_kb': rss_pico_kb(), **extra}
+
+
+def primer_pintado(crear: Callable[[], QWidget], superficie: Callable[[QWidget], QWidget],
+                   app: QApplication, repeticiones: int) -> Dict[str, Any]:
+    """
+    Mide el tiempo hasta el primer pintado de una vista y su memoria.
+
+    Args:
+        crear: Construye la vista
+        superficie: Widget de la vista cuyo pintado marca el fin (tabla, gráfico)
+        app: Aplicación Qt
+        repeticiones: Construcciones cronometradas (más una de calentamiento
+            y otra para medir la memoria)
+
+    Returns:
+        Dict[str, Any]: Medición con 'asignado_pico_kb' y 'widget_rss_kb'
+    """
+    tiempos = []
+    # Construcción 0: calentamiento (importaciones y cachés de Qt); la última
+    # se mide con tracemalloc. Las repeticiones cronometradas van en el medio.
+    for repeticion in range(repeticiones + 2):
+        limpiar_caches()
+        rss_antes = _rss_actual_kb()
+        medir_memoria = repeticion == repeticiones + 1
+        if medir_memoria:
+            tracemalloc.start()
+
+        inicio = time.perf_counter()
+        vista = crear()
+        detector = _DetectorPintado(superficie(vista))
+        vista.resize(ANCHO, ALTO)
+        vista.show()
+        _esperar(lambda: detector.pintado, app)
+        duracion = (time.perf_counter() - inicio) * 1000
+
+        if medir_memoria:
+            _, pico = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            rss_despues = _rss_actual_kb()
+        elif repeticion:
+            tiempos.append(duracion)
+        _descartar(vista, app)
+
+    incremento = None
+    if rss_antes is not None and rss_despues is not None:
+        incremento = rss_despues - rss_antes
+    return _medicion(tiempos, asignado_pico_kb=round(pico / 1024, 1),
+                     widget_rss_kb=incremento)
+
+
+def llenado_tabla(vista: QWidget, tabla: QWidget, llenar: Callable[[], None],
+                  app: QApplication, repeticiones: int) -> Dict[str, Any]:
+    """
+    Mide el llenado de una tabla visible hasta terminar de repintarla.
+
+    Args:
+        vista: Vista ya mostrada
+        tabla: QTableView a repintar
+        llenar: Operación que carga las filas
+        app: Aplicación Qt
+        repeticiones: Ejecuciones cronometradas
+
+    Returns:
+        Dict[str, Any]: Medición con 'asignado_pico_kb' y 'filas'
+    """
+    tiempos = []
+    for _ in range(repeticiones):
+        limpiar_caches()
+        inicio = time.perf_counter()
+        llenar()
+        tabla.viewport().repaint()
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+        app.processEvents()
+
+    limpiar_caches()
+    tracemalloc.start()
+    llenar()
+    tabla.viewport().repaint()
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return _medicion(tiempos, asignado_pico_kb=round(pico / 1024, 1),
+                     filas=tabla.model().rowCount())
+
+
+def busqueda(vista: QWidget, textos: List[str], app: QApplication) -> Dict[str, Any]:
+    """
+    Mide la búsqueda de ClienteView tecleando cada texto en el cuadro.
+
+    Args:
+        vista: ClienteView ya mostrada
+        textos: Textos a teclear (una medición por texto)
+        app: Aplicación Qt
+
+    Returns:
+        Dict[str, Any]: 'tiempo_ms' es la latencia desde la última tecla
+        hasta los resultados pintados; 'tecla_ms' el costo de cada tecla en
+        el hilo de la interfaz; 'espera_ms' la demora fija de la búsqueda
+    """
+    recibidos: List[float] = []
+    vista.busqueda.resultados.connect(lambda _: recibidos.append(time.perf_counter()))
+    latencias: List[float] = []
+    teclas: List[float] = []
+
+    for texto in textos:
+        vista.search_input.clear()
+        app.processEvents()
+        recibidos.clear()
+        for caracter in texto:
+            inicio = time.perf_counter()
+            QTest.keyClick(vista.search_input, caracter)
+            teclas.append((time.perf_counter() - inicio) * 1000)
+        ultima_tecla = time.perf_counter()
+        _esperar(lambda: bool(recibidos), app)
+        vista.clientes_table.viewport().repaint()
+        latencias.append((time.perf_counter() - ultima_tecla) * 1000)
+
+    vista.search_input.clear()
+    app.processEvents()
+    return _medicion(latencias, tecla_ms=resumen_tiempos(teclas),
+                     espera_ms=vista.busqueda._timer.interval())
+
+
+def estadisticas_dashboard(vista: QWidget, app: QApplication,
+                           repeticiones: int) -> Dict[str, Any]:
+    """
+    Mide una actualización forzada del dashboard hasta ver los datos.
+
+    Args:
+        vista: Dashboard ya mostrado
+        app: Aplicación Qt
+        repeticiones: Ejecuciones cronometradas
+
+    Returns:
+        Dict[str, Any]: 'tiempo_ms' hasta aplicar y pintar las estadísticas;
+        'bloqueo_ms' el tiempo que cargar_estadisticas ocupa el hilo de la
+        interfaz
+    """
+    _esperar(lambda: vista._signals_actuales is None, app)
+    tiempos: List[float] = []
+    bloqueos: List[float] = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        vista.cargar_estadisticas(forzar=True)
+        bloqueos.append((time.perf_counter() - inicio) * 1000)
+        _esperar(lambda: vista._signals_actuales is None, app)
+        vista.repaint()
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+    return _medicion(tiempos, bloqueo_ms=resumen_tiempos(bloqueos))
+
+
+def ejecutar(app: QApplication, repeticiones: int, filas_tabla: int) -> Dict[str, Any]:
+    """
+    Ejecuta todos los escenarios de interfaz.
+
+    Args:
+        app: Aplicación Qt
+        repeticiones: Ejecuciones cronometradas por escenario
+        filas_tabla: Servicios que se pasan a ServicioView.actualizar_tabla
+
+    Returns:
+        Dict[str, Any]: Mediciones por escenario
+    """
+    from controllers.servicio_controller import ServicioController
+    from views.cliente_view import ClienteView
+    from views.dashboard import Dashboard
+    from views.servicio_view import ServicioView
+
+    resultados: Dict[str, Any] = {}
+
+    resultados['cliente_view_primer_pintado'] = primer_pintado(
+        ClienteView, lambda v: v.clientes_table.viewport(), app, repeticiones)
+    resultados['servicio_view_primer_pintado'] = primer_pintado(
+        ServicioView, lambda v: v.servicios_table.viewport(), app, repeticiones)
+    resultados['dashboard_primer_pintado'] = primer_pintado(
+        Dashboard, lambda v: v.tendencia_chart, app, repeticiones)
+
+    clientes = ClienteView()
+    clientes.resize(ANCHO, ALTO)
+    clientes.show()
+    app.processEvents()
+    resultados['cliente_view_cargar_clientes'] = llenado_tabla(
+        clientes, clientes.clientes_table, clientes.cargar_clientes, app, repeticiones)
+    resultados['cliente_view_busqueda'] = busqueda(
+        clientes, ['gonz', 'mar', '1000', 'pérez', 'ana'][:max(repeticiones, 1)], app)
+    _descartar(clientes, app)
+
+    servicios = ServicioView()
+    servicios.resize(ANCHO, ALTO)
+    servicios.show()
+    app.processEvents()
+    lista = ServicioController().obtener_servicios_con_cliente(page_size=filas_tabla).items
+    resultados['servicio_view_actualizar_tabla'] = llenado_tabla(
+        servicios, servicios.servicios_table, lambda: servicios.actualizar_tabla(lista),
+        app, repeticiones)
+    _descartar(servicios, app)
+
+    dashboard = Dashboard()
+    dashboard.resize(ANCHO, ALTO)
+    dashboard.show()
+    resultados['dashboard_cargar_estadisticas'] = estadisticas_dashboard(
+        dashboard, app, repeticiones)
+    _descartar(dashboard, app)
+
+    return resultados
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Punto de entrada de la línea de comandos.
+
+    Returns:
+        int: 0 si no hay regresiones respecto de --baseline, 1 si las hay
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--clientes', type=int, default=2000, help="Cantidad de clientes")
+    parser.add_argument('--servicios', type=int, default=10000, help="Cantidad de servicios")
+    parser.add_argument('--seed', type=int, default=42, help="Semilla de los datos")
+    parser.add_argument('--repeticiones', type=repeticiones_validas, default=5,
+                        help="Ejecuciones cronometradas por escenario")
+    parser.add_argument('--filas-tabla', type=int, default=1000,
+                        help="Servicios para ServicioView.actualizar_tabla")
+    parser.add_argument('--db', help="Base de datos (por defecto la misma que benchmarks.suite)")
+    parser.add_argument('--output', help="Archivo JSON de resultados")
+    parser.add_argument('--baseline', help="Resultados de referencia con los que comparar")
+    parser.add_argument('--tolerancia', type=float, default=0.10,
+                        help="Aumento relativo tolerado antes de marcar una regresión")
+    args = parser.parse_args(argv)
+
+    if args.db is None:
+        args.db = os.path.join(
+            tempfile.gettempdir(),
+            f'bench_{args.clientes}_{args.servicios}_{args.seed}.db'
+        )
+    args.db = os.path.abspath(args.db)
+    if args.output:
+        args.output = os.path.abspath(args.output)
+
+    preparar_base(args.db, args.clientes, args.servicios, args.seed)
+    app = QApplication(sys.argv[:1])
+    resultados = {
+        'meta': dict(metadatos(args), qpa=app.platformName(), filas_tabla=args.filas_tabla),
+        'escenarios': ejecutar(app, args.repeticiones, args.filas_tabla)
+    }
+
+    texto = json.dumps(resultados, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as archivo:
+            archivo.write(texto + '\n')
+    else:
+        print(texto)
+
+    if args.baseline:
+        from benchmarks.comparar import advertencias, comparar, formatear
+
+        with open(args.baseline, encoding='utf-8') as archivo:
+            base = json.load(archivo)
+        for advertencia in advertencias(base, resultados):
+            print(f"Advertencia: distinto {advertencia}", file=sys.stderr)
+        diferencias = comparar(base, resultados, args.tolerancia)
+        print(formatear(diferencias), file=sys.stderr)
+        return 1 if any(d['regresion'] for d in diferencias) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+"""
+Benchmark de memoria por fila de los modelos Cliente y Servicio.
+
+Compara la representación anterior (instancias con __dict__ construidas con
+from_dict(dict(row)) y fechas convertidas al cargar) con la actual
+(__slots__, from_row y fechas perezosas).
+
+Uso:
+    python -m benchmarks.model_memory [--rows 100000]
+"""
+import argparse
+import json
+import sqlite3
+import tracemalloc
+from datetime import date
+from typing import Any, Callable, Dict, List
+
+from models.cliente import Cliente
+from models.servicio import Servicio
+
+
+class _ClienteAnterior:
+    """Réplica de la representación anterior de Cliente (con __dict__)."""
+
+    def from_dict(self, data: Dict[str, Any]) -> '_ClienteAnterior':
+        self.id = data.get('id')
+        self.nombre = data.get('nombre', '')
+        self.apellido = data.get('apellido', '')
+        self.dni = data.get('dni', '')
+        self.telefono = data.get('telefono', '')
+        self.baja = data.get('baja', False)
+        return self
+
+
+class _ServicioAnterior:
+    """Réplica de la representación anterior de Servicio (con __dict__)."""
+
+    def from_dict(self, data: Dict[str, Any]) -> '_ServicioAnterior':
+        self.id = data.get('id')
+        self.descripcion = data.get('descripcion', '')
+        self.estado = data.get('estado', 'PENDIENTE')
+        self.fecha_ingreso = date.fromisoformat(data['fecha_ingreso'])
+        fecha_estimada = data.get('fecha_estimada')
+        self.fecha_estimada = date.fromisoformat(fecha_estimada) if fecha_estimada else None
+        self.costo = float(data.get('costo', 0.0))
+        self.idCliente = data.get('idCliente')
+        self.baja = data.get('baja', False)
+        return self
+
+
+def _crear_filas(cantidad: int) -> Dict[str, List[sqlite3.Row]]:
+    """Crea una base en memoria y devuelve las filas de cada tabla."""
+    conn = sqlite3.connect(':memory:')
+    conn.row_factory = sqlite3.Row
+    conn.executescript('''
+        CREATE TABLE cliente (id INTEGER PRIMARY KEY, nombre TEXT, apellido TEXT,
+                              dni TEXT, telefono TEXT, baja BOOLEAN DEFAULT 0);
+        CREATE TABLE servicio (id INTEGER PRIMARY KEY, descripcion TEXT, estado TEXT,
+                               fecha_ingreso DATE, fecha_estimada DATE, costo REAL,
+                               idCliente INTEGER, baja BOOLEAN DEFAULT 0);
+    ''')
+    conn.executemany(
+        'INSERT INTO cliente (nombre, apellido, dni, telefono) VALUES (?, ?, ?, ?)',
+        ((f'Nombre{i}', f'Apellido{i}', str(20000000 + i), f'11{40000000 + i}')
+         for i in range(cantidad))
+    )
+    conn.executemany(
+        'INSERT INTO servicio (descripcion, estado, fecha_ingreso, fecha_estimada, '
+        'costo, idCliente) VALUES (?, ?, ?, ?, ?, ?)',
+        ((f'Servicio de prueba número {i}', Servicio.ESTADOS[i % 4],
+          f'2024-{1 + i % 12:02d}-{1 + i % 28:02d}', '2024-12-31', i * 1.5, 1 + i)
+         for i in range(cantidad))
+    )
+    return {
+        'cliente': conn.execute('SELECT * FROM cliente').fetchall(),
+        'servicio': conn.execute('SELECT * FROM servicio').fetchall()
+    }
+
+
+def _medir(filas: List[sqlite3.Row], construir: Callable[[sqlite3.Row], Any]) -> Dict[str, float]:
+    """Mide bytes retenidos y pico de construcción por fila."""
+    tracemalloc.start()
+    objetos = [construir(fila) for fila in filas]
+    actual, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    cantidad = len(objetos)
+    return {
+        'bytes_por_fila': round(actual / cantidad, 1),
+        'pico_bytes_por_fila': round(pico / cantidad, 1)
+    }
+
+
+def run(cantidad: int = 100000) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    Ejecuta el benchmark.
+
+    Args:
+        cantidad: Filas por tabla
+
+    Returns:
+        Dict con las mediciones 'anterior' y 'actual' para cada modelo
+    """
+    filas = _crear_filas(cantidad)
+    return {
+        'cliente': {
+            'anterior': _medir(filas['cliente'],
+                               lambda row: _ClienteAnterior().from_dict(dict(row))),
+            'actual': _medir(filas['cliente'], Cliente.from_row),
+        },
+        'servicio': {
+            'anterior': _medir(filas['servicio'],
+                               lambda row: _ServicioAnterior().from_dict(dict(row))),
+            'actual': _medir(filas['servicio'], Servicio.from_row),
+        },
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=100000, help="Filas por tabla")
+    args = parser.parse_args()
+    print(json.dumps(run(args.rows), indent=2))
@@ -0,0 +1,316 @@
+"""
+Suite de benchmarks de los controladores y la exportación.
+
+Genera (o reutiliza) una base sintética reproducible con benchmarks.datos y
+mide cada escenario sin interfaz gráfica: tiempo de reloj de cada
+repetición, pico de memoria asignada (tracemalloc) y pico de RSS del
+proceso. Por defecto cada escenario corre en un proceso propio para que el
+pico de RSS no arrastre el de los escenarios anteriores.
+
+Uso:
+    python -m benchmarks.suite [--clientes 2000] [--servicios 10000] [--seed 42]
+                               [--output resultados.json] [--baseline base.json]
+
+El resultado JSON se compara con una línea base con benchmarks.comparar
+(o directamente con --baseline).
+"""
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from benchmarks.datos import preparar_base
+from utils.pagination import Pagina
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _escenarios() -> Dict[str, Callable[[], Any]]:
+    """
+    Escenarios disponibles (nombre -> función sin argumentos).
+
+    Los controladores se importan aquí para que la base ya esté configurada.
+    """
+    from controllers.analitica_controller import AnaliticaController
+    from controllers.cliente_controller import ClienteController
+    from controllers.servicio_controller import ServicioController
+    from utils.export import ReportGenerator
+
+    clientes = ClienteController()
+    servicios = ServicioController()
+    analitica = AnaliticaController()
+
+    def cargar_estadisticas():
+        # Mismas consultas que Dashboard._calcular_estadisticas
+        analitica.actualizar_rollups()
+        return (clientes.obtener_estadisticas(), servicios.obtener_estadisticas(),
+                analitica.obtener_tendencia_mensual(12, actualizar=False))
+
+    def export_servicios_csv():
+        datos = [s.to_dict() for s in servicios.obtener_todos_servicios(incluir_bajas=True)]
+        return ReportGenerator().export_servicios_csv(datos)
+
+    def export_servicios_csv_stream():
+        return ReportGenerator().export_servicios_csv_stream(
+            servicios.iterar_servicios_export(incluir_bajas=True)
+        )
+
+    return {
+        'obtener_todos_servicios': servicios.obtener_todos_servicios,
+        'obtener_servicios_con_cliente': servicios.obtener_servicios_con_cliente,
+        'buscar_clientes': lambda: clientes.buscar_clientes('apellido', 'mez'),
+        'buscar_clientes_fulltext': lambda: clientes.buscar_clientes_fulltext('gonz'),
+        'obtener_clientes_paginados': clientes.obtener_clientes_paginados,
+        'cargar_estadisticas': cargar_estadisticas,
+        'export_servicios_csv': export_servicios_csv,
+        'export_servicios_csv_stream': export_servicios_csv_stream,
+    }
+
+
+ESCENARIOS = (
+    'obtener_todos_servicios', 'obtener_servicios_con_cliente', 'buscar_clientes',
+    'buscar_clientes_fulltext', 'obtener_clientes_paginados', 'cargar_estadisticas',
+    'export_servicios_csv', 'export_servicios_csv_stream'
+)
+
+
+def rss_pico_kb() -> Optional[int]:
+    """Pico de memoria residente del proceso en KiB (None si no se puede medir)."""
+    if resource is None:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS informa bytes; Linux, KiB
+    return pico // 1024 if sys.platform == 'darwin' else pico
+
+
+def resumen_tiempos(tiempos: List[float]) -> Dict[str, float]:
+    """
+    Estadísticas de una serie de duraciones.
+
+    Args:
+        tiempos: Duraciones en milisegundos
+
+    Returns:
+        Dict[str, float]: 'min', 'mediana', 'media' y 'max'
+    """
+    return {
+        'min': round(min(tiempos), 3),
+        'mediana': round(statistics.median(tiempos), 3),
+        'media': round(statistics.fmean(tiempos), 3),
+        'max': round(max(tiempos), 3),
+    }
+
+
+def limpiar_caches() -> None:
+    """Vacía las cachés de modelos para que cada repetición lea de la base."""
+    from controllers.cliente_controller import ClienteController
+    from controllers.servicio_controller import ServicioController
+
+    ClienteController.limpiar_cache()
+    ServicioController.limpiar_cache()
+
+
+def _tamanio(resultado: Any) -> Optional[int]:
+    """Cantidad de elementos del resultado, si tiene sentido."""
+    if isinstance(resultado, Pagina):
+        return len(resultado.items)
+    if isinstance(resultado, (list, tuple)):
+        return len(resultado)
+    return None
+
+
+def repeticiones_validas(texto: str) -> int:
+    """
+    Tipo de argparse para --repeticiones: un entero mayor o igual a 1.
+
+    Args:
+        texto: Valor recibido en la línea de comandos
+
+    Returns:
+        int: Cantidad de repeticiones
+    """
+    try:
+        repeticiones = int(texto)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"no es un entero: {texto!r}")
+    if repeticiones < 1:
+        raise argparse.ArgumentTypeError("debe haber al menos una repetición")
+    return repeticiones
+
+
+def medir(funcion: Callable[[], Any], repeticiones: int = 5) -> Dict[str, Any]:
+    """
+    Mide una función: una ejecución de calentamiento, las repeticiones
+    cronometradas y una ejecución más bajo tracemalloc.
+
+    Args:
+        funcion: Escenario a medir
+        repeticiones: Ejecuciones cronometradas
+
+    Returns:
+        Dict[str, Any]: 'tiempo_ms' (min, mediana, media, max),
+        'asignado_pico_kb', 'retenido_kb', 'rss_pico_kb' y 'elementos'
+    """
+    limpiar_caches()
+    resultado = funcion()
+
+    tiempos: List[float] = []
+    for _ in range(repeticiones):
+        limpiar_caches()
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+
+    limpiar_caches()
+    tracemalloc.start()
+    retenido = funcion()
+    actual, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del retenido
+
+    return {
+        'tiempo_ms': resumen_tiempos(tiempos),
+        'asignado_pico_kb': round(pico / 1024, 1),
+        'retenido_kb': round(actual / 1024, 1),
+        'rss_pico_kb': rss_pico_kb(),
+        'elementos': _tamanio(resultado),
+    }
+
+
+def ejecutar_en_proceso(nombres: List[str], repeticiones: int) -> Dict[str, Any]:
+    """
+    Ejecuta los escenarios en el proceso actual (la base ya configurada).
+
+    Args:
+        nombres: Escenarios a ejecutar
+        repeticiones: Ejecuciones cronometradas por escenario
+
+    Returns:
+        Dict[str, Any]: Mediciones por escenario
+    """
+    escenarios = _escenarios()
+    return {nombre: medir(escenarios[nombre], repeticiones) for nombre in nombres}
+
+
+def _ejecutar_aislado(nombre: str, args: argparse.Namespace) -> Dict[str, Any]:
+    """Ejecuta un escenario en un proceso nuevo y devuelve su medición."""
+    comando = [
+        sys.executable, '-m', 'benchmarks.suite', '--solo', nombre,
+        '--clientes', str(args.clientes), '--servicios', str(args.servicios),
+        '--seed', str(args.seed), '--db', args.db, '--repeticiones', str(args.repeticiones)
+    ]
+    salida = subprocess.run(comando, check=True, capture_output=True, text=True,
+                            cwd=RAIZ)
+    return json.loads(salida.stdout)[nombre]
+
+
+def metadatos(args: argparse.Namespace) -> Dict[str, Any]:
+    """Datos del entorno y de la carga para acompañar los resultados."""
+    return {
+        'fecha': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'sqlite': sqlite3.sqlite_version,
+        'plataforma': platform.platform(),
+        'clientes': args.clientes,
+        'servicios': args.servicios,
+        'semilla': args.seed,
+        'repeticiones': args.repeticiones,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Punto de entrada de la línea de comandos.
+
+    Returns:
+        int: 0 si no hay regresiones respecto de --baseline, 1 si las hay
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--clientes', type=int, default=2000, help="Cantidad de clientes")
+    parser.add_argument('--servicios', type=int, default=10000, help="Cantidad de servicios")
+    parser.add_argument('--seed', type=int, default=42, help="Semilla de los datos")
+    parser.add_argument('--repeticiones', type=repeticiones_validas, default=5,
+                        help="Ejecuciones cronometradas por escenario")
+    parser.add_argument('--escenarios', nargs='+', choices=ESCENARIOS, default=list(ESCENARIOS),
+                        help="Escenarios a ejecutar (por defecto todos)")
+    parser.add_argument('--db', help="Base de datos (por defecto una por tamaño y semilla "
+                                     "en el directorio temporal, reutilizada entre ejecuciones)")
+    parser.add_argument('--output', help="Archivo JSON de resultados")
+    parser.add_argument('--baseline', help="Resultados de referencia con los que comparar")
+    parser.add_argument('--tolerancia', type=float, default=0.10,
+                        help="Aumento relativo tolerado antes de marcar una regresión")
+    parser.add_argument('--en-proceso', action='store_true',
+                        help="Ejecutar todos los escenarios en este proceso")
+    parser.add_argument('--solo', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.db is None:
+        args.db = os.path.join(
+            tempfile.gettempdir(),
+            f'bench_{args.clientes}_{args.servicios}_{args.seed}.db'
+        )
+    # Rutas absolutas: los escenarios se ejecutan en un directorio temporal
+    args.db = os.path.abspath(args.db)
+    if args.output:
+        args.output = os.path.abspath(args.output)
+    if args.baseline:
+        args.baseline = os.path.abspath(args.baseline)
+
+    if args.solo:
+        preparar_base(args.db, args.clientes, args.servicios, args.seed)
+        # Los CSV exportados quedan fuera del árbol de trabajo
+        os.chdir(tempfile.mkdtemp(prefix='bench_'))
+        print(json.dumps(ejecutar_en_proceso([args.solo], args.repeticiones)))
+        return 0
+
+    inicio = time.perf_counter()
+    if preparar_base(args.db, args.clientes, args.servicios, args.seed):
+        print(f"Base generada en {args.db} ({time.perf_counter() - inicio:.1f} s)",
+              file=sys.stderr)
+
+    if args.en_proceso:
+        os.chdir(tempfile.mkdtemp(prefix='bench_'))
+        escenarios = ejecutar_en_proceso(args.escenarios, args.repeticiones)
+    else:
+        escenarios = {}
+        for nombre in args.escenarios:
+            print(f"Ejecutando {nombre}...", file=sys.stderr)
+            escenarios[nombre] = _ejecutar_aislado(nombre, args)
+
+    resultados = {'meta': metadatos(args), 'escenarios': escenarios}
+    texto = json.dumps(resultados, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as archivo:
+            archivo.write(texto + '\n')
+    else:
+        print(texto)
+
+    if args.baseline:
+        from benchmarks.comparar import advertencias, comparar, formatear
+
+        with open(args.baseline, encoding='utf-8') as archivo:
+            base = json.load(archivo)
+        for advertencia in advertencias(base, resultados):
+            print(f"Advertencia: distinto {advertencia}", file=sys.stderr)
+        diferencias = comparar(base, resultados, args.tolerancia)
+        print(formatear(diferencias), file=sys.stderr)
+        return 1 if any(d['regresion'] for d in diferencias) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,6 +7,30 @@ DB_PATH = os.getenv('DB_PATH', 'data/database.db')
 DB_DIR = os.path.dirname(DB_PATH)
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
 
+# Archivos de log: uno por día, rotado además por tamaño
+LOG_DIR = os.getenv('LOG_DIR', 'logs')
+LOG_MAX_BYTES = int(os.getenv('LOG_MAX_BYTES', str(10 * 1024 * 1024)))
+LOG_BACKUP_COUNT = int(os.getenv('LOG_BACKUP_COUNT', '5'))
+LOG_RETENTION_DAYS = int(os.getenv('LOG_RETENTION_DAYS', '30'))
+
+# Ajustes de conexión SQLite
+DB_BUSY_TIMEOUT_MS = int(os.getenv('DB_BUSY_TIMEOUT_MS', '5000'))
+DB_CACHE_SIZE_KB = int(os.getenv('DB_CACHE_SIZE_KB', '65536'))
+DB_MMAP_SIZE = int(os.getenv('DB_MMAP_SIZE', str(256 * 1024 * 1024)))
+
+# Perfilado de consultas SQL (DB_PROFILE=1): histogramas por sentencia y
+# registro de las que superan DB_SLOW_QUERY_MS con su plan de ejecución
+DB_PROFILE = os.getenv('DB_PROFILE', '0') == '1'
+DB_SLOW_QUERY_MS = float(os.getenv('DB_SLOW_QUERY_MS', '100'))
+DB_PROFILE_SAMPLES = int(os.getenv('DB_PROFILE_SAMPLES', '1000'))
+
+# Caché de objetos del modelo en los controladores
+CACHE_MAX_SIZE = int(os.getenv('CACHE_MAX_SIZE', '1000'))
+CACHE_TTL_SECONDS = float(os.getenv('CACHE_TTL_SECONDS', '300'))
+
+# Intervalo de verificación de cambios del dashboard (0 desactiva la actualización automática)
+DASHBOARD_REFRESH_MS = int(os.getenv('DASHBOARD_REFRESH_MS', '5000'))
+
 APP_NAME = "Sistema de Gestión - Clientes y Servicios"
 APP_WIDTH = 1200
 APP_HEIGHT = 700
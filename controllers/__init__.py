@@ -1,5 +1,6 @@
 # controllers/__init__.py
 from .cliente_controller import ClienteController
 from .servicio_controller import ServicioController
+from .analitica_controller import AnaliticaController
 
-__all__ = ['ClienteController', 'ServicioController']
\ No newline at end of file
+__all__ = ['ClienteController', 'ServicioController', 'AnaliticaController']
\ No newline at end of file
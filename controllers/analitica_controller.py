@@ -0,0 +1,256 @@
+"""
+Controlador de analítica de servicios sobre rollups diarios.
+"""
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional
+
+from models.servicio import Servicio
+from utils.database import DatabaseConnection
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class AnaliticaController:
+    """
+    Controlador de tendencias de servicios.
+
+    Las consultas de rango leen la tabla rollup_servicio_diario (una fila
+    por día y estado con cantidad, costo y demora estimada de los servicios
+    activos) en lugar de recorrer la tabla servicio. Los triggers de
+    servicio registran en rollup_pendiente los días modificados, y
+    actualizar_rollups() recalcula solo los días registrados después de la
+    marca de agua guardada en rollup_marca.
+    """
+
+    AGRUPACIONES = ('dia', 'mes')
+    MARCA = 'servicio_diario'
+    # Días por sentencia al recalcular (límite de parámetros de SQLite)
+    LOTE_DIAS = 500
+
+    def __init__(self) -> None:
+        """Inicializa el controlador con la conexión a la base de datos."""
+        self.db = DatabaseConnection()
+
+    def actualizar_rollups(self) -> int:
+        """
+        Recalcula los rollups de los días modificados desde la última vez.
+
+        Si no hay días pendientes no se abre la transacción de escritura.
+
+        Returns:
+            int: Cantidad de días recalculados (-1 si hubo un error)
+        """
+        try:
+            if not self._hay_pendientes():
+                return 0
+
+            with self.db.unit_of_work() as conn:
+                dias = self._aplicar_pendientes(conn)
+
+            logger.info("Rollups diarios actualizados: %s días", dias)
+            return dias
+
+        except Exception as e:
+            logger.error("Error al actualizar rollups: %s", e)
+            return -1
+
+    def _hay_pendientes(self) -> bool:
+        """Indica si hay días registrados después de la marca de agua."""
+        with self.db.connection() as conn:
+            return bool(conn.execute('''
+                SELECT EXISTS (
+                    SELECT 1 FROM rollup_pendiente
+                    WHERE seq > IFNULL((SELECT seq FROM rollup_marca WHERE nombre = ?), 0)
+                )
+            ''', (self.MARCA,)).fetchone()[0])
+
+    def _aplicar_pendientes(self, conn) -> int:
+        """
+        Recalcula los días pendientes y avanza la marca de agua.
+
+        Debe llamarse dentro de una unidad de trabajo; los errores se
+        propagan para que la unidad los revierta.
+
+        Args:
+            conn: Conexión de la unidad de trabajo
+
+        Returns:
+            int: Cantidad de días recalculados
+        """
+        # Se vuelve a leer la marca: otro proceso pudo aplicar los pendientes
+        marca = conn.execute(
+            'SELECT seq FROM rollup_marca WHERE nombre = ?', (self.MARCA,)
+        ).fetchone()
+        desde_seq = marca['seq'] if marca else 0
+
+        hasta_seq = conn.execute(
+            'SELECT MAX(seq) FROM rollup_pendiente WHERE seq > ?', (desde_seq,)
+        ).fetchone()[0]
+        if hasta_seq is None:
+            return 0
+
+        dias = [row['dia'] for row in conn.execute('''
+            SELECT DISTINCT dia FROM rollup_pendiente
+            WHERE seq > ? AND seq <= ?
+        ''', (desde_seq, hasta_seq))]
+
+        for inicio in range(0, len(dias), self.LOTE_DIAS):
+            self._recalcular_dias(conn, dias[inicio:inicio + self.LOTE_DIAS])
+
+        conn.execute('''
+            INSERT INTO rollup_marca (nombre, seq) VALUES (?, ?)
+            ON CONFLICT (nombre) DO UPDATE SET seq = excluded.seq
+        ''', (self.MARCA, hasta_seq))
+        conn.execute('DELETE FROM rollup_pendiente WHERE seq <= ?', (hasta_seq,))
+        return len(dias)
+
+    @staticmethod
+    def _recalcular_dias(conn, dias: List[str]) -> None:
+        """Reemplaza los rollups de los días indicados con datos de servicio."""
+        marcadores = ', '.join('?' * len(dias))
+        conn.execute(f'DELETE FROM rollup_servicio_diario WHERE dia IN ({marcadores})', dias)
+        conn.execute(f'''
+            INSERT INTO rollup_servicio_diario
+                (dia, estado, cantidad, costo_total, con_estimada, dias_estimados)
+            SELECT fecha_ingreso, IFNULL(estado, ''), COUNT(*), IFNULL(SUM(costo), 0),
+                   COUNT(fecha_estimada),
+                   IFNULL(SUM(julianday(fecha_estimada) - julianday(fecha_ingreso)), 0)
+            FROM servicio
+            WHERE baja = 0 AND fecha_ingreso IN ({marcadores})
+            GROUP BY fecha_ingreso, estado
+        ''', dias)
+
+    def reconstruir_rollups(self) -> int:
+        """
+        Marca todos los días como pendientes y recalcula los rollups.
+
+        Solo hace falta para reparaciones; el uso normal es incremental.
+
+        Returns:
+            int: Cantidad de días recalculados (-1 si hubo un error)
+        """
+        try:
+            with self.db.unit_of_work() as conn:
+                conn.execute('DELETE FROM rollup_servicio_diario')
+                conn.execute('''
+                    INSERT INTO rollup_pendiente (dia)
+                    SELECT DISTINCT fecha_ingreso FROM servicio
+                    WHERE fecha_ingreso IS NOT NULL
+                ''')
+                dias = self._aplicar_pendientes(conn)
+
+            logger.info("Rollups diarios reconstruidos: %s días", dias)
+            return dias
+
+        except Exception as e:
+            logger.error("Error al reconstruir rollups: %s", e)
+            return -1
+
+    @staticmethod
+    def _periodos(desde: date, hasta: date, agrupacion: str) -> List[str]:
+        """Genera las claves de todos los períodos del rango (incluso vacíos)."""
+        periodos = []
+        if agrupacion == 'dia':
+            actual = desde
+            while actual <= hasta:
+                periodos.append(actual.isoformat())
+                actual += timedelta(days=1)
+        else:
+            anio, mes = desde.year, desde.month
+            while (anio, mes) <= (hasta.year, hasta.month):
+                periodos.append(f'{anio:04d}-{mes:02d}')
+                anio, mes = (anio + 1, 1) if mes == 12 else (anio, mes + 1)
+        return periodos
+
+    def obtener_tendencia(self, desde: date, hasta: date, agrupacion: str = 'mes',
+                          actualizar: bool = True) -> List[Dict[str, Any]]:
+        """
+        Obtiene la serie de servicios por período a partir de los rollups.
+
+        Args:
+            desde: Primer día del rango (inclusive)
+            hasta: Último día del rango (inclusive)
+            agrupacion: 'dia' o 'mes'
+            actualizar: Si se actualizan antes los rollups pendientes
+
+        Returns:
+            List[Dict[str, Any]]: Un elemento por período con 'periodo',
+            'cantidad', 'costo_total', 'demora_promedio' (días entre ingreso y
+            fecha estimada, None si no hay datos) y 'por_estado' (cantidad y
+            costo por estado)
+        """
+        if agrupacion not in self.AGRUPACIONES or desde > hasta:
+            logger.warning("Rango de tendencia inválido: %s - %s (%s)", desde, hasta, agrupacion)
+            return []
+
+        if actualizar:
+            self.actualizar_rollups()
+
+        serie: Dict[str, Dict[str, Any]] = {
+            periodo: {
+                'periodo': periodo,
+                'cantidad': 0,
+                'costo_total': 0.0,
+                'demora_promedio': None,
+                'por_estado': {estado: {'cantidad': 0, 'costo': 0.0}
+                               for estado in Servicio.ESTADOS}
+            }
+            for periodo in self._periodos(desde, hasta, agrupacion)
+        }
+        longitud = 10 if agrupacion == 'dia' else 7
+
+        try:
+            with self.db.connection() as conn:
+                cursor = conn.execute(f'''
+                    SELECT substr(dia, 1, {longitud}) AS periodo, estado,
+                           SUM(cantidad) AS cantidad, SUM(costo_total) AS costo,
+                           SUM(con_estimada) AS con_estimada,
+                           SUM(dias_estimados) AS dias_estimados
+                    FROM rollup_servicio_diario
+                    WHERE dia BETWEEN ? AND ?
+                    GROUP BY periodo, estado
+                ''', (desde.isoformat(), hasta.isoformat()))
+
+                demoras: Dict[str, List[float]] = {}
+                for row in cursor.fetchall():
+                    punto = serie.get(row['periodo'])
+                    if punto is None:
+                        continue
+                    punto['cantidad'] += row['cantidad']
+                    punto['costo_total'] += row['costo']
+                    if row['estado'] in punto['por_estado']:
+                        punto['por_estado'][row['estado']] = {
+                            'cantidad': row['cantidad'], 'costo': row['costo']
+                        }
+                    acumulado = demoras.setdefault(row['periodo'], [0, 0.0])
+                    acumulado[0] += row['con_estimada']
+                    acumulado[1] += row['dias_estimados']
+
+                for periodo, (cantidad, dias) in demoras.items():
+                    if cantidad:
+                        serie[periodo]['demora_promedio'] = dias / cantidad
+
+                return list(serie.values())
+
+        except Exception as e:
+            logger.error("Error al obtener tendencia de servicios: %s", e)
+            return []
+
+    def obtener_tendencia_mensual(self, meses: int = 12, hasta: Optional[date] = None,
+                                  actualizar: bool = True) -> List[Dict[str, Any]]:
+        """
+        Obtiene la tendencia de los últimos meses, incluido el actual.
+
+        Args:
+            meses: Cantidad de meses
+            hasta: Último día del rango (por defecto hoy)
+            actualizar: Si se actualizan antes los rollups pendientes
+
+        Returns:
+            List[Dict[str, Any]]: Serie mensual (ver obtener_tendencia)
+        """
+        hasta = hasta or date.today()
+        indice = hasta.year * 12 + hasta.month - 1 - (meses - 1)
+        desde = date(indice // 12, indice % 12 + 1, 1)
+        return self.obtener_tendencia(desde, hasta, 'mes', actualizar)
@@ -1,13 +1,32 @@
 """
 Controlador para manejar las operaciones CRUD de clientes.
 """
-from typing import List, Optional, Dict, Any
+import re
+import copy
+import sqlite3
+from functools import partial
+from typing import List, Optional, Dict, Any, Iterator, Sequence, Tuple, Union
 from models.cliente import Cliente
 from utils.database import DatabaseConnection
+from utils.cache import ModelCache
+from utils.pagination import Pagina, DIRECCIONES, build_keyset_clause, next_cursor
+from utils.projection import select_columns
 from utils.logger import setup_logger
+import config
 
 logger = setup_logger(__name__)
 
+_TOKEN_BUSQUEDA = re.compile(r'\w+', re.UNICODE)
+# Texto con forma de DNI o teléfono: dígitos con puntos, espacios, guiones o paréntesis
+_BUSQUEDA_NUMERICA = re.compile(r'[\d.\s\-()]*\d[\d.\s\-()]*')
+_SEPARADORES_NUMERO = re.compile(r'[.\s\-()]')
+# Columnas numéricas sin los separadores que puede haber guardado el usuario
+_COLUMNAS_NUMERICAS = {
+    'dni': "REPLACE(REPLACE(dni, '.', ''), ' ', '')",
+    'telefono': "REPLACE(REPLACE(REPLACE(REPLACE("
+                "IFNULL(telefono, ''), ' ', ''), '-', ''), '(', ''), ')', '')",
+}
+
 
 class ClienteController:
     """
@@ -15,6 +34,17 @@ class ClienteController:
     Actúa como intermediario entre las vistas y los modelos.
     """
     
+    # Identity map compartido por todas las instancias del controlador
+    _cache = ModelCache(config.CACHE_MAX_SIZE, config.CACHE_TTL_SECONDS)
+    
+    ORDENES_PAGINACION = ('id',)
+    CONFLICTOS_DNI = ('skip', 'upsert', 'fail')
+    COLUMNAS_FULLTEXT = ('nombre', 'apellido', 'dni', 'telefono')
+    # Valores por sentencia en las consultas IN (...) (límite de parámetros de SQLite)
+    LOTE_IDS = 500
+    # Filas a partir de las cuales una inserción masiva indexa el texto al final
+    MIN_FILAS_FTS_DIFERIDO = 500
+    
     def __init__(self) -> None:
         """Inicializa el controlador con la conexión a la base de datos."""
         self.db = DatabaseConnection()
@@ -30,30 +60,154 @@ class ClienteController:
             Cliente: Instancia del cliente creado o None si hay error
         """
         if not Cliente.validate_data(cliente_data):
-            logger.warning(f"Datos de cliente inválidos: {cliente_data}")
+            logger.warning("Datos de cliente inválidos: %s", cliente_data)
             return None
         
         cliente = Cliente().from_dict(cliente_data)
         
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute('''
+                    INSERT INTO cliente (nombre, apellido, dni, telefono, baja)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', (cliente.nombre, cliente.apellido, cliente.dni, 
+                      cliente.telefono, cliente.baja))
+                
+                cliente.id = cursor.lastrowid
+                self.db.commit(conn)
+                self.db.on_commit(partial(self._cache.invalidate, cliente.id))
+                
+                logger.info("Cliente creado: ID=%s, DNI=%s", cliente.id, cliente.dni)
+                return cliente
+                
+        except Exception as e:
+            logger.error("Error al crear cliente: %s", e)
+            return None
+    
+    def insertar_clientes_lote(self, clientes_data: List[Dict[str, Any]],
+                               on_conflict: str = 'skip') -> Dict[str, int]:
+        """
+        Inserta un lote de clientes ya validados en una única transacción.
+        
+        Args:
+            clientes_data: Lista de diccionarios con datos de clientes
+            on_conflict: Qué hacer si el DNI ya existe: 'skip' lo omite,
+                'upsert' actualiza el cliente existente y 'fail' aborta el lote
             
-            cursor.execute('''
-                INSERT INTO cliente (nombre, apellido, dni, telefono, baja)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (cliente.nombre, cliente.apellido, cliente.dni, 
-                  cliente.telefono, cliente.baja))
+        Returns:
+            Dict[str, int]: Claves 'insertados', 'actualizados' y 'omitidos'
             
-            cliente.id = cursor.lastrowid
-            conn.commit()
+        Raises:
+            ValueError: Si on_conflict no es válido
+            sqlite3.IntegrityError: Si on_conflict es 'fail' y hay un DNI repetido
+                (el lote completo se revierte)
+        """
+        if on_conflict not in self.CONFLICTOS_DNI:
+            raise ValueError(f"Modo de conflicto inválido: {on_conflict}")
+        
+        resultado = {'insertados': 0, 'actualizados': 0, 'omitidos': 0}
+        if not clientes_data:
+            return resultado
+        
+        filas = [(c['nombre'], c['apellido'], c['dni'], c.get('telefono', ''),
+                  c.get('baja', False)) for c in clientes_data]
+        
+        sentencia = '''
+            INSERT INTO cliente (nombre, apellido, dni, telefono, baja)
+            VALUES (?, ?, ?, ?, ?)
+        '''
+        if on_conflict == 'skip':
+            sentencia += ' ON CONFLICT (dni) DO NOTHING'
+        elif on_conflict == 'upsert':
+            sentencia += ''' ON CONFLICT (dni) DO UPDATE SET
+                nombre = excluded.nombre, apellido = excluded.apellido,
+                telefono = excluded.telefono, baja = excluded.baja'''
+        
+        with self.db.unit_of_work() as conn:
+            cursor = conn.cursor()
             
-            logger.info(f"Cliente creado: ID={cliente.id}, DNI={cliente.dni}")
-            return cliente
+            # DNIs ya presentes, para informar insertados/actualizados/omitidos
+            dnis = list({fila[2] for fila in filas})
+            existentes = set()
+            for inicio in range(0, len(dnis), self.LOTE_IDS):
+                bloque = dnis[inicio:inicio + self.LOTE_IDS]
+                marcadores = ', '.join('?' * len(bloque))
+                cursor.execute(f'SELECT dni FROM cliente WHERE dni IN ({marcadores})', bloque)
+                existentes.update(row['dni'] for row in cursor.fetchall())
+            
+            vistos = set()
+            for fila in filas:
+                dni = fila[2]
+                if dni in existentes or dni in vistos:
+                    clave = 'actualizados' if on_conflict == 'upsert' else 'omitidos'
+                    resultado[clave] += 1
+                else:
+                    resultado['insertados'] += 1
+                vistos.add(dni)
+            
+            if on_conflict == 'upsert' or len(filas) < self.MIN_FILAS_FTS_DIFERIDO:
+                cursor.executemany(sentencia, filas)
+            else:
+                self._insertar_con_fts_diferido(cursor, sentencia, filas)
             
-        except Exception as e:
-            logger.error(f"Error al crear cliente: {e}")
-            return None
+            if resultado['actualizados']:
+                self.db.on_commit(self._cache.clear)
+        
+        logger.info("Lote de clientes importado: %s", resultado)
+        return resultado
+    
+    @staticmethod
+    def _insertar_con_fts_diferido(cursor, sentencia: str, filas: List[tuple]) -> None:
+        """
+        Inserta filas nuevas indexándolas en cliente_fts con una sola sentencia.
+        
+        El trigger de inserción del índice de texto completo cuesta una
+        escritura FTS por fila; en lotes grandes es mucho más rápido pausarlo
+        (fila en cliente_fts_pausa, ver la migración 7) e indexar todas las
+        filas nuevas juntas. La pausa se agrega y se quita en la misma
+        transacción (o savepoint de la unidad de trabajo), así que otras
+        conexiones nunca la ven y un error la revierte junto con los datos.
+        Solo sirve para INSERT sin actualización (los UPDATE usan otro trigger).
+        """
+        cursor.execute('SELECT COALESCE(MAX(id), 0) FROM cliente')
+        ultimo_id = cursor.fetchone()[0]
+        
+        cursor.execute('INSERT INTO cliente_fts_pausa (activa) VALUES (1)')
+        try:
+            cursor.executemany(sentencia, filas)
+        finally:
+            cursor.execute('DELETE FROM cliente_fts_pausa')
+        cursor.execute('''
+            INSERT INTO cliente_fts (rowid, nombre, apellido, dni, telefono)
+            SELECT id, nombre, apellido, dni, telefono FROM cliente WHERE id > ?
+        ''', (ultimo_id,))
+    
+    def obtener_ids_existentes(self, ids: List[int]) -> set:
+        """
+        Filtra los IDs de cliente que existen en la base de datos.
+        
+        Args:
+            ids: IDs de cliente a verificar
+            
+        Returns:
+            set: Subconjunto de IDs que existen
+        """
+        if not ids:
+            return set()
+        
+        unicos = list(set(ids))
+        existentes = set()
+        with self.db.connection() as conn:
+            for inicio in range(0, len(unicos), self.LOTE_IDS):
+                bloque = unicos[inicio:inicio + self.LOTE_IDS]
+                marcadores = ', '.join('?' * len(bloque))
+                cursor = conn.execute(
+                    f'SELECT id FROM cliente WHERE id IN ({marcadores})', bloque
+                )
+                existentes.update(row['id'] for row in cursor.fetchall())
+        return existentes
     
     def obtener_cliente(self, cliente_id: int) -> Optional[Cliente]:
         """
@@ -63,58 +217,197 @@ class ClienteController:
             cliente_id: ID del cliente a obtener
             
         Returns:
-            Cliente: Instancia del cliente o None si no se encuentra
+            Cliente: Instancia del cliente (nunca la guardada en caché) o None si
+                no se encuentra
         """
+        cliente = self._cache.get(cliente_id)
+        if cliente is not None:
+            # Copia: quien la recibe puede modificarla (p. ej. los diálogos de edición)
+            return copy.copy(cliente)
+        
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT * FROM cliente WHERE id = ? AND baja = 0
-            ''', (cliente_id,))
-            
-            row = cursor.fetchone()
-            
-            if row:
-                cliente = Cliente()
-                cliente.from_dict(dict(row))
-                return cliente
-            
-            return None
-            
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute('''
+                    SELECT * FROM cliente WHERE id = ? AND baja = 0
+                ''', (cliente_id,))
+                
+                row = cursor.fetchone()
+                
+                if row:
+                    cliente = Cliente.from_row(row)
+                    if not self.db.in_unit_of_work():
+                        # Lo leído dentro de una unidad puede revertirse
+                        self._cache.put(cliente_id, copy.copy(cliente))
+                    return cliente
+                
+                return None
+                
         except Exception as e:
-            logger.error(f"Error al obtener cliente: {e}")
+            logger.error("Error al obtener cliente: %s", e)
             return None
     
-    def obtener_todos_clientes(self, incluir_bajas: bool = False) -> List[Cliente]:
+    def obtener_todos_clientes(self, incluir_bajas: bool = False,
+                               fields: Optional[Sequence[str]] = None
+                               ) -> List[Union[Cliente, sqlite3.Row]]:
         """
         Obtiene todos los clientes de la base de datos.
         
         Args:
             incluir_bajas: Si se incluyen clientes dados de baja
+            fields: Columnas a leer (ver Cliente.COLUMNAS). Si se indican, se
+                devuelven filas livianas (sqlite3.Row) en lugar de objetos Cliente
             
         Returns:
-            List[Cliente]: Lista de clientes
+            List: Lista de clientes (Cliente o sqlite3.Row según fields)
+            
+        Raises:
+            ValueError: Si fields incluye una columna que no existe
         """
+        columnas = select_columns(fields, Cliente.COLUMNAS)
+        
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                
+                if incluir_bajas:
+                    cursor.execute(f'SELECT {columnas} FROM cliente')
+                else:
+                    cursor.execute(f'SELECT {columnas} FROM cliente WHERE baja = 0')
+                
+                return self._resultados(cursor.fetchall(), fields)
+                
+        except Exception as e:
+            logger.error("Error al obtener clientes: %s", e)
+            return []
+    
+    def obtener_clientes_paginados(self, page_size: int = 100,
+                                   after_key: Any = None,
+                                   orden: str = 'id',
+                                   direccion: str = 'ASC',
+                                   incluir_bajas: bool = False,
+                                   fields: Optional[Sequence[str]] = None) -> Pagina:
+        """
+        Obtiene una página de clientes usando paginación por clave.
+        
+        Args:
+            page_size: Cantidad máxima de clientes por página
+            after_key: Cursor devuelto por la página anterior (None para la primera)
+            orden: Columna de ordenamiento (ver ORDENES_PAGINACION)
+            direccion: 'ASC' o 'DESC'
+            incluir_bajas: Si se incluyen clientes dados de baja
+            fields: Columnas a leer (sqlite3.Row en lugar de Cliente); se
+                agregan siempre las columnas de ordenamiento
             
-            if incluir_bajas:
-                cursor.execute('SELECT * FROM cliente')
-            else:
-                cursor.execute('SELECT * FROM cliente WHERE baja = 0')
+        Returns:
+            Pagina: Clientes de la página y cursor de la siguiente
             
-            clientes = []
-            for row in cursor.fetchall():
-                cliente = Cliente()
-                cliente.from_dict(dict(row))
-                clientes.append(cliente)
+        Raises:
+            ValueError: Si fields incluye una columna que no existe
+        """
+        direccion = direccion.upper()
+        if orden not in self.ORDENES_PAGINACION or direccion not in DIRECCIONES:
+            logger.warning("Orden de paginación inválido: %s %s", orden, direccion)
+            return Pagina([], None, page_size)
+        
+        columnas = select_columns(fields, Cliente.COLUMNAS, ('id', orden))
+        
+        try:
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                
+                condicion, order_by, params = build_keyset_clause(orden, direccion, after_key)
+                condiciones = [] if incluir_bajas else ['baja = 0']
+                if condicion:
+                    condiciones.append(condicion)
+                where = f"WHERE {' AND '.join(condiciones)}" if condiciones else ''
+                
+                cursor.execute(f'''
+                    SELECT {columnas} FROM cliente {where}
+                    ORDER BY {order_by} LIMIT ?
+                ''', params + (page_size + 1,))
+                
+                rows = cursor.fetchall()
+                cursor_siguiente = next_cursor(rows, orden, page_size)
+                
+                return Pagina(self._resultados(rows, fields), cursor_siguiente, page_size)
+                
+        except Exception as e:
+            logger.error("Error al obtener página de clientes: %s", e)
+            return Pagina([], None, page_size)
+    
+    def iterar_clientes_export(self, incluir_bajas: bool = True,
+                               batch_size: int = 5000) -> Iterator[List[Any]]:
+        """
+        Recorre los clientes en lotes listos para escribir en CSV.
+        
+        Las filas se leen con fetchmany y se formatean en SQL en el orden de
+        las columnas exportadas, sin construir objetos Cliente.
+        
+        Args:
+            incluir_bajas: Si se incluyen clientes dados de baja
+            batch_size: Filas por lote
             
-            return clientes
+        Yields:
+            List: Lote de filas (nombre, apellido, dni, teléfono, estado)
+        """
+        where = '' if incluir_bajas else 'WHERE baja = 0'
+        with self.db.connection() as conn:
+            cursor = conn.execute(f'''
+                SELECT nombre, apellido, dni, COALESCE(telefono, ''),
+                       CASE WHEN baja THEN 'Inactivo' ELSE 'Activo' END
+                FROM cliente {where}
+                ORDER BY id
+            ''')
             
+            while True:
+                lote = cursor.fetchmany(batch_size)
+                if not lote:
+                    break
+                yield lote
+    
+    def auditar_clientes(self, incluir_bajas: bool = True,
+                         batch_size: int = 10000) -> List[Tuple[int, str]]:
+        """
+        Revisa los clientes guardados con el criterio de Cliente.validate_data.
+        
+        Cada lote leído con fetchmany se valida por columnas con
+        Cliente.validar_columnas, sin construir diccionarios ni objetos.
+        
+        Args:
+            incluir_bajas: Si se revisan también los clientes dados de baja
+            batch_size: Filas por lote
+        
+        Returns:
+            List[Tuple[int, str]]: (id, motivo) de cada cliente inválido
+        """
+        where = '' if incluir_bajas else 'WHERE baja = 0'
+        invalidos: List[Tuple[int, str]] = []
+        
+        try:
+            with self.db.connection() as conn:
+                cursor = conn.execute(f'''
+                    SELECT id, nombre, apellido, dni, telefono
+                    FROM cliente {where}
+                    ORDER BY id
+                ''')
+                
+                while True:
+                    lote = cursor.fetchmany(batch_size)
+                    if not lote:
+                        break
+                    ids, nombres, apellidos, dnis, telefonos = zip(*lote)
+                    motivos = Cliente.validar_columnas(nombres, apellidos, dnis, telefonos)
+                    invalidos.extend((cliente_id, motivo)
+                                     for cliente_id, motivo in zip(ids, motivos)
+                                     if motivo is not None)
+            
+            logger.info("Auditoría de clientes: %s inválidos", len(invalidos))
+            return invalidos
+        
         except Exception as e:
-            logger.error(f"Error al obtener clientes: {e}")
+            logger.error("Error al auditar clientes: %s", e)
             return []
     
     def actualizar_cliente(self, cliente_id: int, 
@@ -130,29 +423,30 @@ class ClienteController:
             bool: True si se actualizó correctamente
         """
         if not Cliente.validate_data(cliente_data):
-            logger.warning(f"Datos inválidos para actualizar cliente {cliente_id}")
+            logger.warning("Datos inválidos para actualizar cliente %s", cliente_id)
             return False
         
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                UPDATE cliente 
-                SET nombre = ?, apellido = ?, dni = ?, telefono = ?, baja = ?
-                WHERE id = ?
-            ''', (cliente_data['nombre'], cliente_data['apellido'],
-                  cliente_data['dni'], cliente_data['telefono'],
-                  cliente_data.get('baja', False), cliente_id))
-            
-            conn.commit()
-            if cursor.rowcount > 0:
-                logger.info(f"Cliente actualizado: ID={cliente_id}")
-                return True
-            return False
-            
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute('''
+                    UPDATE cliente 
+                    SET nombre = ?, apellido = ?, dni = ?, telefono = ?, baja = ?
+                    WHERE id = ?
+                ''', (cliente_data['nombre'], cliente_data['apellido'],
+                      cliente_data['dni'], cliente_data['telefono'],
+                      cliente_data.get('baja', False), cliente_id))
+                
+                self.db.commit(conn)
+                self.db.on_commit(partial(self._cache.invalidate, cliente_id))
+                if cursor.rowcount > 0:
+                    logger.info("Cliente actualizado: ID=%s", cliente_id)
+                    return True
+                return False
+                
         except Exception as e:
-            logger.error(f"Error al actualizar cliente {cliente_id}: {e}")
+            logger.error("Error al actualizar cliente %s: %s", cliente_id, e)
             return False
     
     def eliminar_cliente(self, cliente_id: int, logico: bool = True) -> bool:
@@ -167,24 +461,25 @@ class ClienteController:
             bool: True si se eliminó correctamente
         """
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            if logico:
-                cursor.execute('''
-                    UPDATE cliente SET baja = 1 WHERE id = ?
-                ''', (cliente_id,))
-            else:
-                cursor.execute('DELETE FROM cliente WHERE id = ?', (cliente_id,))
-            
-            conn.commit()
-            if cursor.rowcount > 0:
-                logger.info(f"Cliente eliminado: ID={cliente_id}, lógico={logico}")
-                return True
-            return False
-            
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                
+                if logico:
+                    cursor.execute('''
+                        UPDATE cliente SET baja = 1 WHERE id = ?
+                    ''', (cliente_id,))
+                else:
+                    cursor.execute('DELETE FROM cliente WHERE id = ?', (cliente_id,))
+                
+                self.db.commit(conn)
+                self.db.on_commit(partial(self._cache.invalidate, cliente_id))
+                if cursor.rowcount > 0:
+                    logger.info("Cliente eliminado: ID=%s, lógico=%s", cliente_id, logico)
+                    return True
+                return False
+                
         except Exception as e:
-            logger.error(f"Error al eliminar cliente {cliente_id}: {e}")
+            logger.error("Error al eliminar cliente %s: %s", cliente_id, e)
             return False
     
     def obtener_ultimo_cliente(self) -> Optional[Cliente]:
@@ -195,69 +490,256 @@ class ClienteController:
             Cliente: Último cliente o None si no existe
         """
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT * FROM cliente WHERE baja = 0
-                ORDER BY id DESC LIMIT 1
-            ''')
-            
-            row = cursor.fetchone()
-            
-            if row:
-                cliente = Cliente()
-                cliente.from_dict(dict(row))
-                return cliente
-            
-            return None
-            
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute('''
+                    SELECT * FROM cliente WHERE baja = 0
+                    ORDER BY id DESC LIMIT 1
+                ''')
+                
+                row = cursor.fetchone()
+                
+                if row:
+                    cliente = Cliente.from_row(row)
+                    return cliente
+                
+                return None
+                
         except Exception as e:
-            logger.error(f"Error al obtener último cliente: {e}")
+            logger.error("Error al obtener último cliente: %s", e)
             return None
     
     def buscar_clientes(self, criterio: str, 
-                       valor: str) -> List[Cliente]:
+                       valor: str,
+                       fields: Optional[Sequence[str]] = None
+                       ) -> List[Union[Cliente, sqlite3.Row]]:
         """
         Busca clientes por diferentes criterios.
         
         Args:
             criterio: Campo por el cual buscar (nombre, apellido, dni)
             valor: Valor a buscar
+            fields: Columnas a leer (sqlite3.Row en lugar de Cliente)
             
         Returns:
-            List[Cliente]: Lista de clientes encontrados
+            List: Lista de clientes encontrados
+            
+        Raises:
+            ValueError: Si fields incluye una columna que no existe
         """
+        columnas = select_columns(fields, Cliente.COLUMNAS)
+        
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            columnas_validas = {
-                'nombre': 'nombre',
-                'apellido': 'apellido',
-                'dni': 'dni'
-            }
-            
-            if criterio not in columnas_validas:
-                logger.warning(f"Criterio de búsqueda inválido: {criterio}")
-                return []
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                
+                columnas_validas = {
+                    'nombre': 'nombre',
+                    'apellido': 'apellido',
+                    'dni': 'dni'
+                }
+                
+                if criterio not in columnas_validas:
+                    logger.warning("Criterio de búsqueda inválido: %s", criterio)
+                    return []
+                
+                columna = columnas_validas[criterio]
+                
+                cursor.execute(f'''
+                    SELECT {columnas} FROM cliente 
+                    WHERE {columna} LIKE ? AND baja = 0
+                ''', (f'%{valor}%',))
+                
+                clientes = self._resultados(cursor.fetchall(), fields)
+                
+                logger.info("Búsqueda: criterio=%s, resultados=%s", criterio, len(clientes))
+                return clientes
+                
+        except Exception as e:
+            logger.error("Error al buscar clientes: %s", e)
+            return []
+    
+    def obtener_estadisticas(self) -> Dict[str, int]:
+        """
+        Obtiene los conteos de clientes desde la tabla de resumen.
+        
+        resumen_cliente la mantienen los triggers de la tabla cliente, así
+        que la lectura no depende de la cantidad de clientes.
+        
+        Returns:
+            Dict[str, int]: Claves 'total', 'activos' e 'inactivos'
+        """
+        estadisticas = {'total': 0, 'activos': 0, 'inactivos': 0}
+        
+        try:
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute('SELECT baja, cantidad FROM resumen_cliente')
+                
+                for row in cursor.fetchall():
+                    clave = 'inactivos' if row['baja'] else 'activos'
+                    estadisticas[clave] += row['cantidad']
+                estadisticas['total'] = estadisticas['activos'] + estadisticas['inactivos']
+                
+                return estadisticas
+                
+        except Exception as e:
+            logger.error("Error al obtener estadísticas de clientes: %s", e)
+            return estadisticas
+    
+    @staticmethod
+    def _construir_consulta_fts(texto: str, columna: Optional[str] = None) -> str:
+        """
+        Convierte el texto ingresado en una consulta FTS5 por prefijos.
+        
+        Cada palabra se busca como prefijo entre comillas (sin operadores del
+        usuario) y todas deben coincidir.
+        
+        Args:
+            texto: Texto libre ingresado por el usuario
+            columna: Restringe la búsqueda a una columna (opcional)
             
-            columna = columnas_validas[criterio]
+        Returns:
+            str: Expresión MATCH, vacía si el texto no tiene palabras
+        """
+        filtro = f'{columna} : ' if columna else ''
+        return ' '.join(
+            f'{filtro}"{token}"*' for token in _TOKEN_BUSQUEDA.findall(texto)
+        )
+    
+    def buscar_clientes_fulltext(self, query: str, limit: int = 50,
+                                 columna: Optional[str] = None,
+                                 fields: Optional[Sequence[str]] = None,
+                                 offset: int = 0) -> List[Union[Cliente, sqlite3.Row]]:
+        """
+        Busca clientes activos con el índice de texto completo.
+        
+        Coincide por prefijo sobre nombre, apellido, DNI y teléfono; los
+        resultados se ordenan por relevancia (bm25). Un texto con forma de
+        DNI o teléfono (solo dígitos y separadores, p. ej. '12.345' o
+        '4555-12') se busca en cambio como parte del número, sin separadores,
+        igual que la búsqueda con LIKE anterior al índice de texto completo.
+        
+        Args:
+            query: Texto a buscar (una o más palabras)
+            limit: Cantidad máxima de resultados
+            columna: Restringe la búsqueda a una de COLUMNAS_FULLTEXT
+            fields: Columnas a leer (sqlite3.Row en lugar de Cliente)
+            offset: Resultados a saltear (para pedir más resultados a demanda)
             
-            cursor.execute(f'''
-                SELECT * FROM cliente 
-                WHERE {columna} LIKE ? AND baja = 0
-            ''', (f'%{valor}%',))
+        Returns:
+            List: Clientes encontrados ordenados por relevancia
             
-            clientes = []
-            for row in cursor.fetchall():
-                cliente = Cliente()
-                cliente.from_dict(dict(row))
-                clientes.append(cliente)
+        Raises:
+            ValueError: Si fields incluye una columna que no existe
+        """
+        if columna is not None and columna not in self.COLUMNAS_FULLTEXT:
+            logger.warning("Columna de búsqueda inválida: %s", columna)
+            return []
+        
+        columnas = select_columns(fields, Cliente.COLUMNAS, tabla='cliente')
+        
+        if _BUSQUEDA_NUMERICA.fullmatch(query) and columna in (None, *_COLUMNAS_NUMERICAS):
+            return self._buscar_por_digitos(_SEPARADORES_NUMERO.sub('', query), limit,
+                                            columna, fields, offset)
+        
+        consulta = self._construir_consulta_fts(query, columna)
+        if not consulta:
+            return []
+        
+        try:
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute(f'''
+                    SELECT {columnas} FROM cliente_fts
+                    JOIN cliente ON cliente.id = cliente_fts.rowid
+                    WHERE cliente_fts MATCH ? AND cliente.baja = 0
+                    ORDER BY cliente_fts.rank
+                    LIMIT ? OFFSET ?
+                ''', (consulta, limit, offset))
+                
+                clientes = self._resultados(cursor.fetchall(), fields)
+                
+                logger.info("Búsqueda de texto completo: resultados=%s", len(clientes))
+                return clientes
+                
+        except Exception as e:
+            logger.error("Error en búsqueda de texto completo: %s", e)
+            return []
+    
+    def _buscar_por_digitos(self, digitos: str, limit: int, columna: Optional[str],
+                            fields: Optional[Sequence[str]],
+                            offset: int) -> List[Union[Cliente, sqlite3.Row]]:
+        """
+        Busca clientes activos cuyo DNI o teléfono contenga los dígitos dados.
+        
+        Compara sin los separadores guardados (puntos, espacios, guiones,
+        paréntesis). Por el comodín inicial recorre los clientes activos,
+        como buscar_clientes.
+        
+        Args:
+            digitos: Dígitos a buscar, ya sin separadores
+            limit: Cantidad máxima de resultados
+            columna: 'dni', 'telefono' o None para ambas
+            fields: Columnas a leer (sqlite3.Row en lugar de Cliente)
+            offset: Resultados a saltear
             
-            logger.info(f"Búsqueda: criterio={criterio}, resultados={len(clientes)}")
-            return clientes
+        Returns:
+            List: Clientes encontrados ordenados por ID
             
+        Raises:
+            ValueError: Si fields incluye una columna que no existe
+        """
+        if columna:
+            expresiones = [_COLUMNAS_NUMERICAS[columna]]
+        else:
+            expresiones = list(_COLUMNAS_NUMERICAS.values())
+        condicion = ' OR '.join(f'{expresion} LIKE ?' for expresion in expresiones)
+        
+        columnas = select_columns(fields, Cliente.COLUMNAS)
+        
+        try:
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute(f'''
+                    SELECT {columnas} FROM cliente
+                    WHERE baja = 0 AND ({condicion})
+                    ORDER BY id
+                    LIMIT ? OFFSET ?
+                ''', (*[f'%{digitos}%'] * len(expresiones), limit, offset))
+                
+                clientes = self._resultados(cursor.fetchall(), fields)
+                
+                logger.info("Búsqueda por número: resultados=%s", len(clientes))
+                return clientes
+                
         except Exception as e:
-            logger.error(f"Error al buscar clientes: {e}")
-            return []
\ No newline at end of file
+            logger.error("Error en búsqueda por número: %s", e)
+            return []
+    
+    @staticmethod
+    def _resultados(rows: List[sqlite3.Row],
+                    fields: Optional[Sequence[str]]) -> List[Union[Cliente, sqlite3.Row]]:
+        """Construye objetos Cliente, salvo que se haya pedido una proyección."""
+        if fields is not None:
+            return rows
+        return [Cliente.from_row(row) for row in rows]
+    
+    @classmethod
+    def estadisticas_cache(cls) -> Dict[str, Any]:
+        """
+        Obtiene los contadores de la caché de clientes.
+        
+        Returns:
+            Dict[str, Any]: 'hits', 'misses', 'hit_rate', 'size' y 'max_size'
+        """
+        return cls._cache.stats()
+    
+    @classmethod
+    def limpiar_cache(cls) -> None:
+        """Vacía la caché de clientes (p. ej. tras cambios hechos por otro proceso)."""
+        cls._cache.clear()
@@ -1,11 +1,18 @@
 """
 Controlador para manejar las operaciones CRUD de servicios.
 """
-from typing import List, Optional, Dict, Any
-from datetime import date
-from models.servicio import Servicio
+import copy
+import sqlite3
+from functools import partial
+from typing import List, Optional, Dict, Any, Iterator, Sequence, Tuple, Union
+from datetime import date, timedelta
+from models.servicio import Servicio, ServicioDetalle
 from utils.database import DatabaseConnection
+from utils.cache import ModelCache
+from utils.pagination import Pagina, DIRECCIONES, build_keyset_clause, next_cursor
+from utils.projection import select_columns
 from utils.logger import setup_logger
+import config
 
 logger = setup_logger(__name__)
 
@@ -15,6 +22,13 @@ class ServicioController:
     Controlador que maneja la lógica de negocio para los servicios.
     """
     
+    # Identity map compartido por todas las instancias del controlador
+    _cache = ModelCache(config.CACHE_MAX_SIZE, config.CACHE_TTL_SECONDS)
+    
+    ORDENES_PAGINACION = ('id', 'fecha_ingreso')
+    # IDs por sentencia en las actualizaciones masivas (límite de parámetros de SQLite)
+    LOTE_IDS = 500
+    
     def __init__(self) -> None:
         """Inicializa el controlador con la conexión a la base de datos."""
         self.db = DatabaseConnection()
@@ -40,28 +54,71 @@ class ServicioController:
         servicio = Servicio().from_dict(servicio_data)
         
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            # Insertar en la base de datos
-            cursor.execute('''
-                INSERT INTO servicio 
-                (descripcion, estado, fecha_ingreso, fecha_estimada, costo, idCliente, baja)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (servicio.descripcion, servicio.estado, 
-                  servicio.fecha_ingreso, servicio.fecha_estimada,
-                  servicio.costo, servicio.idCliente, servicio.baja))
-            
-            # Obtener el ID generado
-            servicio.id = cursor.lastrowid
-            conn.commit()
-            
-            return servicio
-            
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                
+                # Insertar en la base de datos
+                cursor.execute('''
+                    INSERT INTO servicio 
+                    (descripcion, estado, fecha_ingreso, fecha_estimada, costo, idCliente, baja)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                ''', (servicio.descripcion, servicio.estado, 
+                      servicio.fecha_ingreso, servicio.fecha_estimada,
+                      servicio.costo, servicio.idCliente, servicio.baja))
+                
+                # Obtener el ID generado
+                servicio.id = cursor.lastrowid
+                self.db.commit(conn)
+                self.db.on_commit(partial(self._cache.invalidate, servicio.id))
+                
+                return servicio
+                
         except Exception as e:
-            logger.error(f"Error al crear servicio: {e}")
+            logger.error("Error al crear servicio: %s", e)
             return None
     
+    def insertar_servicios_lote(self, servicios_data: List[Dict[str, Any]]) -> int:
+        """
+        Inserta un lote de servicios ya validados en una única transacción.
+        
+        El trigger de rollups registra un día pendiente por servicio; durante
+        el lote se pausa (fila en rollup_pausa, ver la migración 8) y cada
+        día insertado se registra una sola vez al final.
+        
+        Args:
+            servicios_data: Lista de diccionarios con datos de servicios
+            
+        Returns:
+            int: Cantidad de servicios insertados
+        """
+        if not servicios_data:
+            return 0
+        
+        filas = [(s['descripcion'], s.get('estado', 'PENDIENTE'),
+                  s.get('fecha_ingreso') or date.today().isoformat(),
+                  s.get('fecha_estimada') or None, float(s.get('costo', 0.0)),
+                  s['idCliente'], s.get('baja', False)) for s in servicios_data]
+        
+        with self.db.unit_of_work() as conn:
+            ultimo_id = conn.execute('SELECT COALESCE(MAX(id), 0) FROM servicio').fetchone()[0]
+            
+            conn.execute('INSERT INTO rollup_pausa (activa) VALUES (1)')
+            try:
+                conn.executemany('''
+                    INSERT INTO servicio 
+                    (descripcion, estado, fecha_ingreso, fecha_estimada, costo, idCliente, baja)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                ''', filas)
+            finally:
+                conn.execute('DELETE FROM rollup_pausa')
+            conn.execute('''
+                INSERT INTO rollup_pendiente (dia)
+                SELECT DISTINCT fecha_ingreso FROM servicio WHERE id > ?
+            ''', (ultimo_id,))
+        
+        logger.info("Lote de servicios importado: %s", len(filas))
+        return len(filas)
+    
     def obtener_servicio(self, servicio_id: int) -> Optional[Servicio]:
         """
         Obtiene un servicio por su ID.
@@ -70,96 +127,322 @@ class ServicioController:
             servicio_id: ID del servicio a obtener
             
         Returns:
-            Servicio: Instancia del servicio o None si no se encuentra
+            Servicio: Instancia del servicio (nunca la guardada en caché) o None si
+                no se encuentra
         """
+        servicio = self._cache.get(servicio_id)
+        if servicio is not None:
+            # Copia: quien la recibe puede modificarla (p. ej. los diálogos de edición)
+            return copy.copy(servicio)
+        
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT * FROM servicio WHERE id = ? AND baja = 0
-            ''', (servicio_id,))
-            
-            row = cursor.fetchone()
-            
-            if row:
-                servicio = Servicio()
-                servicio.from_dict(dict(row))
-                return servicio
-            
-            return None
-            
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute('''
+                    SELECT * FROM servicio WHERE id = ? AND baja = 0
+                ''', (servicio_id,))
+                
+                row = cursor.fetchone()
+                
+                if row:
+                    servicio = Servicio.from_row(row)
+                    if not self.db.in_unit_of_work():
+                        # Lo leído dentro de una unidad puede revertirse
+                        self._cache.put(servicio_id, copy.copy(servicio))
+                    return servicio
+                
+                return None
+                
         except Exception as e:
-            logger.error(f"Error al obtener servicio: {e}")
+            logger.error("Error al obtener servicio: %s", e)
             return None
     
     def obtener_servicios_cliente(self, cliente_id: int, 
-                                 incluir_bajas: bool = False) -> List[Servicio]:
+                                 incluir_bajas: bool = False,
+                                 fields: Optional[Sequence[str]] = None
+                                 ) -> List[Union[Servicio, sqlite3.Row]]:
         """
         Obtiene todos los servicios de un cliente específico.
         
         Args:
             cliente_id: ID del cliente
             incluir_bajas: Si se incluyen servicios dados de baja
+            fields: Columnas a leer (ver Servicio.COLUMNAS). Si se indican, se
+                devuelven filas livianas (sqlite3.Row) en lugar de objetos Servicio
             
         Returns:
-            List[Servicio]: Lista de servicios del cliente
+            List: Lista de servicios del cliente
+            
+        Raises:
+            ValueError: Si fields incluye una columna que no existe
         """
+        columnas = select_columns(fields, Servicio.COLUMNAS)
+        
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            if incluir_bajas:
-                cursor.execute('''
-                    SELECT * FROM servicio WHERE idCliente = ?
-                ''', (cliente_id,))
-            else:
-                cursor.execute('''
-                    SELECT * FROM servicio WHERE idCliente = ? AND baja = 0
-                ''', (cliente_id,))
-            
-            servicios = []
-            for row in cursor.fetchall():
-                servicio = Servicio()
-                servicio.from_dict(dict(row))
-                servicios.append(servicio)
-            
-            return servicios
-            
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                
+                if incluir_bajas:
+                    cursor.execute(f'''
+                        SELECT {columnas} FROM servicio WHERE idCliente = ?
+                    ''', (cliente_id,))
+                else:
+                    cursor.execute(f'''
+                        SELECT {columnas} FROM servicio WHERE idCliente = ? AND baja = 0
+                    ''', (cliente_id,))
+                
+                return self._resultados(cursor.fetchall(), fields)
+                
         except Exception as e:
-            logger.error(f"Error al obtener servicios del cliente: {e}")
+            logger.error("Error al obtener servicios del cliente: %s", e)
             return []
     
-    def obtener_todos_servicios(self, incluir_bajas: bool = False) -> List[Servicio]:
+    def obtener_todos_servicios(self, incluir_bajas: bool = False,
+                                fields: Optional[Sequence[str]] = None
+                                ) -> List[Union[Servicio, sqlite3.Row]]:
         """
         Obtiene todos los servicios de la base de datos.
         
         Args:
             incluir_bajas: Si se incluyen servicios dados de baja
+            fields: Columnas a leer (ver Servicio.COLUMNAS). Si se indican, se
+                devuelven filas livianas (sqlite3.Row) en lugar de objetos Servicio
             
         Returns:
-            List[Servicio]: Lista de servicios
+            List: Lista de servicios
+            
+        Raises:
+            ValueError: Si fields incluye una columna que no existe
         """
+        columnas = select_columns(fields, Servicio.COLUMNAS)
+        
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                
+                if incluir_bajas:
+                    cursor.execute(f'SELECT {columnas} FROM servicio')
+                else:
+                    cursor.execute(f'SELECT {columnas} FROM servicio WHERE baja = 0')
+                
+                return self._resultados(cursor.fetchall(), fields)
+                
+        except Exception as e:
+            logger.error("Error al obtener servicios: %s", e)
+            return []
+    
+    def obtener_servicios_paginados(self, page_size: int = 100,
+                                    after_key: Any = None,
+                                    orden: str = 'id',
+                                    direccion: str = 'ASC',
+                                    incluir_bajas: bool = False,
+                                    estado: Optional[str] = None,
+                                    fields: Optional[Sequence[str]] = None) -> Pagina:
+        """
+        Obtiene una página de servicios usando paginación por clave.
+        
+        Args:
+            page_size: Cantidad máxima de servicios por página
+            after_key: Cursor devuelto por la página anterior (None para la primera)
+            orden: Columna de ordenamiento ('id' o 'fecha_ingreso')
+            direccion: 'ASC' o 'DESC'
+            incluir_bajas: Si se incluyen servicios dados de baja
+            estado: Filtrar por estado (None para todos)
+            fields: Columnas a leer (sqlite3.Row en lugar de Servicio); se
+                agregan siempre las columnas de ordenamiento
             
-            if incluir_bajas:
-                cursor.execute('SELECT * FROM servicio')
-            else:
-                cursor.execute('SELECT * FROM servicio WHERE baja = 0')
+        Returns:
+            Pagina: Servicios de la página y cursor de la siguiente
             
-            servicios = []
-            for row in cursor.fetchall():
-                servicio = Servicio()
-                servicio.from_dict(dict(row))
-                servicios.append(servicio)
+        Raises:
+            ValueError: Si fields incluye una columna que no existe
+        """
+        direccion = direccion.upper()
+        if orden not in self.ORDENES_PAGINACION or direccion not in DIRECCIONES:
+            logger.warning("Orden de paginación inválido: %s %s", orden, direccion)
+            return Pagina([], None, page_size)
+        
+        if estado is not None and estado not in Servicio.ESTADOS:
+            return Pagina([], None, page_size)
+        
+        columnas = select_columns(fields, Servicio.COLUMNAS, ('id', orden))
+        
+        try:
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                
+                condicion, order_by, params = build_keyset_clause(orden, direccion, after_key)
+                condiciones = []
+                filtros: tuple = ()
+                if estado is not None:
+                    condiciones.append('estado = ?')
+                    filtros += (estado,)
+                if not incluir_bajas:
+                    condiciones.append('baja = 0')
+                if condicion:
+                    condiciones.append(condicion)
+                where = f"WHERE {' AND '.join(condiciones)}" if condiciones else ''
+                
+                cursor.execute(f'''
+                    SELECT {columnas} FROM servicio {where}
+                    ORDER BY {order_by} LIMIT ?
+                ''', filtros + params + (page_size + 1,))
+                
+                rows = cursor.fetchall()
+                cursor_siguiente = next_cursor(rows, orden, page_size)
+                
+                return Pagina(self._resultados(rows, fields), cursor_siguiente, page_size)
+                
+        except Exception as e:
+            logger.error("Error al obtener página de servicios: %s", e)
+            return Pagina([], None, page_size)
+    
+    @staticmethod
+    def _filtros_servicio(estado: Optional[str] = None,
+                          desde: Optional[date] = None,
+                          hasta: Optional[date] = None,
+                          cliente_id: Optional[int] = None,
+                          incluir_bajas: bool = False) -> Tuple[List[str], tuple]:
+        """
+        Construye las condiciones WHERE sobre servicio (alias s).
+        
+        Args:
+            estado: Filtrar por estado
+            desde: Fecha de ingreso mínima (inclusive)
+            hasta: Fecha de ingreso máxima (inclusive)
+            cliente_id: Filtrar por cliente
+            incluir_bajas: Si se incluyen servicios dados de baja
             
-            return servicios
+        Returns:
+            Tuple[List[str], tuple]: Condiciones y sus parámetros
+        """
+        condiciones: List[str] = []
+        params: tuple = ()
+        if estado is not None:
+            condiciones.append('s.estado = ?')
+            params += (estado,)
+        if cliente_id is not None:
+            condiciones.append('s.idCliente = ?')
+            params += (cliente_id,)
+        if not incluir_bajas:
+            condiciones.append('s.baja = 0')
+        if desde is not None:
+            condiciones.append('s.fecha_ingreso >= ?')
+            params += (desde.isoformat(),)
+        if hasta is not None:
+            condiciones.append('s.fecha_ingreso <= ?')
+            params += (hasta.isoformat(),)
+        return condiciones, params
+    
+    def obtener_servicios_con_cliente(self, page_size: int = 100,
+                                      after_key: Any = None,
+                                      estado: Optional[str] = None,
+                                      desde: Optional[date] = None,
+                                      hasta: Optional[date] = None,
+                                      cliente_id: Optional[int] = None,
+                                      incluir_bajas: bool = False) -> Pagina:
+        """
+        Obtiene una página de servicios con el nombre y DNI de su cliente.
+        
+        El cliente se resuelve con un JOIN en la misma consulta (sin una
+        consulta por fila). Los servicios se ordenan por fecha de ingreso
+        descendente y se paginan por clave.
+        
+        Args:
+            page_size: Cantidad máxima de servicios por página
+            after_key: Cursor devuelto por la página anterior (None para la primera)
+            estado: Filtrar por estado (None para todos)
+            desde: Fecha de ingreso mínima (inclusive)
+            hasta: Fecha de ingreso máxima (inclusive)
+            cliente_id: Filtrar por cliente (None para todos)
+            incluir_bajas: Si se incluyen servicios dados de baja
             
+        Returns:
+            Pagina: Objetos ServicioDetalle y cursor de la siguiente página
+        """
+        if estado is not None and estado not in Servicio.ESTADOS:
+            return Pagina([], None, page_size)
+        
+        try:
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                
+                condiciones, filtros = self._filtros_servicio(
+                    estado, desde, hasta, cliente_id, incluir_bajas
+                )
+                condicion, order_by, params = build_keyset_clause(
+                    'fecha_ingreso', 'DESC', after_key, tabla='s'
+                )
+                if condicion:
+                    condiciones.append(condicion)
+                where = f"WHERE {' AND '.join(condiciones)}" if condiciones else ''
+                
+                cursor.execute(f'''
+                    SELECT s.*, COALESCE(c.nombre, '') AS cliente_nombre,
+                           COALESCE(c.apellido, '') AS cliente_apellido,
+                           COALESCE(c.dni, '') AS cliente_dni
+                    FROM servicio s
+                    LEFT JOIN cliente c ON c.id = s.idCliente
+                    {where}
+                    ORDER BY {order_by} LIMIT ?
+                ''', filtros + params + (page_size + 1,))
+                
+                rows = cursor.fetchall()
+                cursor_siguiente = next_cursor(rows, 'fecha_ingreso', page_size)
+                servicios = [ServicioDetalle.from_row(row) for row in rows]
+                
+                return Pagina(servicios, cursor_siguiente, page_size)
+                
         except Exception as e:
-            logger.error(f"Error al obtener servicios: {e}")
-            return []
+            logger.error("Error al obtener servicios con cliente: %s", e)
+            return Pagina([], None, page_size)
+    
+    def iterar_servicios_export(self, incluir_bajas: bool = True,
+                                batch_size: int = 5000,
+                                estado: Optional[str] = None,
+                                desde: Optional[date] = None,
+                                hasta: Optional[date] = None,
+                                cliente_id: Optional[int] = None) -> Iterator[List[Any]]:
+        """
+        Recorre los servicios en lotes listos para escribir en CSV.
+        
+        Las filas se leen con fetchmany y se formatean en SQL en el orden de
+        las columnas exportadas, sin construir objetos Servicio. Los datos
+        del cliente se resuelven con un JOIN en la misma consulta.
+        
+        Args:
+            incluir_bajas: Si se incluyen servicios dados de baja
+            batch_size: Filas por lote
+            estado: Filtrar por estado (None para todos)
+            desde: Fecha de ingreso mínima (inclusive)
+            hasta: Fecha de ingreso máxima (inclusive)
+            cliente_id: Filtrar por cliente (None para todos)
+            
+        Yields:
+            List: Lote de filas en el orden de las columnas exportadas
+        """
+        condiciones, params = self._filtros_servicio(
+            estado, desde, hasta, cliente_id, incluir_bajas
+        )
+        where = f"WHERE {' AND '.join(condiciones)}" if condiciones else ''
+        with self.db.connection() as conn:
+            cursor = conn.execute(f'''
+                SELECT s.descripcion, s.estado, s.fecha_ingreso,
+                       COALESCE(s.fecha_estimada, ''), s.costo, s.idCliente,
+                       COALESCE(c.nombre || ' ' || c.apellido, ''), COALESCE(c.dni, ''),
+                       CASE WHEN s.baja THEN 'Inactivo' ELSE 'Activo' END
+                FROM servicio s
+                LEFT JOIN cliente c ON c.id = s.idCliente
+                {where}
+                ORDER BY s.id
+            ''', params)
+            
+            while True:
+                lote = cursor.fetchmany(batch_size)
+                if not lote:
+                    break
+                yield lote
     
     def actualizar_servicio(self, servicio_id: int, 
                            servicio_data: Dict[str, Any]) -> bool:
@@ -178,24 +461,25 @@ class ServicioController:
             return False
         
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                UPDATE servicio 
-                SET descripcion = ?, estado = ?, fecha_ingreso = ?, 
-                    fecha_estimada = ?, costo = ?, idCliente = ?, baja = ?
-                WHERE id = ?
-            ''', (servicio_data['descripcion'], servicio_data['estado'],
-                  servicio_data['fecha_ingreso'], servicio_data.get('fecha_estimada'),
-                  servicio_data['costo'], servicio_data['idCliente'],
-                  servicio_data.get('baja', False), servicio_id))
-            
-            conn.commit()
-            return cursor.rowcount > 0
-            
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute('''
+                    UPDATE servicio 
+                    SET descripcion = ?, estado = ?, fecha_ingreso = ?, 
+                        fecha_estimada = ?, costo = ?, idCliente = ?, baja = ?
+                    WHERE id = ?
+                ''', (servicio_data['descripcion'], servicio_data['estado'],
+                      servicio_data['fecha_ingreso'], servicio_data.get('fecha_estimada'),
+                      servicio_data['costo'], servicio_data['idCliente'],
+                      servicio_data.get('baja', False), servicio_id))
+                
+                self.db.commit(conn)
+                self.db.on_commit(partial(self._cache.invalidate, servicio_id))
+                return cursor.rowcount > 0
+                
         except Exception as e:
-            logger.error(f"Error al actualizar servicio: {e}")
+            logger.error("Error al actualizar servicio: %s", e)
             return False
     
     def eliminar_servicio(self, servicio_id: int, logico: bool = True) -> bool:
@@ -210,58 +494,62 @@ class ServicioController:
             bool: True si se eliminó correctamente
         """
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            if logico:
-                # Baja lógica
-                cursor.execute('''
-                    UPDATE servicio SET baja = 1 WHERE id = ?
-                ''', (servicio_id,))
-            else:
-                # Eliminación física
-                cursor.execute('DELETE FROM servicio WHERE id = ?', (servicio_id,))
-            
-            conn.commit()
-            return cursor.rowcount > 0
-            
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                
+                if logico:
+                    # Baja lógica
+                    cursor.execute('''
+                        UPDATE servicio SET baja = 1 WHERE id = ?
+                    ''', (servicio_id,))
+                else:
+                    # Eliminación física
+                    cursor.execute('DELETE FROM servicio WHERE id = ?', (servicio_id,))
+                
+                self.db.commit(conn)
+                self.db.on_commit(partial(self._cache.invalidate, servicio_id))
+                return cursor.rowcount > 0
+                
         except Exception as e:
-            logger.error(f"Error al eliminar servicio: {e}")
+            logger.error("Error al eliminar servicio: %s", e)
             return False
     
-    def obtener_servicios_por_estado(self, estado: str) -> List[Servicio]:
+    def obtener_servicios_por_estado(self, estado: str,
+                                     fields: Optional[Sequence[str]] = None
+                                     ) -> List[Union[Servicio, sqlite3.Row]]:
         """
         Obtiene servicios filtrados por estado.
         
         Args:
             estado: Estado por el cual filtrar
+            fields: Columnas a leer (ver Servicio.COLUMNAS). Si se indican, se
+                devuelven filas livianas (sqlite3.Row) en lugar de objetos Servicio
             
         Returns:
-            List[Servicio]: Lista de servicios encontrados
+            List: Lista de servicios encontrados
+            
+        Raises:
+            ValueError: Si fields incluye una columna que no existe
         """
         if estado not in Servicio.ESTADOS:
             return []
         
+        columnas = select_columns(fields, Servicio.COLUMNAS)
+        
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT * FROM servicio 
-                WHERE estado = ? AND baja = 0
-                ORDER BY fecha_ingreso DESC
-            ''', (estado,))
-            
-            servicios = []
-            for row in cursor.fetchall():
-                servicio = Servicio()
-                servicio.from_dict(dict(row))
-                servicios.append(servicio)
-            
-            return servicios
-            
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute(f'''
+                    SELECT {columnas} FROM servicio 
+                    WHERE estado = ? AND baja = 0
+                    ORDER BY fecha_ingreso DESC
+                ''', (estado,))
+                
+                return self._resultados(cursor.fetchall(), fields)
+                
         except Exception as e:
-            logger.error(f"Error al obtener servicios por estado: {e}")
+            logger.error("Error al obtener servicios por estado: %s", e)
             return []
     
     def actualizar_estado_servicio(self, servicio_id: int, 
@@ -280,18 +568,203 @@ class ServicioController:
             return False
         
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute('''
+                    UPDATE servicio 
+                    SET estado = ?
+                    WHERE id = ? AND baja = 0
+                ''', (nuevo_estado, servicio_id))
+                
+                self.db.commit(conn)
+                self.db.on_commit(partial(self._cache.invalidate, servicio_id))
+                return cursor.rowcount > 0
+                
+        except Exception as e:
+            logger.error("Error al actualizar estado del servicio: %s", e)
+            return False
+    
+    def actualizar_estado_servicios(self, servicio_ids: List[int],
+                                    nuevo_estado: str) -> int:
+        """
+        Cambia el estado de varios servicios en una sola transacción.
+        
+        Los IDs se actualizan con UPDATE ... WHERE id IN (...) en bloques de
+        LOTE_IDS. Los servicios dados de baja o que ya tienen el estado
+        nuevo no se cuentan.
+        
+        Args:
+            servicio_ids: IDs de los servicios
+            nuevo_estado: Nuevo estado de los servicios
+            
+        Returns:
+            int: Cantidad de servicios actualizados (-1 si hubo un error)
+        """
+        if nuevo_estado not in Servicio.ESTADOS:
+            return 0
+        
+        ids = list(dict.fromkeys(servicio_ids))
+        if not ids:
+            return 0
+        
+        try:
+            actualizados = 0
+            with self.db.unit_of_work() as conn:
+                for inicio in range(0, len(ids), self.LOTE_IDS):
+                    bloque = ids[inicio:inicio + self.LOTE_IDS]
+                    marcadores = ', '.join('?' * len(bloque))
+                    cursor = conn.execute(f'''
+                        UPDATE servicio SET estado = ?
+                        WHERE id IN ({marcadores}) AND baja = 0 AND estado != ?
+                    ''', (nuevo_estado, *bloque, nuevo_estado))
+                    actualizados += cursor.rowcount
+                
+                self.db.on_commit(partial(self._cache.invalidate_many, ids))
+            
+            logger.info("Estado %s aplicado a %s servicios", nuevo_estado, actualizados)
+            return actualizados
+            
+        except Exception as e:
+            logger.error("Error al actualizar estado de servicios: %s", e)
+            return -1
+    
+    def actualizar_estado_por_filtro(self, nuevo_estado: str,
+                                     estado: Optional[str] = None,
+                                     desde: Optional[date] = None,
+                                     hasta: Optional[date] = None,
+                                     cliente_id: Optional[int] = None) -> int:
+        """
+        Cambia el estado de los servicios activos que cumplen un filtro.
+        
+        Se ejecuta como un único UPDATE con los mismos filtros que
+        obtener_servicios_con_cliente.
+        
+        Args:
+            nuevo_estado: Nuevo estado de los servicios
+            estado: Estado actual de los servicios a cambiar (None para todos)
+            desde: Fecha de ingreso mínima (inclusive)
+            hasta: Fecha de ingreso máxima (inclusive)
+            cliente_id: Filtrar por cliente (None para todos)
             
-            cursor.execute('''
-                UPDATE servicio 
-                SET estado = ?
-                WHERE id = ? AND baja = 0
-            ''', (nuevo_estado, servicio_id))
+        Returns:
+            int: Cantidad de servicios actualizados (-1 si hubo un error)
+        """
+        if nuevo_estado not in Servicio.ESTADOS:
+            return 0
+        if estado is not None and estado not in Servicio.ESTADOS:
+            return 0
+        
+        condiciones, params = self._filtros_servicio(estado, desde, hasta, cliente_id)
+        condiciones.append('s.estado != ?')
+        
+        try:
+            with self.db.unit_of_work() as conn:
+                cursor = conn.execute(f'''
+                    UPDATE servicio AS s SET estado = ?
+                    WHERE {' AND '.join(condiciones)}
+                ''', (nuevo_estado, *params, nuevo_estado))
+                actualizados = cursor.rowcount
+                
+                if actualizados:
+                    self.db.on_commit(self._cache.clear)
+            
+            logger.info("Estado %s aplicado por filtro a %s servicios", nuevo_estado, actualizados)
+            return actualizados
             
-            conn.commit()
-            return cursor.rowcount > 0
+        except Exception as e:
+            logger.error("Error al actualizar estado de servicios por filtro: %s", e)
+            return -1
+    
+    def completar_servicios_antiguos(self, dias: int,
+                                     estado: str = 'EN_PROCESO',
+                                     nuevo_estado: str = 'COMPLETADO') -> int:
+        """
+        Cambia el estado de los servicios ingresados hace más de `dias` días.
+        
+        Por defecto marca como COMPLETADO todo servicio EN_PROCESO cuya
+        fecha de ingreso sea anterior a hoy menos `dias`. La comparación es
+        estricta: con dias=30, un servicio ingresado hace exactamente 30 días
+        no cambia y uno ingresado hace 31 sí (la fecha límite inclusiva es
+        hoy menos dias + 1).
+        
+        Args:
+            dias: Antigüedad en días que los servicios deben superar
+            estado: Estado actual de los servicios a cambiar
+            nuevo_estado: Nuevo estado
             
+        Returns:
+            int: Cantidad de servicios actualizados (-1 si hubo un error)
+        """
+        hasta = date.today() - timedelta(days=dias + 1)
+        return self.actualizar_estado_por_filtro(nuevo_estado, estado=estado, hasta=hasta)
+    
+    def obtener_estadisticas(self) -> Dict[str, Any]:
+        """
+        Obtiene las estadísticas de servicios desde la tabla de resumen.
+        
+        resumen_servicio tiene una fila por (estado, baja) y la mantienen los
+        triggers de la tabla servicio, así que la lectura no depende de la
+        cantidad de servicios. Los conteos por estado y el costo total
+        consideran solo servicios activos.
+        
+        Returns:
+            Dict[str, Any]: Claves 'por_estado', 'total', 'activos',
+            'inactivos' y 'costo_total'
+        """
+        estadisticas: Dict[str, Any] = {
+            'por_estado': {estado: 0 for estado in Servicio.ESTADOS},
+            'total': 0,
+            'activos': 0,
+            'inactivos': 0,
+            'costo_total': 0.0
+        }
+        
+        try:
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute('''
+                    SELECT estado, baja, cantidad, costo_total AS costo
+                    FROM resumen_servicio
+                ''')
+                
+                for row in cursor.fetchall():
+                    estadisticas['total'] += row['cantidad']
+                    if row['baja']:
+                        estadisticas['inactivos'] += row['cantidad']
+                        continue
+                    
+                    estadisticas['activos'] += row['cantidad']
+                    estadisticas['costo_total'] += row['costo']
+                    if row['estado'] in estadisticas['por_estado']:
+                        estadisticas['por_estado'][row['estado']] += row['cantidad']
+                
+                return estadisticas
+                
         except Exception as e:
-            logger.error(f"Error al actualizar estado del servicio: {e}")
-            return False
\ No newline at end of file
+            logger.error("Error al obtener estadísticas de servicios: %s", e)
+            return estadisticas
+    
+    @staticmethod
+    def _resultados(rows: List[sqlite3.Row],
+                    fields: Optional[Sequence[str]]) -> List[Union[Servicio, sqlite3.Row]]:
+        """Construye objetos Servicio, salvo que se haya pedido una proyección."""
+        if fields is not None:
+            return rows
+        return [Servicio.from_row(row) for row in rows]
+    
+    @classmethod
+    def estadisticas_cache(cls) -> Dict[str, Any]:
+        """
+        Obtiene los contadores de la caché de servicios.
+        
+        Returns:
+            Dict[str, Any]: 'hits', 'misses', 'hit_rate', 'size' y 'max_size'
+        """
+        return cls._cache.stats()
+    
+    @classmethod
+    def limpiar_cache(cls) -> None:
+        """Vacía la caché de servicios (p. ej. tras cambios hechos por otro proceso)."""
+        cls._cache.clear()
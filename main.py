@@ -2,31 +2,99 @@
 Punto de entrada principal de la aplicación.
 """
 import sys
-from PyQt6.QtWidgets import QApplication
-from views.main_window import MainWindow
+from utils.startup import StartupTimer
+
+arranque = StartupTimer()
+
 from utils.logger import setup_logger
 import config
 
 logger = setup_logger(__name__)
 
+# Tiempo máximo de espera de las tareas en segundo plano al salir
+ESPERA_TAREAS_MS = 5000
+
+
+def rebuild_stats() -> None:
+    """
+    Recalcula las tablas de resumen del dashboard y termina.
+    
+    Uso: python main.py --rebuild-stats
+    """
+    from utils.database import DatabaseConnection
+    
+    db = DatabaseConnection()
+    db.rebuild_summary()
+    db.close_connection()
+    print("Estadísticas recalculadas.")
+
+
+def reportar_arranque(nombre: str, milisegundos: float) -> None:
+    """
+    Completa el reporte de arranque con la vista inicial y lo imprime.
+    
+    Se conecta a MainWindow.vista_creada con --startup-report; solo la
+    primera vista creada forma parte del arranque.
+    
+    Args:
+        nombre: Nombre de la vista construida
+        milisegundos: Tiempo de construcción de la vista
+    """
+    if any(fase.startswith("Vista inicial") for fase, _ in arranque.fases):
+        return
+    arranque.registrar(f"Vista inicial ({nombre})", milisegundos)
+    print(arranque.reporte())
+
+
+def cerrar_recursos() -> None:
+    """
+    Espera las tareas en segundo plano y cierra las conexiones a la base.
+    
+    Se conecta a QApplication.aboutToQuit, así corre antes de que termine
+    el bucle de eventos.
+    """
+    from PyQt6.QtCore import QThreadPool
+    from utils.database import DatabaseConnection
+    
+    QThreadPool.globalInstance().waitForDone(ESPERA_TAREAS_MS)
+    DatabaseConnection().close_connection()
+
 
 def main() -> None:
     """
     Función principal que inicia la aplicación.
+    
+    Uso: python main.py [--startup-report]
     """
+    if '--rebuild-stats' in sys.argv:
+        rebuild_stats()
+        return
+    
     try:
         logger.info("Iniciando aplicación...")
         
-        app = QApplication(sys.argv)
+        with arranque.fase("Importación de PyQt6"):
+            from PyQt6.QtWidgets import QApplication
+        with arranque.fase("Importación de la ventana principal"):
+            from views.main_window import MainWindow
+        
+        with arranque.fase("QApplication"):
+            app = QApplication(sys.argv)
+            app.aboutToQuit.connect(cerrar_recursos)
+        
+        with arranque.fase("Construcción de MainWindow"):
+            main_window = MainWindow()
+        if '--startup-report' in sys.argv:
+            main_window.vista_creada.connect(reportar_arranque)
         
-        main_window = MainWindow()
-        main_window.show()
+        with arranque.fase("Mostrar ventana"):
+            main_window.show()
         
-        logger.info("Aplicación iniciada correctamente")
+        logger.info("Aplicación iniciada correctamente en %.0f ms", arranque.total_ms())
         sys.exit(app.exec())
         
     except Exception as e:
-        logger.error(f"Error crítico en la aplicación: {e}", exc_info=True)
+        logger.error("Error crítico en la aplicación: %s", e, exc_info=True)
         sys.exit(1)
 
 
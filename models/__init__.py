@@ -1,5 +1,5 @@
 # models/__init__.py
 from .cliente import Cliente
-from .servicio import Servicio
+from .servicio import Servicio, ServicioDetalle
 
-__all__ = ['Cliente', 'Servicio']
\ No newline at end of file
+__all__ = ['Cliente', 'Servicio', 'ServicioDetalle']
\ No newline at end of file
@@ -8,7 +8,11 @@ class BaseModel(ABC):
     """
     Clase abstracta base para todos los modelos.
     Define la interfaz común que deben implementar todos los modelos.
+    
+    Los modelos declaran __slots__ para no reservar un __dict__ por
+    instancia; esta clase declara slots vacíos para no anularlos.
     """
+    __slots__ = ()
     
     @abstractmethod
     def to_dict(self) -> Dict[str, Any]:
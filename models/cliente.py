@@ -2,9 +2,10 @@
 Modelo Cliente.
 """
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Mapping, Optional, Sequence
 from .base_model import BaseModel
-from utils.validators import validar_dni, validar_telefono
+from utils.validators import (posiciones_invalidas, validar_dni, validar_dnis,
+                              validar_telefono, validar_telefonos)
 
 class Cliente(BaseModel):
     """
@@ -18,6 +19,15 @@ class Cliente(BaseModel):
         telefono (str): Número de teléfono
         baja (bool): Estado del cliente (activo/inactivo)
     """
+    __slots__ = ('id', 'nombre', 'apellido', 'dni', 'telefono', 'baja')
+    
+    # Columnas de la tabla cliente (válidas para proyecciones)
+    COLUMNAS = ('id', 'nombre', 'apellido', 'dni', 'telefono', 'baja')
+    
+    # Motivos de rechazo de validar_lote
+    MOTIVO_FALTANTES = "Faltan nombre, apellido o DNI"
+    MOTIVO_DNI = "DNI inválido"
+    MOTIVO_TELEFONO = "Teléfono inválido"
     
     def __init__(self, id: Optional[int] = None, nombre: str = "", 
                  apellido: str = "", dni: str = "", telefono: str = "", 
@@ -74,6 +84,28 @@ class Cliente(BaseModel):
         self.baja = data.get('baja', False)
         return self
     
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> 'Cliente':
+        """
+        Crea un cliente directamente desde una fila de la base de datos.
+        
+        Evita el diccionario intermedio de from_dict(dict(row)).
+        
+        Args:
+            row: Fila (sqlite3.Row) con las columnas de la tabla cliente
+            
+        Returns:
+            Cliente: Nueva instancia
+        """
+        cliente = cls.__new__(cls)
+        cliente.id = row['id']
+        cliente.nombre = row['nombre']
+        cliente.apellido = row['apellido']
+        cliente.dni = row['dni']
+        cliente.telefono = row['telefono'] or ''
+        cliente.baja = row['baja']
+        return cliente
+    
     @classmethod
     def validate_data(cls, data: Dict[str, Any]) -> bool:
         """
@@ -99,6 +131,57 @@ class Cliente(BaseModel):
         
         return True
     
+    @classmethod
+    def validar_lote(cls, datos: Sequence[Mapping[str, Any]]) -> List[Optional[str]]:
+        """
+        Valida muchos clientes a la vez con el mismo criterio que validate_data.
+        
+        Args:
+            datos: Diccionarios con datos de clientes
+            
+        Returns:
+            List[Optional[str]]: Motivo del rechazo de cada fila, o None si
+            la fila es válida
+        """
+        return cls.validar_columnas(
+            [d.get('nombre') for d in datos],
+            [d.get('apellido') for d in datos],
+            [d.get('dni') for d in datos],
+            [d.get('telefono') for d in datos]
+        )
+    
+    @classmethod
+    def validar_columnas(cls, nombres: Iterable[Optional[str]],
+                         apellidos: Iterable[Optional[str]],
+                         dnis: Iterable[Optional[str]],
+                         telefonos: Iterable[Optional[str]]) -> List[Optional[str]]:
+        """
+        Valida clientes dados por columnas (p. ej. filas de la tabla transpuestas).
+        
+        Args:
+            nombres: Nombres
+            apellidos: Apellidos
+            dnis: DNIs
+            telefonos: Teléfonos (vacíos o None se aceptan)
+            
+        Returns:
+            List[Optional[str]]: Motivo del rechazo de cada fila, o None si
+            la fila es válida
+        """
+        dnis = list(dnis)
+        completos = list(map(all, zip(nombres, apellidos, dnis)))
+        dnis_validos = validar_dnis([dni or '' for dni in dnis])
+        telefonos_validos = validar_telefonos(telefonos, opcional=True)
+        
+        # Cada máscara pisa a la de menor prioridad (el orden de validate_data)
+        motivos: List[Optional[str]] = [None] * len(dnis)
+        for mascara, motivo in ((telefonos_validos, cls.MOTIVO_TELEFONO),
+                                (dnis_validos, cls.MOTIVO_DNI),
+                                (completos, cls.MOTIVO_FALTANTES)):
+            for i in posiciones_invalidas(mascara):
+                motivos[i] = motivo
+        return motivos
+    
     def __str__(self) -> str:
         """Representación en string del cliente."""
         return f"{self.nombre} {self.apellido} (DNI: {self.dni})"
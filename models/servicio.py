@@ -2,8 +2,25 @@
 Modelo Servicio.
 """
 from datetime import datetime, date
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Mapping, Optional, Sequence, Union
 from .base_model import BaseModel
+from utils.validators import posiciones_invalidas, validar_fechas_iso
+
+def _costos_validos(costos: List[Any]) -> List[bool]:
+    """Máscara de costos numéricos no negativos (criterio de validate_data)."""
+    try:
+        # Camino rápido: toda la columna se convierte sin errores
+        return [not costo < 0 for costo in map(float, costos)]
+    except (TypeError, ValueError):
+        pass
+    
+    validos = []
+    for costo in costos:
+        try:
+            validos.append(not float(costo) < 0)
+        except (TypeError, ValueError):
+            validos.append(False)
+    return validos
 
 class Servicio(BaseModel):
     """
@@ -20,8 +37,21 @@ class Servicio(BaseModel):
         baja (bool): Estado del servicio (activo/inactivo)
     """
     
+    __slots__ = ('id', 'descripcion', 'estado', '_fecha_ingreso', '_fecha_estimada',
+                 'costo', 'idCliente', 'baja')
+    
     ESTADOS = ['PENDIENTE', 'EN_PROCESO', 'COMPLETADO', 'CANCELADO']
     
+    # Motivos de rechazo de validar_lote
+    MOTIVO_FALTANTES = "Faltan descripción o cliente"
+    MOTIVO_ESTADO = "Estado inválido"
+    MOTIVO_COSTO = "Costo inválido"
+    MOTIVO_FECHA = "Fecha inválida"
+    
+    # Columnas de la tabla servicio (válidas para proyecciones)
+    COLUMNAS = ('id', 'descripcion', 'estado', 'fecha_ingreso', 'fecha_estimada',
+                'costo', 'idCliente', 'baja')
+    
     def __init__(self, id: Optional[int] = None, descripcion: str = "", 
                  estado: str = "PENDIENTE", fecha_ingreso: Optional[date] = None,
                  fecha_estimada: Optional[date] = None, costo: float = 0.0,
@@ -48,6 +78,44 @@ class Servicio(BaseModel):
         self.idCliente = idCliente
         self.baja = baja
     
+    @staticmethod
+    def _a_fecha(valor: Union[str, date, None]) -> Optional[date]:
+        """Convierte una fecha ISO almacenada como texto en date."""
+        if isinstance(valor, str):
+            return date.fromisoformat(valor) if valor else None
+        return valor
+    
+    @staticmethod
+    def _a_iso(valor: Union[str, date, None]) -> Optional[str]:
+        """Devuelve la fecha en formato ISO sin convertirla si ya es texto."""
+        if isinstance(valor, str):
+            return valor or None
+        return valor.isoformat() if valor else None
+    
+    @property
+    def fecha_ingreso(self) -> Optional[date]:
+        """Fecha de ingreso (se convierte desde texto al leerla por primera vez)."""
+        valor = self._fecha_ingreso
+        if isinstance(valor, str):
+            valor = self._fecha_ingreso = self._a_fecha(valor)
+        return valor
+    
+    @fecha_ingreso.setter
+    def fecha_ingreso(self, valor: Union[str, date, None]) -> None:
+        self._fecha_ingreso = valor
+    
+    @property
+    def fecha_estimada(self) -> Optional[date]:
+        """Fecha estimada (se convierte desde texto al leerla por primera vez)."""
+        valor = self._fecha_estimada
+        if isinstance(valor, str):
+            valor = self._fecha_estimada = self._a_fecha(valor)
+        return valor
+    
+    @fecha_estimada.setter
+    def fecha_estimada(self, valor: Union[str, date, None]) -> None:
+        self._fecha_estimada = valor
+    
     def to_dict(self) -> Dict[str, Any]:
         """
         Convierte el objeto Servicio a diccionario.
@@ -59,8 +127,8 @@ class Servicio(BaseModel):
             'id': self.id,
             'descripcion': self.descripcion,
             'estado': self.estado,
-            'fecha_ingreso': self.fecha_ingreso.isoformat() if self.fecha_ingreso else None,
-            'fecha_estimada': self.fecha_estimada.isoformat() if self.fecha_estimada else None,
+            'fecha_ingreso': self._a_iso(self._fecha_ingreso),
+            'fecha_estimada': self._a_iso(self._fecha_estimada),
             'costo': self.costo,
             'idCliente': self.idCliente,
             'baja': self.baja
@@ -70,11 +138,19 @@ class Servicio(BaseModel):
         """
         Carga los datos desde un diccionario.
         
+        Convierte todo en el momento: las fechas en texto pasan a date y el
+        costo a float (a diferencia de from_row, que deja las fechas como
+        texto hasta que se leen). Las fechas vacías o ausentes no se asignan
+        y la instancia conserva las que tenía.
+        
         Args:
             data: Diccionario con los datos del servicio
             
         Returns:
             Self: Instancia actualizada
+            
+        Raises:
+            ValueError: Si una fecha no está en formato ISO o el costo no es numérico
         """
         self.id = data.get('id')
         self.descripcion = data.get('descripcion', '')
@@ -83,23 +159,42 @@ class Servicio(BaseModel):
         # Convertir strings a fechas
         fecha_ingreso = data.get('fecha_ingreso')
         if fecha_ingreso:
-            if isinstance(fecha_ingreso, str):
-                self.fecha_ingreso = date.fromisoformat(fecha_ingreso)
-            else:
-                self.fecha_ingreso = fecha_ingreso
+            self.fecha_ingreso = self._a_fecha(fecha_ingreso)
         
         fecha_estimada = data.get('fecha_estimada')
         if fecha_estimada:
-            if isinstance(fecha_estimada, str):
-                self.fecha_estimada = date.fromisoformat(fecha_estimada)
-            else:
-                self.fecha_estimada = fecha_estimada
+            self.fecha_estimada = self._a_fecha(fecha_estimada)
         
         self.costo = float(data.get('costo', 0.0))
         self.idCliente = data.get('idCliente')
         self.baja = data.get('baja', False)
         return self
     
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> 'Servicio':
+        """
+        Crea un servicio directamente desde una fila de la base de datos.
+        
+        Evita el diccionario intermedio de from_dict(dict(row)) y deja las
+        fechas como texto hasta que se lean.
+        
+        Args:
+            row: Fila (sqlite3.Row) con las columnas de la tabla servicio
+            
+        Returns:
+            Servicio: Nueva instancia
+        """
+        servicio = cls.__new__(cls)
+        servicio.id = row['id']
+        servicio.descripcion = row['descripcion']
+        servicio.estado = row['estado']
+        servicio._fecha_ingreso = row['fecha_ingreso']
+        servicio._fecha_estimada = row['fecha_estimada']
+        servicio.costo = row['costo']
+        servicio.idCliente = row['idCliente']
+        servicio.baja = row['baja']
+        return servicio
+    
     @classmethod
     def validate_data(cls, data: Dict[str, Any]) -> bool:
         """
@@ -124,7 +219,7 @@ class Servicio(BaseModel):
             costo = float(data.get('costo', 0))
             if costo < 0:
                 return False
-        except ValueError:
+        except (TypeError, ValueError):
             return False
         
         # Validar fechas
@@ -141,6 +236,75 @@ class Servicio(BaseModel):
         
         return True
     
+    @classmethod
+    def validar_lote(cls, datos: Sequence[Mapping[str, Any]]) -> List[Optional[str]]:
+        """
+        Valida muchos servicios a la vez con el mismo criterio que validate_data.
+        
+        Cada criterio se evalúa sobre la columna entera; las fechas, una vez
+        por valor distinto.
+        
+        Args:
+            datos: Diccionarios con datos de servicios
+            
+        Returns:
+            List[Optional[str]]: Motivo del rechazo de cada fila, o None si
+            la fila es válida
+        """
+        completos = list(map(all, zip([d.get('descripcion') for d in datos],
+                                      [d.get('idCliente') for d in datos])))
+        estados_validos = list(map(cls.ESTADOS.__contains__,
+                                   [d.get('estado') for d in datos]))
+        costos_validos = _costos_validos([d.get('costo', 0) for d in datos])
+        ingresos_validos = validar_fechas_iso([d.get('fecha_ingreso') for d in datos])
+        estimadas_validas = validar_fechas_iso([d.get('fecha_estimada') for d in datos])
+        
+        # Cada máscara pisa a la de menor prioridad (el orden de validate_data)
+        motivos: List[Optional[str]] = [None] * len(completos)
+        for mascara, motivo in ((estimadas_validas, cls.MOTIVO_FECHA),
+                                (ingresos_validos, cls.MOTIVO_FECHA),
+                                (costos_validos, cls.MOTIVO_COSTO),
+                                (estados_validos, cls.MOTIVO_ESTADO),
+                                (completos, cls.MOTIVO_FALTANTES)):
+            for i in posiciones_invalidas(mascara):
+                motivos[i] = motivo
+        return motivos
+    
     def __str__(self) -> str:
         """Representación en string del servicio."""
-        return f"Servicio #{self.id}: {self.descripcion} ({self.estado})"
\ No newline at end of file
+        return f"Servicio #{self.id}: {self.descripcion} ({self.estado})"
+
+class ServicioDetalle(Servicio):
+    """
+    Servicio con los datos del cliente resueltos en la misma consulta.
+    
+    Attributes:
+        cliente_nombre (str): Nombre del cliente
+        cliente_apellido (str): Apellido del cliente
+        cliente_dni (str): DNI del cliente
+    """
+    
+    __slots__ = ('cliente_nombre', 'cliente_apellido', 'cliente_dni')
+    
+    @property
+    def cliente_nombre_completo(self) -> str:
+        """Nombre completo del cliente."""
+        return f"{self.cliente_nombre} {self.cliente_apellido}"
+    
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> 'ServicioDetalle':
+        """
+        Crea el servicio desde una fila de servicio unida con cliente.
+        
+        Args:
+            row: Fila con las columnas de servicio más cliente_nombre,
+                cliente_apellido y cliente_dni
+            
+        Returns:
+            ServicioDetalle: Nueva instancia
+        """
+        servicio = super().from_row(row)
+        servicio.cliente_nombre = row['cliente_nombre']
+        servicio.cliente_apellido = row['cliente_apellido']
+        servicio.cliente_dni = row['cliente_dni']
+        return servicio
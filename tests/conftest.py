@@ -0,0 +1,37 @@
+"""
+Configuración común de las pruebas.
+
+DatabaseConnection es un singleton por proceso: todas las pruebas comparten
+una base sintética temporal (benchmarks.datos) que se crea antes de abrir
+la primera conexión. Los logs también van al directorio temporal.
+"""
+import os
+import tempfile
+
+_DIRECTORIO = tempfile.mkdtemp(prefix='pruebas_')
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+os.environ['LOG_DIR'] = os.path.join(_DIRECTORIO, 'logs')
+os.environ['DB_PATH'] = os.path.join(_DIRECTORIO, 'pruebas.db')
+
+import pytest
+
+CLIENTES = 500
+SERVICIOS = 3000
+
+
+@pytest.fixture(scope='session')
+def db():
+    """Base sintética poblada y su DatabaseConnection."""
+    from benchmarks.datos import preparar_base
+    from utils.database import DatabaseConnection
+
+    preparar_base(os.environ['DB_PATH'], CLIENTES, SERVICIOS)
+    return DatabaseConnection()
+
+
+@pytest.fixture(scope='session')
+def qapp():
+    """QApplication sin pantalla para las pruebas que usan Qt."""
+    from PyQt6.QtWidgets import QApplication
+
+    return QApplication.instance() or QApplication([])
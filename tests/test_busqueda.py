@@ -0,0 +1,51 @@
+"""
+Pruebas de la búsqueda de clientes de la vista (buscar_clientes_fulltext).
+"""
+import pytest
+
+from controllers.cliente_controller import ClienteController
+
+LIMITE = 1000
+
+
+@pytest.fixture
+def cliente(db):
+    """Un cliente activo con teléfono."""
+    row = db.get_connection().execute('''
+        SELECT id, apellido, dni, telefono FROM cliente
+        WHERE baja = 0 AND length(dni) = 8 AND length(telefono) >= 10
+        ORDER BY id LIMIT 1
+    ''').fetchone()
+    return dict(row)
+
+
+def _ids(texto, columna=None):
+    return {c.id for c in ClienteController().buscar_clientes_fulltext(texto, LIMITE, columna)}
+
+
+def test_dni_con_puntos(cliente):
+    dni = cliente['dni']
+    assert cliente['id'] in _ids(f'{dni[:2]}.{dni[2:5]}.{dni[5:]}')
+    assert cliente['id'] in _ids(f'{dni[:2]}.{dni[2:5]}.{dni[5:]}', 'dni')
+
+
+def test_parte_del_dni(cliente):
+    parte = cliente['dni'][2:7]
+    encontrados = _ids(parte, 'dni')
+    assert cliente['id'] in encontrados
+    dnis = {c.dni for c in ClienteController().buscar_clientes_fulltext(parte, LIMITE, 'dni')}
+    assert all(parte in dni for dni in dnis)
+
+
+def test_parte_del_telefono_con_separadores(cliente):
+    digitos = ''.join(ch for ch in cliente['telefono'] if ch.isdigit())
+    parte = f'{digitos[-8:-4]}-{digitos[-4:]}'
+    assert cliente['id'] in _ids(parte)
+    assert cliente['id'] in _ids(parte, 'telefono')
+    if digitos[-8:] not in cliente['dni']:
+        assert cliente['id'] not in _ids(parte, 'dni')
+
+
+def test_texto_sigue_usando_el_indice(cliente):
+    assert cliente['id'] in _ids(cliente['apellido'][:4])
+    assert _ids('12345', 'nombre') == set()
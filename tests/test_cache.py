@@ -0,0 +1,104 @@
+"""
+Pruebas de la caché de modelos (utils.cache.ModelCache).
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from controllers.cliente_controller import ClienteController
+from utils import cache as modulo_cache
+from utils.cache import ModelCache
+
+
+@pytest.fixture
+def reloj(monkeypatch):
+    """Reloj manual para controlar el vencimiento."""
+    actual = SimpleNamespace(valor=1000.0)
+    monkeypatch.setattr(modulo_cache, 'time', SimpleNamespace(monotonic=lambda: actual.valor))
+    return actual
+
+
+def test_vencimiento_por_ttl(reloj):
+    cache = ModelCache(max_size=10, ttl=5)
+    cache.put(1, 'a')
+    reloj.valor += 4.9
+    assert cache.get(1) == 'a'
+    reloj.valor += 0.2
+    assert cache.get(1) is None
+    assert cache.stats()['size'] == 0
+
+
+def test_ttl_cero_no_vence(reloj):
+    cache = ModelCache(max_size=10, ttl=0)
+    cache.put(1, 'a')
+    reloj.valor += 10 ** 6
+    assert cache.get(1) == 'a'
+
+
+def test_descarta_el_menos_usado():
+    cache = ModelCache(max_size=3, ttl=0)
+    for clave in (1, 2, 3):
+        cache.put(clave, str(clave))
+    assert cache.get(1) == '1'
+    cache.put(4, '4')
+    assert cache.get(2) is None
+    assert [cache.get(clave) for clave in (1, 3, 4)] == ['1', '3', '4']
+
+    # Volver a guardar una clave también la marca como usada
+    cache.put(1, 'uno')
+    cache.put(5, '5')
+    assert cache.get(3) is None
+    assert cache.get(1) == 'uno'
+
+
+def test_tamanio_cero_desactiva_la_cache():
+    cache = ModelCache(max_size=0)
+    cache.put(1, 'a')
+    assert cache.get(1) is None
+
+
+def test_invalidate_y_clear():
+    cache = ModelCache(max_size=10, ttl=0)
+    for clave in (1, 2, 3, 4):
+        cache.put(clave, str(clave))
+    cache.invalidate(1)
+    cache.invalidate(99)
+    cache.invalidate_many([2, 3, 98])
+    assert [cache.get(clave) for clave in (1, 2, 3, 4)] == [None, None, None, '4']
+
+    cache.clear()
+    assert cache.get(4) is None
+    assert cache.stats()['size'] == 0
+
+
+def test_estadisticas():
+    cache = ModelCache(max_size=10, ttl=0)
+    assert cache.stats()['hit_rate'] == 0.0
+    cache.put(1, 'a')
+    cache.get(1)
+    cache.get(1)
+    cache.get(2)
+    cache.clear()
+    cache.get(1)
+    assert cache.stats() == {
+        'hits': 2, 'misses': 2, 'hit_rate': 0.5, 'size': 0, 'max_size': 10
+    }
+
+
+def test_obtener_cliente_devuelve_una_copia(db):
+    controller = ClienteController()
+    controller.limpiar_cache()
+    cliente_id = db.get_connection().execute(
+        'SELECT id FROM cliente WHERE baja = 0 LIMIT 1'
+    ).fetchone()[0]
+
+    primero = controller.obtener_cliente(cliente_id)
+    nombre = primero.nombre
+    primero.nombre = 'Modificado sin guardar'
+
+    segundo = controller.obtener_cliente(cliente_id)
+    assert controller.estadisticas_cache()['hits'] >= 1
+    assert segundo is not primero
+    assert segundo.nombre == nombre
+    segundo.nombre = 'Otro cambio'
+    assert controller.obtener_cliente(cliente_id).nombre == nombre
@@ -0,0 +1,78 @@
+"""
+Pruebas de las inserciones masivas de clientes y las consultas IN (...).
+"""
+import sqlite3
+
+import pytest
+
+from benchmarks.datos import generar_clientes
+from controllers.cliente_controller import ClienteController
+
+# Límite de parámetros por sentencia de SQLite anterior a 3.32
+LIMITE_ANTIGUO = 999
+
+
+@pytest.fixture
+def limite_antiguo(db):
+    """Aplica a la conexión del hilo el límite de parámetros antiguo."""
+    conn = db.get_connection()
+    if not hasattr(conn, 'setlimit'):
+        pytest.skip("Connection.setlimit requiere Python 3.11")
+    anterior = conn.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, LIMITE_ANTIGUO)
+    yield
+    conn.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, anterior)
+
+
+def _trigger_fts(db) -> bool:
+    fila = db.get_connection().execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'cliente_fts_ai'"
+    ).fetchone()
+    return fila is not None
+
+
+def _indexados(db, dni: str) -> int:
+    return db.get_connection().execute(
+        'SELECT COUNT(*) FROM cliente_fts WHERE cliente_fts MATCH ?', (f'dni:"{dni}"',)
+    ).fetchone()[0]
+
+
+def test_insercion_masiva_conserva_el_trigger_fts(db, limite_antiguo):
+    controller = ClienteController()
+    clientes = list(generar_clientes(2000, desde=100_000))
+    assert len(clientes) > controller.MIN_FILAS_FTS_DIFERIDO
+
+    resultado = controller.insertar_clientes_lote(clientes)
+
+    assert resultado['insertados'] == len(clientes)
+    assert _trigger_fts(db)
+    conn = db.get_connection()
+    assert conn.execute('SELECT COUNT(*) FROM cliente_fts_pausa').fetchone()[0] == 0
+    assert _indexados(db, clientes[0]['dni']) == 1
+    assert _indexados(db, clientes[-1]['dni']) == 1
+
+    # Después de la pausa el trigger vuelve a indexar cada inserción
+    nuevo = next(generar_clientes(1, desde=200_000))
+    assert controller.insertar_clientes_lote([nuevo])['insertados'] == 1
+    assert _indexados(db, nuevo['dni']) == 1
+
+
+def test_insercion_masiva_repetida_respeta_el_limite(db, limite_antiguo):
+    controller = ClienteController()
+    clientes = list(generar_clientes(2000, desde=300_000))
+    controller.insertar_clientes_lote(clientes)
+
+    resultado = controller.insertar_clientes_lote(clientes, 'upsert')
+
+    assert resultado['actualizados'] == len(clientes)
+
+
+def test_obtener_ids_existentes_respeta_el_limite(db, limite_antiguo):
+    ids = list(range(1, 5001))
+    # Otras pruebas eliminan clientes: los ids no son necesariamente contiguos
+    esperados = {row[0] for row in db.get_connection().execute(
+        'SELECT id FROM cliente WHERE id <= 5000'
+    )}
+
+    existentes = ClienteController().obtener_ids_existentes(ids)
+
+    assert existentes == esperados
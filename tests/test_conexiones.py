@@ -0,0 +1,79 @@
+"""
+Pruebas del pool de conexiones por hilo.
+"""
+import threading
+
+from PyQt6.QtCore import QThreadPool
+
+from controllers.cliente_controller import ClienteController
+from utils.workers import TareaCancelable, TareaConsulta
+
+TAREAS = 50
+
+
+def _pool() -> QThreadPool:
+    pool = QThreadPool()
+    pool.setMaxThreadCount(2)
+    return pool
+
+
+def test_tareas_consulta_no_acumulan_conexiones(db, qapp):
+    pool = _pool()
+    controller = ClienteController()
+    pool.start(TareaConsulta(0, controller.obtener_estadisticas))
+    pool.waitForDone()
+    antes = len(db._connections)
+
+    for generacion in range(1, TAREAS + 1):
+        pool.start(TareaConsulta(generacion, controller.obtener_estadisticas))
+    pool.waitForDone()
+
+    assert len(db._connections) == antes
+
+
+def test_tareas_cancelables_no_acumulan_conexiones(db, qapp):
+    pool = _pool()
+    controller = ClienteController()
+
+    def contar(on_progress, is_cancelled):
+        return controller.obtener_estadisticas()
+
+    pool.start(TareaCancelable(contar))
+    pool.waitForDone()
+    antes = len(db._connections)
+
+    for _ in range(TAREAS):
+        pool.start(TareaCancelable(contar))
+    pool.waitForDone()
+
+    assert len(db._connections) == antes
+
+
+def test_tarea_con_error_libera_la_conexion(db, qapp):
+    pool = _pool()
+    antes = len(db._connections)
+
+    def fallar():
+        db.get_connection().execute('SELECT * FROM tabla_inexistente')
+
+    for generacion in range(TAREAS):
+        pool.start(TareaConsulta(generacion, fallar))
+    pool.waitForDone()
+
+    assert len(db._connections) == antes
+
+
+def test_conexiones_de_hilos_terminados_se_descartan(db):
+    db.get_connection()
+    antes = len(db._connections)
+
+    for _ in range(TAREAS):
+        # Sin release_connection(): el hilo termina con la conexión abierta
+        hilo = threading.Thread(target=lambda: db.get_connection().execute('SELECT 1'))
+        hilo.start()
+        hilo.join()
+
+    # Abrir una conexión nueva descarta las de hilos terminados
+    db.release_connection()
+    db.get_connection()
+    assert len(db._connections) == antes
@@ -0,0 +1,107 @@
+"""
+Pruebas de los cambios de estado masivos de ServicioController.
+"""
+import sqlite3
+from datetime import date, timedelta
+
+import pytest
+
+from controllers.servicio_controller import ServicioController
+
+
+@pytest.fixture
+def controller(db):
+    return ServicioController()
+
+
+def _estados(db, ids):
+    marcadores = ', '.join('?' * len(ids))
+    return {row['id']: row['estado'] for row in db.get_connection().execute(
+        f'SELECT id, estado FROM servicio WHERE id IN ({marcadores})', ids
+    )}
+
+
+def _ids_activos(db, estado, cantidad):
+    return [row[0] for row in db.get_connection().execute(
+        'SELECT id FROM servicio WHERE baja = 0 AND estado = ? ORDER BY id LIMIT ?',
+        (estado, cantidad)
+    )]
+
+
+def _fallar(*args, **kwargs):
+    raise sqlite3.OperationalError("database is locked")
+
+
+def test_actualizar_estado_servicios_en_varios_bloques(db, controller, monkeypatch):
+    ids = _ids_activos(db, 'PENDIENTE', 25)
+    assert len(ids) == 25
+    monkeypatch.setattr(controller, 'LOTE_IDS', 7)
+    baja = db.get_connection().execute(
+        "SELECT id FROM servicio WHERE baja = 1 AND estado != 'CANCELADO' LIMIT 1"
+    ).fetchone()[0]
+
+    # Repetidos, inexistentes y dados de baja no se cuentan
+    pedidos = ids + ids[:5] + [10 ** 9, baja]
+    assert controller.actualizar_estado_servicios(pedidos, 'CANCELADO') == len(ids)
+    assert set(_estados(db, ids).values()) == {'CANCELADO'}
+    assert _estados(db, [baja])[baja] != 'CANCELADO'
+
+    # Los que ya tienen el estado nuevo tampoco se cuentan
+    assert controller.actualizar_estado_servicios(ids, 'CANCELADO') == 0
+    assert controller.actualizar_estado_servicios(ids, 'PENDIENTE') == len(ids)
+
+
+def test_actualizar_estado_servicios_sin_cambios(controller):
+    assert controller.actualizar_estado_servicios([1, 2], 'INEXISTENTE') == 0
+    assert controller.actualizar_estado_servicios([], 'PENDIENTE') == 0
+
+
+def test_actualizar_estado_servicios_error(db, controller, monkeypatch):
+    ids = _ids_activos(db, 'PENDIENTE', 3)
+    monkeypatch.setattr(controller.db, 'unit_of_work', _fallar)
+    assert controller.actualizar_estado_servicios(ids, 'CANCELADO') == -1
+    monkeypatch.undo()
+    assert set(_estados(db, ids).values()) == {'PENDIENTE'}
+
+
+def test_actualizar_estado_por_filtro(db, controller):
+    cliente_id = db.get_connection().execute(
+        "SELECT idCliente FROM servicio WHERE baja = 0 AND estado = 'PENDIENTE' LIMIT 1"
+    ).fetchone()[0]
+    pendientes = db.get_connection().execute('''
+        SELECT COUNT(*) FROM servicio
+        WHERE idCliente = ? AND baja = 0 AND estado = 'PENDIENTE'
+    ''', (cliente_id,)).fetchone()[0]
+
+    assert controller.actualizar_estado_por_filtro(
+        'EN_PROCESO', estado='PENDIENTE', cliente_id=cliente_id) == pendientes
+    assert controller.actualizar_estado_por_filtro(
+        'EN_PROCESO', estado='PENDIENTE', cliente_id=cliente_id) == 0
+    assert controller.actualizar_estado_por_filtro('EN_PROCESO', estado='OTRO') == 0
+
+
+def test_actualizar_estado_por_filtro_error(controller, monkeypatch):
+    monkeypatch.setattr(controller.db, 'unit_of_work', _fallar)
+    assert controller.actualizar_estado_por_filtro('COMPLETADO', estado='PENDIENTE') == -1
+    assert controller.completar_servicios_antiguos(30) == -1
+
+
+def test_completar_servicios_antiguos_excluye_el_dia_limite(db, controller):
+    # Fechas anteriores a todos los datos sintéticos: solo cuentan estos servicios
+    dias = (date.today() - date(2001, 1, 1)).days
+    cliente_id = db.get_connection().execute('SELECT MIN(id) FROM cliente').fetchone()[0]
+
+    def crear(antiguedad):
+        fecha = (date.today() - timedelta(days=antiguedad)).isoformat()
+        return controller.crear_servicio({
+            'descripcion': f'Ingresado hace {antiguedad} días', 'estado': 'EN_PROCESO',
+            'fecha_ingreso': fecha, 'costo': 10, 'idCliente': cliente_id,
+        }).id
+
+    exacto, anterior = crear(dias), crear(dias + 1)
+
+    assert controller.completar_servicios_antiguos(dias) == 1
+    assert _estados(db, [exacto, anterior]) == {exacto: 'EN_PROCESO', anterior: 'COMPLETADO'}
+
+    assert controller.completar_servicios_antiguos(dias - 1) == 1
+    assert _estados(db, [exacto])[exacto] == 'COMPLETADO'
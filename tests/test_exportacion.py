@@ -0,0 +1,81 @@
+"""
+Pruebas de la exportación a CSV en streaming.
+"""
+from pathlib import Path
+
+import pytest
+
+from utils.export import CLIENTES_CSV_FIELDS, ReportGenerator
+
+
+class _Lotes:
+    """Generador de lotes que registra si se cerró antes de terminar."""
+
+    def __init__(self, lotes: int, fallar_en: int = -1):
+        self.cerrado = False
+        self._generador = self._generar(lotes, fallar_en)
+
+    def _generar(self, lotes, fallar_en):
+        try:
+            for i in range(lotes):
+                if i == fallar_en:
+                    raise OSError("disco lleno")
+                yield [('Ana', 'Pérez', str(10000000 + i), '', 'Activo')]
+        finally:
+            self.cerrado = True
+
+    def __iter__(self):
+        return self._generador
+
+    def close(self):
+        self._generador.close()
+
+
+@pytest.fixture
+def generador(tmp_path, monkeypatch):
+    # ReportGenerator crea exports/ en el directorio actual
+    monkeypatch.chdir(tmp_path)
+    reportes = ReportGenerator()
+    reportes.export_dir = tmp_path / 'exports'
+    return reportes
+
+
+def test_exportacion_completa(generador, tmp_path):
+    ruta = generador.export_csv_stream('clientes', CLIENTES_CSV_FIELDS, _Lotes(3))
+    assert list((tmp_path / 'exports').iterdir()) == [Path(ruta)]
+
+
+def test_cancelar_cierra_el_generador_y_borra_el_parcial(generador, tmp_path):
+    lotes = _Lotes(10)
+    escritas = []
+    ruta = generador.export_csv_stream(
+        'clientes', CLIENTES_CSV_FIELDS, lotes,
+        on_progress=lambda actual, total: escritas.append(actual),
+        is_cancelled=lambda: len(escritas) >= 2
+    )
+    assert ruta == ""
+    assert lotes.cerrado
+    assert list((tmp_path / 'exports').iterdir()) == []
+
+
+def test_fallo_propaga_el_error_y_borra_el_parcial(generador, tmp_path):
+    lotes = _Lotes(10, fallar_en=4)
+    with pytest.raises(OSError, match="disco lleno"):
+        generador.export_csv_stream('clientes', CLIENTES_CSV_FIELDS, lotes)
+    assert lotes.cerrado
+    assert list((tmp_path / 'exports').iterdir()) == []
+
+
+def test_cancelar_despues_del_ultimo_lote_conserva_el_archivo(generador, tmp_path):
+    lotes = _Lotes(3)
+    escritas = []
+    ruta = generador.export_csv_stream(
+        'clientes', CLIENTES_CSV_FIELDS, lotes,
+        on_progress=lambda actual, total: escritas.append(actual),
+        # Se pide cancelar justo al terminar de escribir el último lote
+        is_cancelled=lambda: len(escritas) >= 3
+    )
+    assert ruta
+    assert list((tmp_path / 'exports').iterdir()) == [Path(ruta)]
+    with open(ruta, encoding='utf-8') as archivo:
+        assert len(archivo.read().splitlines()) == 4
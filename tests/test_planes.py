@@ -0,0 +1,107 @@
+"""
+Planes de ejecución de las consultas frecuentes de los controladores.
+
+Cada caso llama al método del controlador sobre la base sintética, captura
+las sentencias que ejecuta (set_trace_callback, con los parámetros ya
+expandidos) y revisa su EXPLAIN QUERY PLAN: ningún paso puede recorrer
+entero cliente o servicio. Las únicas excepciones documentadas son las
+búsquedas con LIKE '%valor%' (buscar_clientes y la búsqueda por dígitos de
+DNI o teléfono de buscar_clientes_fulltext), que por el comodín inicial no
+pueden usar un índice B-tree sobre la columna buscada.
+"""
+import re
+from datetime import date
+
+import pytest
+
+from controllers.analitica_controller import AnaliticaController
+from controllers.cliente_controller import ClienteController
+from controllers.servicio_controller import ServicioController
+
+_TABLA_CON_ALIAS = re.compile(
+    r'\b(?:FROM|JOIN)\s+(cliente|servicio)\b(?:\s+(?:AS\s+)?(\w+))?', re.IGNORECASE
+)
+_PALABRAS_CLAVE = {'WHERE', 'JOIN', 'LEFT', 'INNER', 'ON', 'ORDER', 'GROUP',
+                   'LIMIT', 'USING', 'AS'}
+
+# (id, llamada, se permite recorrer la tabla)
+CASOS = [
+    ('obtener_cliente', lambda c, s, a: c.obtener_cliente(10), False),
+    ('obtener_todos_clientes', lambda c, s, a: c.obtener_todos_clientes(), False),
+    ('obtener_clientes_paginados', lambda c, s, a: c.obtener_clientes_paginados(), False),
+    ('obtener_ultimo_cliente', lambda c, s, a: c.obtener_ultimo_cliente(), False),
+    ('buscar_clientes', lambda c, s, a: c.buscar_clientes('dni', '123'), True),
+    ('buscar_clientes_fulltext', lambda c, s, a: c.buscar_clientes_fulltext('ana'), False),
+    ('buscar_clientes_fulltext_digitos',
+     lambda c, s, a: c.buscar_clientes_fulltext('12.345'), True),
+    ('obtener_ids_existentes', lambda c, s, a: c.obtener_ids_existentes([1, 2, 3]), False),
+    ('obtener_servicio', lambda c, s, a: s.obtener_servicio(5), False),
+    ('obtener_servicios_cliente', lambda c, s, a: s.obtener_servicios_cliente(7), False),
+    ('obtener_todos_servicios', lambda c, s, a: s.obtener_todos_servicios(), False),
+    ('obtener_servicios_paginados', lambda c, s, a: s.obtener_servicios_paginados(), False),
+    ('obtener_servicios_paginados_estado',
+     lambda c, s, a: s.obtener_servicios_paginados(estado='PENDIENTE'), False),
+    ('obtener_servicios_con_cliente', lambda c, s, a: s.obtener_servicios_con_cliente(), False),
+    ('obtener_servicios_con_cliente_estado',
+     lambda c, s, a: s.obtener_servicios_con_cliente(estado='PENDIENTE'), False),
+    ('obtener_servicios_con_cliente_cliente',
+     lambda c, s, a: s.obtener_servicios_con_cliente(cliente_id=7), False),
+    ('obtener_servicios_con_cliente_fechas',
+     lambda c, s, a: s.obtener_servicios_con_cliente(desde=date(2024, 1, 1),
+                                                     hasta=date(2024, 6, 30)), False),
+    ('obtener_servicios_por_estado',
+     lambda c, s, a: s.obtener_servicios_por_estado('PENDIENTE'), False),
+    ('obtener_tendencia',
+     lambda c, s, a: a.obtener_tendencia(date(2024, 1, 1), date(2024, 12, 31)), False),
+]
+
+
+@pytest.fixture(scope='module')
+def controladores(db):
+    return ClienteController(), ServicioController(), AnaliticaController()
+
+
+def _consultas(db, llamada, controladores):
+    """Sentencias SELECT ejecutadas por la llamada, con sus parámetros."""
+    sentencias = []
+    conn = db.get_connection()
+    conn.set_trace_callback(sentencias.append)
+    try:
+        llamada(*controladores)
+    finally:
+        conn.set_trace_callback(None)
+    return [' '.join(sql.split()) for sql in sentencias
+            if sql.lstrip().upper().startswith(('SELECT', 'WITH'))]
+
+
+def _nombres_de_tablas(sql):
+    """Nombres con los que aparecen cliente y servicio en el plan."""
+    nombres = set()
+    for tabla, alias in _TABLA_CON_ALIAS.findall(sql):
+        nombres.add(tabla.lower())
+        if alias and alias.upper() not in _PALABRAS_CLAVE:
+            nombres.add(alias)
+    return nombres
+
+
+def _recorridos_completos(sql, plan):
+    """Pasos del plan que recorren cliente o servicio enteros."""
+    nombres = _nombres_de_tablas(sql)
+    return [paso for paso in plan
+            if paso.startswith('SCAN ') and paso.split()[1] in nombres]
+
+
+@pytest.mark.parametrize('llamada, permitir_recorrido',
+                         [caso[1:] for caso in CASOS], ids=[caso[0] for caso in CASOS])
+def test_consulta_usa_indice(db, controladores, llamada, permitir_recorrido):
+    consultas = _consultas(db, llamada, controladores)
+    assert consultas, "la llamada no ejecutó ninguna consulta"
+    for sql in consultas:
+        recorridos = _recorridos_completos(sql, db.explain_query_plan(sql))
+        if not permitir_recorrido:
+            assert not recorridos, f"{sql}\n{recorridos}"
+
+
+def test_detecta_recorrido_completo(db):
+    sql = 'SELECT * FROM servicio s WHERE s.descripcion = 1'
+    assert _recorridos_completos(sql, db.explain_query_plan(sql)) == ['SCAN s']
@@ -0,0 +1,55 @@
+"""
+Pruebas del perfilador de consultas.
+"""
+import glob
+import os
+from types import SimpleNamespace
+
+import config
+from utils import logger as registro
+from utils.profiler import _nombre_calificado, logger_lentas
+
+
+class _Controlador:
+    pass
+
+
+def _marco(nombre: str, **locales) -> SimpleNamespace:
+    """Marco sin co_qualname, como en Python 3.8-3.10."""
+    return SimpleNamespace(f_code=SimpleNamespace(co_name=nombre), f_locals=locales)
+
+
+def test_nombre_calificado_sin_co_qualname():
+    assert _nombre_calificado(_marco('listar', self=_Controlador())) == '_Controlador.listar'
+    assert _nombre_calificado(_marco('crear', cls=_Controlador)) == '_Controlador.crear'
+    assert _nombre_calificado(_marco('funcion')) == 'funcion'
+
+
+def test_nombre_calificado_con_co_qualname():
+    class Clase:
+        def metodo(self):
+            import sys
+            return _nombre_calificado(sys._getframe())
+
+    assert Clase().metodo().endswith('Clase.metodo')
+
+
+def _contenido(prefijo: str) -> str:
+    texto = ''
+    for ruta in glob.glob(os.path.join(config.LOG_DIR, f'{prefijo}_*.log')):
+        with open(ruta, encoding='utf-8') as archivo:
+            texto += archivo.read()
+    return texto
+
+
+def test_consultas_lentas_van_a_su_propio_archivo():
+    logger_lentas.warning("consulta lenta de prueba %s", 123)
+    registro.setup_logger('pruebas').warning("registro de la aplicación de prueba")
+    # El listener marca cada registro procesado con task_done()
+    registro._cola.join()
+
+    lentas = _contenido(registro.LOGGER_CONSULTAS_LENTAS)
+    aplicacion = _contenido('app')
+    assert "consulta lenta de prueba 123" in lentas
+    assert "consulta lenta de prueba" not in aplicacion
+    assert "registro de la aplicación de prueba" in aplicacion
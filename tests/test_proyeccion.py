@@ -0,0 +1,39 @@
+"""
+Pruebas de la proyección de columnas (fields=) de los controladores.
+"""
+import pytest
+
+from controllers.cliente_controller import ClienteController
+from controllers.servicio_controller import ServicioController
+
+LLAMADAS = [
+    ('obtener_todos_clientes', lambda c, s, f: c.obtener_todos_clientes(fields=f)),
+    ('obtener_clientes_paginados', lambda c, s, f: c.obtener_clientes_paginados(fields=f)),
+    ('buscar_clientes', lambda c, s, f: c.buscar_clientes('nombre', 'a', fields=f)),
+    ('buscar_clientes_fulltext', lambda c, s, f: c.buscar_clientes_fulltext('ana', fields=f)),
+    ('buscar_clientes_fulltext_digitos',
+     lambda c, s, f: c.buscar_clientes_fulltext('12.345', fields=f)),
+    ('obtener_servicios_cliente', lambda c, s, f: s.obtener_servicios_cliente(1, fields=f)),
+    ('obtener_todos_servicios', lambda c, s, f: s.obtener_todos_servicios(fields=f)),
+    ('obtener_servicios_paginados', lambda c, s, f: s.obtener_servicios_paginados(fields=f)),
+    ('obtener_servicios_por_estado',
+     lambda c, s, f: s.obtener_servicios_por_estado('PENDIENTE', fields=f)),
+]
+
+
+@pytest.fixture(scope='module')
+def controladores(db):
+    return ClienteController(), ServicioController()
+
+
+@pytest.mark.parametrize('llamada', [l[1] for l in LLAMADAS], ids=[l[0] for l in LLAMADAS])
+def test_columna_inexistente_llega_al_llamador(controladores, llamada):
+    with pytest.raises(ValueError, match='nombre_completo'):
+        llamada(*controladores, ['id', 'nombre_completo'])
+
+
+@pytest.mark.parametrize('llamada', [l[1] for l in LLAMADAS], ids=[l[0] for l in LLAMADAS])
+def test_proyeccion_valida(controladores, llamada):
+    resultado = llamada(*controladores, ['id'])
+    filas = getattr(resultado, 'items', resultado)
+    assert all(fila.keys()[0] == 'id' for fila in filas)
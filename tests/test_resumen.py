@@ -0,0 +1,140 @@
+"""
+Pruebas de las tablas de resumen del dashboard (resumen_servicio y
+resumen_cliente), mantenidas por triggers y recalculables con
+DatabaseConnection.rebuild_summary (python main.py --rebuild-stats).
+"""
+import pytest
+
+from benchmarks.datos import generar_clientes
+from controllers.cliente_controller import ClienteController
+from controllers.servicio_controller import ServicioController
+
+
+def _resumen_servicio(conn):
+    """Filas de resumen_servicio con algún servicio."""
+    return {
+        (row['estado'], row['baja']): (row['cantidad'], round(row['costo_total'], 2))
+        for row in conn.execute('SELECT * FROM resumen_servicio WHERE cantidad != 0')
+    }
+
+
+def _servicios_agrupados(conn):
+    """Los mismos totales recalculados sobre la tabla servicio."""
+    return {
+        (row[0], row[1]): (row[2], round(row[3], 2))
+        for row in conn.execute('''
+            SELECT IFNULL(estado, ''), CASE WHEN baja THEN 1 ELSE 0 END,
+                   COUNT(*), IFNULL(SUM(costo), 0)
+            FROM servicio GROUP BY 1, 2
+        ''')
+    }
+
+
+def _resumen_cliente(conn):
+    return {row['baja']: row['cantidad']
+            for row in conn.execute('SELECT * FROM resumen_cliente WHERE cantidad != 0')}
+
+
+def _clientes_agrupados(conn):
+    return {row[0]: row[1] for row in conn.execute(
+        'SELECT CASE WHEN baja THEN 1 ELSE 0 END, COUNT(*) FROM cliente GROUP BY 1'
+    )}
+
+
+def _coinciden(conn):
+    assert _resumen_servicio(conn) == _servicios_agrupados(conn)
+    assert _resumen_cliente(conn) == _clientes_agrupados(conn)
+
+
+@pytest.fixture
+def controladores(db):
+    return ClienteController(), ServicioController()
+
+
+def _servicio(id_cliente, estado='PENDIENTE', costo=100.0, **cambios):
+    datos = {
+        'descripcion': 'Prueba de resumen', 'estado': estado,
+        'fecha_ingreso': '2024-03-01', 'fecha_estimada': '2024-03-10',
+        'costo': costo, 'idCliente': id_cliente, 'baja': False,
+    }
+    datos.update(cambios)
+    return datos
+
+
+def test_triggers_de_servicio(db, controladores):
+    clientes, servicios = controladores
+    conn = db.get_connection()
+    _coinciden(conn)
+
+    a, b = [clientes.crear_cliente(datos)
+            for datos in generar_clientes(2, desde=400_000)]
+    creados = [servicios.crear_servicio(_servicio(a.id, costo=costo))
+               for costo in (100.0, 250.5, 0.0)]
+    _coinciden(conn)
+
+    primero, segundo, tercero = (s.id for s in creados)
+    # Cambios de estado, costo y cliente
+    assert servicios.actualizar_servicio(
+        primero, _servicio(b.id, estado='EN_PROCESO', costo=80.25))
+    assert servicios.actualizar_servicio(
+        segundo, _servicio(a.id, estado='COMPLETADO', costo=300.0))
+    _coinciden(conn)
+
+    # Baja lógica, reactivación y baja lógica con cambio de costo
+    assert servicios.eliminar_servicio(primero)
+    _coinciden(conn)
+    assert servicios.actualizar_servicio(
+        primero, _servicio(b.id, estado='CANCELADO', costo=10.0, baja=False))
+    assert servicios.actualizar_servicio(
+        tercero, _servicio(b.id, costo=55.5, baja=True))
+    _coinciden(conn)
+
+    # Eliminación física de activos y de dados de baja
+    assert servicios.eliminar_servicio(segundo, logico=False)
+    assert servicios.eliminar_servicio(tercero, logico=False)
+    _coinciden(conn)
+
+
+def test_triggers_de_cliente(db, controladores):
+    clientes, _ = controladores
+    conn = db.get_connection()
+
+    creados = [clientes.crear_cliente(datos)
+               for datos in generar_clientes(3, desde=400_100)]
+    _coinciden(conn)
+
+    uno, dos, tres = creados
+    assert clientes.eliminar_cliente(uno.id)
+    _coinciden(conn)
+
+    datos = uno.to_dict()
+    datos['baja'] = False
+    assert clientes.actualizar_cliente(uno.id, datos)
+    datos = dos.to_dict()
+    datos['nombre'] = 'Otro'
+    assert clientes.actualizar_cliente(dos.id, datos)
+    _coinciden(conn)
+
+    assert clientes.eliminar_cliente(dos.id)
+    assert clientes.eliminar_cliente(dos.id, logico=False)
+    assert clientes.eliminar_cliente(tres.id, logico=False)
+    _coinciden(conn)
+
+
+@pytest.mark.parametrize('danio', [
+    ['DELETE FROM resumen_servicio', 'DELETE FROM resumen_cliente'],
+    ["UPDATE resumen_servicio SET cantidad = cantidad + 7, costo_total = -1",
+     "UPDATE resumen_cliente SET cantidad = 0",
+     "INSERT OR REPLACE INTO resumen_servicio VALUES ('FANTASMA', 0, 3, 9.5)"],
+], ids=['vaciadas', 'corruptas'])
+def test_rebuild_summary_restaura_los_totales(db, danio):
+    conn = db.get_connection()
+    with db.unit_of_work() as uow:
+        for sentencia in danio:
+            uow.execute(sentencia)
+    assert _resumen_servicio(conn) != _servicios_agrupados(conn)
+
+    db.rebuild_summary()
+    _coinciden(conn)
+    estadisticas = ClienteController().obtener_estadisticas()
+    assert estadisticas['total'] == conn.execute('SELECT COUNT(*) FROM cliente').fetchone()[0]
@@ -0,0 +1,86 @@
+"""
+Pruebas de la actualización de rollups diarios.
+"""
+import pytest
+
+from controllers.analitica_controller import AnaliticaController
+
+
+@pytest.fixture
+def analitica(db):
+    controlador = AnaliticaController()
+    assert controlador.actualizar_rollups() >= 0
+    return controlador
+
+
+def _contar(db, tabla):
+    return db.get_connection().execute(f'SELECT COUNT(*) FROM {tabla}').fetchone()[0]
+
+
+def test_sin_pendientes_no_abre_transaccion(db, analitica):
+    sentencias = []
+    conn = db.get_connection()
+    conn.set_trace_callback(sentencias.append)
+    try:
+        assert analitica.actualizar_rollups() == 0
+    finally:
+        conn.set_trace_callback(None)
+    assert not any(sql.startswith('BEGIN') for sql in sentencias)
+
+
+def test_con_pendientes_recalcula(db, analitica):
+    conn = db.get_connection()
+    dia = conn.execute('SELECT MIN(fecha_ingreso) FROM servicio').fetchone()[0]
+    with db.unit_of_work() as uow:
+        uow.execute('INSERT INTO rollup_pendiente (dia) VALUES (?)', (dia,))
+    assert analitica.actualizar_rollups() == 1
+    assert _contar(db, 'rollup_pendiente') == 0
+
+
+def test_reconstruir_revierte_si_falla_el_recalculo(db, analitica, monkeypatch):
+    rollups = _contar(db, 'rollup_servicio_diario')
+    assert rollups > 0
+
+    def fallar(conn, dias):
+        raise RuntimeError("fallo de prueba")
+
+    monkeypatch.setattr(AnaliticaController, '_recalcular_dias', staticmethod(fallar))
+    assert analitica.reconstruir_rollups() == -1
+    assert _contar(db, 'rollup_servicio_diario') == rollups
+    assert _contar(db, 'rollup_pendiente') == 0
+
+
+def test_reconstruir(db, analitica):
+    rollups = _contar(db, 'rollup_servicio_diario')
+    assert analitica.reconstruir_rollups() > 0
+    assert _contar(db, 'rollup_servicio_diario') == rollups
+
+
+def test_lote_registra_cada_dia_una_vez(db, analitica):
+    from controllers.servicio_controller import ServicioController
+
+    controller = ServicioController()
+    cliente_id = db.get_connection().execute('SELECT MIN(id) FROM cliente').fetchone()[0]
+    dias = ['2022-05-01', '2022-05-02', '2022-05-03']
+    lote = [{'descripcion': f'Lote {i}', 'estado': 'PENDIENTE', 'fecha_ingreso': dias[i % 3],
+             'costo': 10, 'idCliente': cliente_id} for i in range(300)]
+
+    assert controller.insertar_servicios_lote(lote) == 300
+    conn = db.get_connection()
+    assert sorted(row[0] for row in conn.execute('SELECT dia FROM rollup_pendiente')) == dias
+    assert _contar(db, 'rollup_pausa') == 0
+
+    # Fuera del lote el trigger sigue registrando cada inserción
+    controller.crear_servicio(dict(lote[0], fecha_ingreso='2022-05-04'))
+    assert _contar(db, 'rollup_pendiente') == 4
+
+    assert analitica.actualizar_rollups() == 4
+    cantidades = dict(conn.execute('''
+        SELECT dia, SUM(cantidad) FROM rollup_servicio_diario
+        WHERE dia BETWEEN '2022-05-01' AND '2022-05-04' GROUP BY dia
+    ''').fetchall())
+    assert cantidades == dict(conn.execute('''
+        SELECT fecha_ingreso, COUNT(*) FROM servicio
+        WHERE baja = 0 AND fecha_ingreso BETWEEN '2022-05-01' AND '2022-05-04'
+        GROUP BY fecha_ingreso
+    ''').fetchall())
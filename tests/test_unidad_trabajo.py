@@ -0,0 +1,100 @@
+"""
+Pruebas de DatabaseConnection.unit_of_work, commit() y on_commit().
+"""
+import threading
+
+import pytest
+
+from controllers.servicio_controller import ServicioController
+
+
+@pytest.fixture
+def tabla(db):
+    """Tabla auxiliar vacía para las pruebas."""
+    conn = db.get_connection()
+    conn.execute('CREATE TABLE IF NOT EXISTS prueba_unidad (valor INTEGER)')
+    conn.execute('DELETE FROM prueba_unidad')
+    conn.commit()
+    return conn
+
+
+def _valores(conn):
+    return [row[0] for row in conn.execute('SELECT valor FROM prueba_unidad ORDER BY valor')]
+
+
+def test_commit_dentro_de_una_unidad_no_confirma(db, tabla):
+    with pytest.raises(RuntimeError):
+        with db.unit_of_work() as conn:
+            conn.execute('INSERT INTO prueba_unidad VALUES (1)')
+            db.commit(conn)
+            assert conn.in_transaction
+            raise RuntimeError("falla después del commit del controlador")
+    assert _valores(tabla) == []
+
+
+def test_unidad_anidada_revertida_conserva_la_externa(db, tabla):
+    with db.unit_of_work() as conn:
+        conn.execute('INSERT INTO prueba_unidad VALUES (1)')
+        with pytest.raises(RuntimeError):
+            with db.unit_of_work() as anidada:
+                anidada.execute('INSERT INTO prueba_unidad VALUES (2)')
+                raise RuntimeError("falla la unidad anidada")
+        conn.execute('INSERT INTO prueba_unidad VALUES (3)')
+    assert _valores(tabla) == [1, 3]
+    assert not db.in_unit_of_work()
+
+
+def test_excepcion_revierte_toda_la_unidad(db, tabla):
+    with pytest.raises(RuntimeError):
+        with db.unit_of_work() as conn:
+            conn.execute('INSERT INTO prueba_unidad VALUES (1)')
+            with db.unit_of_work() as anidada:
+                anidada.execute('INSERT INTO prueba_unidad VALUES (2)')
+            raise RuntimeError("falla la unidad externa")
+    assert _valores(tabla) == []
+    assert not db.in_unit_of_work()
+
+
+def test_on_commit_espera_a_la_unidad_externa(db, tabla):
+    llamadas = []
+    with db.unit_of_work():
+        db.on_commit(lambda: llamadas.append('externa'))
+        with db.unit_of_work():
+            db.on_commit(lambda: llamadas.append('anidada'))
+        with pytest.raises(RuntimeError):
+            with db.unit_of_work():
+                db.on_commit(lambda: llamadas.append('revertida'))
+                raise RuntimeError("falla la unidad anidada")
+        assert llamadas == []
+    assert llamadas == ['externa', 'anidada']
+
+    with pytest.raises(RuntimeError):
+        with db.unit_of_work():
+            db.on_commit(lambda: llamadas.append('descartada'))
+            raise RuntimeError("falla la unidad")
+    db.on_commit(lambda: llamadas.append('inmediata'))
+    assert llamadas == ['externa', 'anidada', 'inmediata']
+
+
+def test_cache_se_invalida_al_confirmar_la_unidad(db):
+    controller = ServicioController()
+    servicio_id = db.get_connection().execute(
+        "SELECT id FROM servicio WHERE baja = 0 AND estado = 'PENDIENTE' LIMIT 1"
+    ).fetchone()[0]
+
+    def leer_en_otro_hilo():
+        # Ve la versión confirmada (anterior) y la guarda en la caché
+        try:
+            assert controller.obtener_servicio(servicio_id).estado == 'PENDIENTE'
+        finally:
+            db.release_connection()
+
+    controller.limpiar_cache()
+    with db.unit_of_work():
+        assert controller.actualizar_estado_servicio(servicio_id, 'EN_PROCESO')
+        lector = threading.Thread(target=leer_en_otro_hilo)
+        lector.start()
+        lector.join()
+
+    assert controller.obtener_servicio(servicio_id).estado == 'EN_PROCESO'
+    assert controller.actualizar_estado_servicio(servicio_id, 'PENDIENTE')
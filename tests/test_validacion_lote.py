@@ -0,0 +1,99 @@
+"""
+Las validaciones por lote deben dar el mismo resultado que las individuales.
+
+Se comparan fila por fila validar_dnis / validar_telefonos con validar_dni /
+validar_telefono, y Cliente.validar_lote / Servicio.validar_lote con
+validate_data, sobre valores incómodos: espacios Unicode, el carácter de
+unión de _limpiar_columna (\\x00), None, DNIs con puntos, costos negativos o
+no numéricos y fechas ISO vacías o inválidas.
+"""
+from datetime import date
+
+import pytest
+
+from models.cliente import Cliente
+from models.servicio import Servicio
+from utils.validators import (validar_dni, validar_dnis, validar_fechas_iso,
+                              validar_telefono, validar_telefonos)
+
+DNIS = [
+    '12345678', '1234567', '123456', '123456789', '12.345.678', '1.234.567',
+    '12 345 678', '12 345 678', '12 345678', '12-345-678',
+    '１２３４５６７８', '12345678\x00', '\x00', '1234\x005678', '\x00\x00',
+    '', ' ', '..', 'abcdefgh', '-1234567', '+1234567', '١٢٣٤٥٦٧٨',
+]
+TELEFONOS = [
+    '01145551234', '011 4555-1234', '(011) 4555-1234', '11 45551234',
+    '11 4555 1234', '+54 11 4555 1234', '1234567', '12345678',
+    '1' * 15, '1' * 16, '\x00', '1145\x0051234', '4555\x00', '', ' ', '---',
+    '()', '11.4555.1234', '²³⁴⁵⁶⁷⁸⁹', '　' + '1' * 10,
+]
+COSTOS = [0, 10, 10.5, '20.75', -1, -0.01, '-5', 'abc', '', None, '1e3',
+          'nan', 'inf', '-inf', True, [], '10,5', ' 7 ']
+FECHAS = ['2024-01-31', '', None, '2024-02-30', '2024-13-01', '2024-1-5',
+          'hoy', ' 2024-01-01', '2024-01-01\x00', date(2024, 1, 1), 20240101,
+          '2024-02-29', '2023-02-29']
+
+
+@pytest.mark.parametrize('dnis', [DNIS, DNIS[::-1]], ids=['orden', 'invertido'])
+def test_validar_dnis(dnis):
+    assert validar_dnis(dnis) == [validar_dni(dni) for dni in dnis]
+
+
+@pytest.mark.parametrize('telefonos', [TELEFONOS, TELEFONOS[::-1]], ids=['orden', 'invertido'])
+def test_validar_telefonos(telefonos):
+    assert validar_telefonos(telefonos) == [validar_telefono(t) for t in telefonos]
+
+
+def test_validar_telefonos_opcional():
+    telefonos = TELEFONOS + [None]
+    esperado = [not t or validar_telefono(t) for t in telefonos]
+    assert validar_telefonos(telefonos, opcional=True) == esperado
+
+
+def test_validar_fechas_iso():
+    def valida(fecha):
+        if not fecha or not isinstance(fecha, str):
+            return True
+        try:
+            date.fromisoformat(fecha)
+            return True
+        except ValueError:
+            return False
+
+    assert validar_fechas_iso(FECHAS) == [valida(fecha) for fecha in FECHAS]
+
+
+def _comparar(modelo, filas):
+    motivos = modelo.validar_lote(filas)
+    esperados = [modelo.validate_data(fila) for fila in filas]
+    assert [motivo is None for motivo in motivos] == esperados
+    # El resultado de cada fila no depende del resto del lote
+    assert motivos == [modelo.validar_lote([fila])[0] for fila in filas]
+
+
+def test_clientes_por_lote_y_de_a_uno():
+    base = {'nombre': 'Ana', 'apellido': 'Pérez', 'dni': '12345678', 'telefono': '01145551234'}
+    filas = [dict(base)]
+    filas += [dict(base, dni=dni) for dni in DNIS + [None]]
+    filas += [dict(base, telefono=telefono) for telefono in TELEFONOS + [None]]
+    filas += [dict(base, nombre=valor) for valor in ('', None, '\x00', ' ')]
+    filas += [dict(base, apellido=None, dni='x', telefono='1'), {}]
+    filas += [dict(base, dni=dni, telefono=telefono)
+              for dni, telefono in zip(DNIS, TELEFONOS)]
+    _comparar(Cliente, filas)
+
+
+def test_servicios_por_lote_y_de_a_uno():
+    base = {'descripcion': 'Cambio de aceite', 'estado': 'PENDIENTE', 'costo': 100,
+            'fecha_ingreso': '2024-01-10', 'fecha_estimada': '2024-01-20', 'idCliente': 1}
+    filas = [dict(base)]
+    filas += [dict(base, costo=costo) for costo in COSTOS]
+    filas += [{k: v for k, v in base.items() if k != 'costo'}]
+    filas += [dict(base, fecha_ingreso=fecha) for fecha in FECHAS]
+    filas += [dict(base, fecha_estimada=fecha) for fecha in FECHAS]
+    filas += [dict(base, estado=estado) for estado in ('', None, 'pendiente', 'OTRO')]
+    filas += [dict(base, descripcion=None), dict(base, idCliente=0), {}]
+    filas += [dict(base, costo=costo, fecha_ingreso=fecha, estado=None)
+              for costo, fecha in zip(COSTOS, FECHAS)]
+    _comparar(Servicio, filas)
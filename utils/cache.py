@@ -0,0 +1,164 @@
+"""
+Caché LRU con expiración para objetos del modelo (identity map).
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+
+class ModelCache:
+    """
+    Identity map acotado por tamaño y tiempo de vida.
+
+    Guarda instancias del modelo por clave (normalmente el id). Las
+    entradas más antiguas se descartan al superar max_size y las que
+    superan ttl segundos se consideran vencidas. Es seguro usarla desde
+    varios hilos. get() devuelve el objeto guardado, no una copia: los
+    controladores entregan copias para que nadie modifique la caché.
+    """
+
+    def __init__(self, max_size: int = 1000, ttl: float = 300.0):
+        """
+        Inicializa la caché.
+
+        Args:
+            max_size: Cantidad máxima de entradas (0 desactiva la caché)
+            ttl: Segundos de validez de cada entrada (0 sin vencimiento)
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._datos: 'OrderedDict[Hashable, Tuple[float, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, clave: Hashable) -> Optional[Any]:
+        """
+        Obtiene un objeto de la caché.
+
+        Args:
+            clave: Clave del objeto
+
+        Returns:
+            El objeto guardado o None si no está o venció
+        """
+        with self._lock:
+            entrada = self._datos.get(clave)
+            if entrada is not None:
+                guardado, valor = entrada
+                if not self.ttl or time.monotonic() - guardado < self.ttl:
+                    self._datos.move_to_end(clave)
+                    self.hits += 1
+                    return valor
+                del self._datos[clave]
+            self.misses += 1
+            return None
+
+    def put(self, clave: Hashable, valor: Any) -> None:
+        """
+        Guarda un objeto, descartando el menos usado si se supera el tamaño.
+
+        Args:
+            clave: Clave del objeto
+            valor: Objeto a guardar
+        """
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._datos[clave] = (time.monotonic(), valor)
+            self._datos.move_to_end(clave)
+            while len(self._datos) > self.max_size:
+                self._datos.popitem(last=False)
+
+    def invalidate(self, clave: Hashable) -> None:
+        """
+        Elimina un objeto de la caché.
+
+        Args:
+            clave: Clave del objeto
+        """
+        with self._lock:
+            self._datos.pop(clave, None)
+
+    def invalidate_many(self, claves: Iterable[Hashable]) -> None:
+        """
+        Elimina varios objetos de la caché.
+
+        Args:
+            claves: Claves de los objetos
+        """
+        with self._lock:
+            for clave in claves:
+                self._datos.pop(clave, None)
+
+    def clear(self) -> None:
+        """Vacía la caché (los contadores se conservan)."""
+        with self._lock:
+            self._datos.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Obtiene las estadísticas de uso.
+
+        Returns:
+            Dict[str, Any]: 'hits', 'misses', 'hit_rate', 'size' y 'max_size'
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+                'size': len(self._datos),
+                'max_size': self.max_size
+            }
+
+
+class RecentItems:
+    """
+    Lista acotada de los elementos usados más recientemente.
+
+    Agregar un elemento que ya está lo mueve al principio; al superar
+    max_size se descarta el más antiguo. Es segura entre hilos.
+    """
+
+    def __init__(self, max_size: int = 10):
+        """
+        Inicializa la lista.
+
+        Args:
+            max_size: Cantidad máxima de elementos
+        """
+        self.max_size = max_size
+        self._datos: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, clave: Hashable, valor: Any) -> None:
+        """
+        Registra el uso de un elemento.
+
+        Args:
+            clave: Clave del elemento
+            valor: Valor asociado (p. ej. el texto a mostrar)
+        """
+        with self._lock:
+            self._datos[clave] = valor
+            self._datos.move_to_end(clave, last=False)
+            while len(self._datos) > self.max_size:
+                self._datos.popitem(last=True)
+
+    def discard(self, clave: Hashable) -> None:
+        """Quita un elemento si está en la lista."""
+        with self._lock:
+            self._datos.pop(clave, None)
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """
+        Obtiene los elementos, del más reciente al más antiguo.
+
+        Returns:
+            List[Tuple]: Pares (clave, valor)
+        """
+        with self._lock:
+            return list(self._datos.items())
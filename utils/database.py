@@ -1,48 +1,304 @@
 """
 Módulo para manejar la conexión a la base de datos SQLite.
 """
+import atexit
 import sqlite3
 import os
-from typing import Optional
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Optional, List, Tuple, Iterator
 from utils.logger import setup_logger
+from utils.profiler import ConexionPerfilada, QueryProfiler
 import config
 
 logger = setup_logger(__name__)
 
+# Recalcula las tablas de resumen desde cero (ver DatabaseConnection.rebuild_summary)
+REBUILD_RESUMEN: List[str] = [
+    'DELETE FROM resumen_servicio',
+    """INSERT INTO resumen_servicio (estado, baja, cantidad, costo_total)
+       SELECT IFNULL(estado, ''), CASE WHEN baja THEN 1 ELSE 0 END,
+              COUNT(*), IFNULL(SUM(costo), 0)
+       FROM servicio GROUP BY 1, 2""",
+    'DELETE FROM resumen_cliente',
+    """INSERT INTO resumen_cliente (baja, cantidad)
+       SELECT CASE WHEN baja THEN 1 ELSE 0 END, COUNT(*)
+       FROM cliente GROUP BY 1""",
+]
+
+# Migraciones de esquema versionadas con PRAGMA user_version.
+# Cada entrada es (versión, descripción, sentencias). Solo se agregan al final:
+# nunca se modifica una migración ya publicada.
+MIGRATIONS: List[Tuple[int, str, List[str]]] = [
+    (1, "Índices para búsquedas por cliente, estado y registros activos", [
+        'CREATE INDEX IF NOT EXISTS idx_cliente_activos '
+        'ON cliente (baja) WHERE baja = 0',
+        'CREATE INDEX IF NOT EXISTS idx_servicio_cliente '
+        'ON servicio (idCliente, baja)',
+        'CREATE INDEX IF NOT EXISTS idx_servicio_estado '
+        'ON servicio (estado, baja, fecha_ingreso DESC)',
+        'CREATE INDEX IF NOT EXISTS idx_servicio_activos '
+        'ON servicio (baja) WHERE baja = 0',
+    ]),
+    (2, "Índice para paginación de servicios por fecha de ingreso", [
+        'CREATE INDEX IF NOT EXISTS idx_servicio_fecha '
+        'ON servicio (baja, fecha_ingreso, id)',
+    ]),
+    (3, "Índice de texto completo (FTS5) para la búsqueda de clientes", [
+        """CREATE VIRTUAL TABLE IF NOT EXISTS cliente_fts USING fts5(
+            nombre, apellido, dni, telefono,
+            content='cliente', content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2',
+            prefix='2 3 4'
+        )""",
+        """CREATE TRIGGER IF NOT EXISTS cliente_fts_ai AFTER INSERT ON cliente BEGIN
+            INSERT INTO cliente_fts (rowid, nombre, apellido, dni, telefono)
+            VALUES (new.id, new.nombre, new.apellido, new.dni, new.telefono);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS cliente_fts_ad AFTER DELETE ON cliente BEGIN
+            INSERT INTO cliente_fts (cliente_fts, rowid, nombre, apellido, dni, telefono)
+            VALUES ('delete', old.id, old.nombre, old.apellido, old.dni, old.telefono);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS cliente_fts_au AFTER UPDATE OF
+            nombre, apellido, dni, telefono ON cliente BEGIN
+            INSERT INTO cliente_fts (cliente_fts, rowid, nombre, apellido, dni, telefono)
+            VALUES ('delete', old.id, old.nombre, old.apellido, old.dni, old.telefono);
+            INSERT INTO cliente_fts (rowid, nombre, apellido, dni, telefono)
+            VALUES (new.id, new.nombre, new.apellido, new.dni, new.telefono);
+        END""",
+        # Indexa los clientes que ya existían antes de la migración
+        "INSERT INTO cliente_fts (cliente_fts) VALUES ('rebuild')",
+    ]),
+    (4, "Índice de servicios por cliente ordenado por fecha de ingreso", [
+        # Reemplaza a idx_servicio_cliente: también resuelve el ORDER BY
+        'DROP INDEX IF EXISTS idx_servicio_cliente',
+        'CREATE INDEX IF NOT EXISTS idx_servicio_cliente_fecha '
+        'ON servicio (idCliente, baja, fecha_ingreso, id)',
+    ]),
+    (5, "Tablas de resumen para el dashboard mantenidas por triggers", [
+        """CREATE TABLE IF NOT EXISTS resumen_servicio (
+            estado TEXT NOT NULL,
+            baja INTEGER NOT NULL,
+            cantidad INTEGER NOT NULL DEFAULT 0,
+            costo_total REAL NOT NULL DEFAULT 0,
+            PRIMARY KEY (estado, baja)
+        ) WITHOUT ROWID""",
+        """CREATE TABLE IF NOT EXISTS resumen_cliente (
+            baja INTEGER PRIMARY KEY,
+            cantidad INTEGER NOT NULL DEFAULT 0
+        )""",
+        """CREATE TRIGGER IF NOT EXISTS resumen_servicio_ai AFTER INSERT ON servicio BEGIN
+            INSERT INTO resumen_servicio (estado, baja, cantidad, costo_total)
+            VALUES (IFNULL(new.estado, ''), CASE WHEN new.baja THEN 1 ELSE 0 END,
+                    1, IFNULL(new.costo, 0))
+            ON CONFLICT (estado, baja) DO UPDATE SET
+                cantidad = cantidad + 1,
+                costo_total = costo_total + excluded.costo_total;
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS resumen_servicio_ad AFTER DELETE ON servicio BEGIN
+            UPDATE resumen_servicio SET
+                cantidad = cantidad - 1,
+                costo_total = costo_total - IFNULL(old.costo, 0)
+            WHERE estado = IFNULL(old.estado, '')
+              AND baja = CASE WHEN old.baja THEN 1 ELSE 0 END;
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS resumen_servicio_au AFTER UPDATE OF
+            estado, baja, costo ON servicio BEGIN
+            UPDATE resumen_servicio SET
+                cantidad = cantidad - 1,
+                costo_total = costo_total - IFNULL(old.costo, 0)
+            WHERE estado = IFNULL(old.estado, '')
+              AND baja = CASE WHEN old.baja THEN 1 ELSE 0 END;
+            INSERT INTO resumen_servicio (estado, baja, cantidad, costo_total)
+            VALUES (IFNULL(new.estado, ''), CASE WHEN new.baja THEN 1 ELSE 0 END,
+                    1, IFNULL(new.costo, 0))
+            ON CONFLICT (estado, baja) DO UPDATE SET
+                cantidad = cantidad + 1,
+                costo_total = costo_total + excluded.costo_total;
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS resumen_cliente_ai AFTER INSERT ON cliente BEGIN
+            INSERT INTO resumen_cliente (baja, cantidad)
+            VALUES (CASE WHEN new.baja THEN 1 ELSE 0 END, 1)
+            ON CONFLICT (baja) DO UPDATE SET cantidad = cantidad + 1;
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS resumen_cliente_ad AFTER DELETE ON cliente BEGIN
+            UPDATE resumen_cliente SET cantidad = cantidad - 1
+            WHERE baja = CASE WHEN old.baja THEN 1 ELSE 0 END;
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS resumen_cliente_au AFTER UPDATE OF baja ON cliente
+            WHEN (CASE WHEN old.baja THEN 1 ELSE 0 END) != (CASE WHEN new.baja THEN 1 ELSE 0 END)
+        BEGIN
+            UPDATE resumen_cliente SET cantidad = cantidad - 1
+            WHERE baja = CASE WHEN old.baja THEN 1 ELSE 0 END;
+            INSERT INTO resumen_cliente (baja, cantidad)
+            VALUES (CASE WHEN new.baja THEN 1 ELSE 0 END, 1)
+            ON CONFLICT (baja) DO UPDATE SET cantidad = cantidad + 1;
+        END""",
+        # Carga inicial a partir de los datos existentes
+        *REBUILD_RESUMEN,
+    ]),
+    (6, "Rollups diarios de servicios con registro de días modificados", [
+        """CREATE TABLE IF NOT EXISTS rollup_servicio_diario (
+            dia TEXT NOT NULL,
+            estado TEXT NOT NULL,
+            cantidad INTEGER NOT NULL,
+            costo_total REAL NOT NULL,
+            con_estimada INTEGER NOT NULL,
+            dias_estimados REAL NOT NULL,
+            PRIMARY KEY (dia, estado)
+        ) WITHOUT ROWID""",
+        # Días cuyo rollup debe recalcularse; seq funciona como marca de agua
+        """CREATE TABLE IF NOT EXISTS rollup_pendiente (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            dia TEXT NOT NULL
+        )""",
+        """CREATE TABLE IF NOT EXISTS rollup_marca (
+            nombre TEXT PRIMARY KEY,
+            seq INTEGER NOT NULL
+        )""",
+        """CREATE TRIGGER IF NOT EXISTS rollup_servicio_ai AFTER INSERT ON servicio BEGIN
+            INSERT INTO rollup_pendiente (dia) VALUES (new.fecha_ingreso);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS rollup_servicio_ad AFTER DELETE ON servicio BEGIN
+            INSERT INTO rollup_pendiente (dia) VALUES (old.fecha_ingreso);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS rollup_servicio_au AFTER UPDATE OF
+            estado, baja, costo, fecha_ingreso, fecha_estimada ON servicio BEGIN
+            INSERT INTO rollup_pendiente (dia) VALUES (old.fecha_ingreso);
+            INSERT INTO rollup_pendiente (dia)
+            SELECT new.fecha_ingreso WHERE new.fecha_ingreso IS NOT old.fecha_ingreso;
+        END""",
+        "INSERT OR IGNORE INTO rollup_marca (nombre, seq) VALUES ('servicio_diario', 0)",
+        # Los días existentes quedan pendientes para el primer cálculo
+        """INSERT INTO rollup_pendiente (dia)
+           SELECT DISTINCT fecha_ingreso FROM servicio WHERE fecha_ingreso IS NOT NULL""",
+    ]),
+    (7, "Pausa del índice de texto completo durante inserciones masivas", [
+        # Con una fila aquí cliente_fts_ai no indexa; las inserciones masivas
+        # la agregan y la quitan dentro de su propia transacción
+        'CREATE TABLE IF NOT EXISTS cliente_fts_pausa (activa INTEGER PRIMARY KEY)',
+        'DROP TRIGGER IF EXISTS cliente_fts_ai',
+        """CREATE TRIGGER cliente_fts_ai AFTER INSERT ON cliente
+            WHEN NOT EXISTS (SELECT 1 FROM cliente_fts_pausa)
+        BEGIN
+            INSERT INTO cliente_fts (rowid, nombre, apellido, dni, telefono)
+            VALUES (new.id, new.nombre, new.apellido, new.dni, new.telefono);
+        END""",
+        # Una pausa que haya quedado de una versión anterior no debe persistir
+        'DELETE FROM cliente_fts_pausa',
+    ]),
+    (8, "Pausa del registro de días de rollup durante inserciones masivas", [
+        # Igual que cliente_fts_pausa: las inserciones masivas registran cada
+        # día una sola vez en lugar de una fila pendiente por servicio
+        'CREATE TABLE IF NOT EXISTS rollup_pausa (activa INTEGER PRIMARY KEY)',
+        'DROP TRIGGER IF EXISTS rollup_servicio_ai',
+        """CREATE TRIGGER rollup_servicio_ai AFTER INSERT ON servicio
+            WHEN NOT EXISTS (SELECT 1 FROM rollup_pausa)
+        BEGIN
+            INSERT INTO rollup_pendiente (dia) VALUES (new.fecha_ingreso);
+        END""",
+        'DELETE FROM rollup_pausa',
+    ]),
+]
+
 
 class DatabaseConnection:
     """
-    Clase singleton para manejar la conexión a la base de datos.
-    Implementa el patrón Singleton para tener una única instancia de conexión.
+    Clase singleton que administra un pool de conexiones SQLite.
+    
+    Entrega una conexión por hilo, de modo que los hilos de trabajo pueden
+    leer en paralelo mientras el hilo de la interfaz escribe. La base se
+    abre en modo WAL para que los lectores no esperen detrás de escrituras.
+    
+    Varias operaciones pueden agruparse en una sola transacción con
+    unit_of_work(); mientras haya una unidad abierta en el hilo, commit()
+    no confirma y la confirmación ocurre al cerrar la unidad.
+    
+    Con config.DB_PROFILE activo, las conexiones miden cada sentencia en
+    self.profiler y el resumen se guarda en LOG_DIR al terminar el proceso.
     """
     _instance: Optional['DatabaseConnection'] = None
-    _connection: Optional[sqlite3.Connection] = None
+    _instance_lock = threading.Lock()
     
     def __new__(cls) -> 'DatabaseConnection':
-        """Implementación del patrón Singleton."""
+        """Implementación del patrón Singleton (segura entre hilos)."""
         if cls._instance is None:
-            cls._instance = super(DatabaseConnection, cls).__new__(cls)
-            cls._instance._initialize_database()
+            with cls._instance_lock:
+                if cls._instance is None:
+                    instance = super(DatabaseConnection, cls).__new__(cls)
+                    instance._local = threading.local()
+                    # Conexión -> hilo dueño (None: no depende de un hilo)
+                    instance._connections = {}
+                    instance._connections_lock = threading.Lock()
+                    instance._monitor = None
+                    instance._monitor_lock = threading.Lock()
+                    instance.profiler = None
+                    if config.DB_PROFILE:
+                        instance.profiler = QueryProfiler(config.DB_SLOW_QUERY_MS,
+                                                          config.DB_PROFILE_SAMPLES)
+                        atexit.register(instance.save_profile)
+                    instance._initialize_database()
+                    cls._instance = instance
         return cls._instance
     
     def _initialize_database(self) -> None:
         """Inicializa la base de datos y crea las tablas si no existen."""
         try:
-            os.makedirs(config.DB_DIR, exist_ok=True)
+            if config.DB_DIR:
+                os.makedirs(config.DB_DIR, exist_ok=True)
             
-            self._connection = sqlite3.connect(config.DB_PATH)
-            self._connection.row_factory = sqlite3.Row
+            conn = self.get_connection()
+            # journal_mode es persistente: basta con fijarlo una vez por archivo
+            modo = conn.execute('PRAGMA journal_mode = WAL').fetchone()[0]
             
-            logger.info(f"Conexión establecida a {config.DB_PATH}")
+            logger.info("Conexión establecida a %s (journal_mode=%s)", config.DB_PATH, modo)
             self._create_tables()
+            self._run_migrations()
         except sqlite3.Error as e:
-            logger.error(f"Error al inicializar base de datos: {e}")
+            logger.error("Error al inicializar base de datos: %s", e)
             raise
     
+    def _open_connection(self, propia_del_hilo: bool = True) -> sqlite3.Connection:
+        """
+        Abre una nueva conexión configurada con los PRAGMA de rendimiento.
+        
+        Args:
+            propia_del_hilo: Si la conexión pertenece al hilo actual; las que
+                no pertenecen a un hilo no se descartan cuando este termina
+            
+        Returns:
+            sqlite3.Connection: Conexión lista para usar en el hilo actual
+        """
+        conn = sqlite3.connect(
+            config.DB_PATH,
+            timeout=config.DB_BUSY_TIMEOUT_MS / 1000,
+            check_same_thread=False,
+            factory=ConexionPerfilada if self.profiler else sqlite3.Connection
+        )
+        if self.profiler:
+            conn.profiler = self.profiler
+        conn.row_factory = sqlite3.Row
+        
+        conn.execute(f'PRAGMA busy_timeout = {int(config.DB_BUSY_TIMEOUT_MS)}')
+        conn.execute('PRAGMA synchronous = NORMAL')
+        # Valor negativo: tamaño en KiB en lugar de páginas
+        conn.execute(f'PRAGMA cache_size = -{int(config.DB_CACHE_SIZE_KB)}')
+        conn.execute(f'PRAGMA mmap_size = {int(config.DB_MMAP_SIZE)}')
+        conn.execute('PRAGMA temp_store = MEMORY')
+        
+        self._prune_connections()
+        with self._connections_lock:
+            self._connections[conn] = threading.current_thread() if propia_del_hilo else None
+        
+        logger.debug("Nueva conexión abierta para el hilo %s", threading.get_ident())
+        return conn
+    
     def _create_tables(self) -> None:
         """Crea las tablas necesarias en la base de datos."""
         try:
-            cursor = self._connection.cursor()
+            conn = self.get_connection()
+            cursor = conn.cursor()
             
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS cliente (
@@ -69,33 +325,314 @@ class DatabaseConnection:
                 )
             ''')
             
-            self._connection.commit()
+            conn.commit()
             logger.info("Tablas creadas o verificadas exitosamente")
         except sqlite3.Error as e:
-            logger.error(f"Error al crear tablas: {e}")
+            logger.error("Error al crear tablas: %s", e)
             raise
     
+    def _run_migrations(self) -> None:
+        """
+        Aplica las migraciones pendientes según PRAGMA user_version.
+        
+        Cada migración se ejecuta en su propia transacción junto con la
+        actualización de user_version, de modo que una base existente se
+        actualiza en el lugar y nunca queda a medio migrar.
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        version_actual = cursor.execute('PRAGMA user_version').fetchone()[0]
+        
+        for version, descripcion, sentencias in MIGRATIONS:
+            if version <= version_actual:
+                continue
+            
+            try:
+                cursor.execute('BEGIN')
+                for sentencia in sentencias:
+                    cursor.execute(sentencia)
+                # PRAGMA no admite parámetros; version es un entero interno
+                cursor.execute(f'PRAGMA user_version = {int(version)}')
+                conn.commit()
+                logger.info("Migración %s aplicada: %s", version, descripcion)
+            except sqlite3.Error as e:
+                conn.rollback()
+                logger.error("Error al aplicar migración %s: %s", version, e)
+                raise
+    
+    def rebuild_summary(self) -> None:
+        """
+        Recalcula las tablas de resumen del dashboard a partir de los datos.
+        
+        Los triggers las mantienen al día; esto solo hace falta para
+        reparar diferencias (p. ej. tras editar la base con otra herramienta).
+        """
+        with self.unit_of_work() as conn:
+            for sentencia in REBUILD_RESUMEN:
+                conn.execute(sentencia)
+        logger.info("Tablas de resumen recalculadas")
+    
+    def data_version(self) -> int:
+        """
+        Obtiene un contador que cambia cada vez que se confirma una escritura.
+        
+        Usa PRAGMA data_version sobre una conexión dedicada que nunca
+        escribe: el valor cambia con cada commit de cualquier otra conexión
+        (de este u otro proceso). Es una consulta sin acceso a tablas, apta
+        para sondear periódicamente si hay datos nuevos.
+        
+        Returns:
+            int: Valor actual del contador
+        """
+        with self._monitor_lock:
+            if self._monitor is None:
+                self._monitor = self._open_connection(propia_del_hilo=False)
+            return self._monitor.execute('PRAGMA data_version').fetchone()[0]
+    
+    def get_schema_version(self) -> int:
+        """
+        Obtiene la versión de esquema de la base de datos.
+        
+        Returns:
+            int: Valor de PRAGMA user_version
+        """
+        return self.get_connection().execute('PRAGMA user_version').fetchone()[0]
+    
+    def save_profile(self, ruta: Optional[str] = None) -> Optional[str]:
+        """
+        Guarda las estadísticas del perfilador de consultas en JSON.
+        
+        Args:
+            ruta: Archivo destino (por defecto LOG_DIR/query_profile_<fecha>.json)
+            
+        Returns:
+            Optional[str]: Ruta escrita, o None si el perfilado está desactivado
+        """
+        if self.profiler is None:
+            return None
+        if ruta is None:
+            nombre = f"query_profile_{datetime.now():%Y%m%d_%H%M%S}.json"
+            ruta = os.path.join(config.LOG_DIR, nombre)
+        try:
+            self.profiler.guardar(ruta)
+            return ruta
+        except OSError as e:
+            logger.error("Error al guardar el perfil de consultas: %s", e)
+            return None
+    
+    def explain_query_plan(self, query: str, params: tuple = ()) -> List[str]:
+        """
+        Obtiene el plan de ejecución de una consulta.
+        
+        Args:
+            query (str): Consulta SQL a analizar
+            params (tuple): Parámetros para la consulta
+            
+        Returns:
+            List[str]: Detalle de cada paso del plan (columna 'detail')
+        """
+        cursor = self.get_connection().execute(f'EXPLAIN QUERY PLAN {query}', params)
+        return [row['detail'] for row in cursor.fetchall()]
+    
     def get_connection(self) -> sqlite3.Connection:
         """
-        Obtiene la conexión a la base de datos.
+        Obtiene la conexión del hilo actual, abriéndola si no existe.
         
         Returns:
             sqlite3.Connection: Conexión activa a la base de datos
         """
-        return self._connection
+        conn = getattr(self._local, 'connection', None)
+        if conn is None:
+            conn = self._open_connection()
+            self._local.connection = conn
+        return conn
     
-    def close_connection(self) -> None:
-        """Cierra la conexión a la base de datos."""
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Presta la conexión del hilo actual dentro de un bloque ``with``.
+        
+        Si el bloque lanza una excepción con una transacción abierta, se
+        revierte antes de propagar el error.
+        
+        Yields:
+            sqlite3.Connection: Conexión del hilo actual
+        """
+        conn = self.get_connection()
+        try:
+            yield conn
+        except Exception:
+            # Dentro de una unidad de trabajo la reversión la decide la unidad
+            if conn.in_transaction and not self.in_unit_of_work():
+                conn.rollback()
+            raise
+    
+    def in_unit_of_work(self) -> bool:
+        """
+        Indica si hay una unidad de trabajo abierta en el hilo actual.
+        
+        Returns:
+            bool: True si hay una unidad abierta
+        """
+        return getattr(self._local, 'unidades', 0) > 0
+    
+    @contextmanager
+    def unit_of_work(self) -> Iterator[sqlite3.Connection]:
+        """
+        Agrupa varias operaciones en una única transacción.
+        
+        La unidad más externa abre la transacción con BEGIN IMMEDIATE (toma
+        el bloqueo de escritura al comenzar, sin esperas a mitad de camino) y
+        la confirma al salir del bloque. Las unidades anidadas usan un
+        SAVEPOINT: si fallan se revierte solo su parte y la excepción se
+        propaga a la unidad externa. Ante cualquier excepción la unidad más
+        externa revierte todo. Las funciones registradas con on_commit() se
+        ejecutan después de que la unidad más externa confirma.
+        
+        Yields:
+            sqlite3.Connection: Conexión del hilo actual
+        """
+        conn = self.get_connection()
+        nivel = getattr(self._local, 'unidades', 0)
+        savepoint = f'unidad_{nivel}'
+        
+        conn.execute('BEGIN IMMEDIATE' if nivel == 0 else f'SAVEPOINT {savepoint}')
+        if nivel == 0:
+            self._local.al_confirmar = []
+        registradas = len(self._local.al_confirmar)
+        self._local.unidades = nivel + 1
+        try:
+            yield conn
+        except BaseException:
+            self._local.unidades = nivel
+            # Lo registrado en la parte revertida ya no corresponde
+            del self._local.al_confirmar[registradas:]
+            if nivel == 0:
+                conn.rollback()
+            else:
+                conn.execute(f'ROLLBACK TO {savepoint}')
+                conn.execute(f'RELEASE {savepoint}')
+            raise
+        
+        self._local.unidades = nivel
+        try:
+            if nivel == 0:
+                conn.commit()
+            else:
+                conn.execute(f'RELEASE {savepoint}')
+        except sqlite3.Error:
+            if nivel == 0:
+                self._local.al_confirmar = []
+                if conn.in_transaction:
+                    conn.rollback()
+            raise
+        
+        if nivel == 0:
+            self._ejecutar_al_confirmar()
+    
+    def on_commit(self, funcion: Callable[[], None]) -> None:
+        """
+        Ejecuta una función cuando se confirme la escritura en curso.
+        
+        Dentro de una unidad de trabajo se difiere hasta que confirma la
+        unidad más externa (y se descarta si la parte que la registró se
+        revierte); fuera de una unidad se ejecuta enseguida, porque commit()
+        ya confirmó. Los controladores invalidan su caché así: si lo hicieran
+        antes de confirmar, otro hilo podría volver a guardar la fila vieja.
+        
+        Args:
+            funcion: Función sin argumentos
+        """
+        if self.in_unit_of_work():
+            self._local.al_confirmar.append(funcion)
+        else:
+            funcion()
+    
+    def _ejecutar_al_confirmar(self) -> None:
+        """Ejecuta las funciones registradas en la unidad ya confirmada."""
+        funciones, self._local.al_confirmar = self._local.al_confirmar, []
+        for funcion in funciones:
+            try:
+                funcion()
+            except Exception as e:
+                logger.error("Error tras confirmar la unidad de trabajo: %s", e)
+    
+    def commit(self, conn: sqlite3.Connection) -> None:
+        """
+        Confirma la transacción de la conexión, salvo dentro de una unidad.
+        
+        Los controladores llaman a este método en lugar de conn.commit()
+        para que sus operaciones se sumen a la unidad de trabajo abierta.
+        
+        Args:
+            conn: Conexión del hilo actual
+        """
+        if not self.in_unit_of_work():
+            conn.commit()
+    
+    def release_connection(self) -> None:
+        """Cierra y devuelve al pool la conexión del hilo actual."""
+        conn = getattr(self._local, 'connection', None)
+        if conn is None:
+            return
+        
+        self._local.connection = None
+        with self._connections_lock:
+            self._connections.pop(conn, None)
+        
         try:
-            if self._connection:
-                self._connection.close()
-                logger.info("Conexión a base de datos cerrada")
+            conn.close()
         except sqlite3.Error as e:
-            logger.error(f"Error al cerrar conexión: {e}")
+            logger.error("Error al cerrar conexión del hilo: %s", e)
+    
+    def _prune_connections(self) -> None:
+        """
+        Descarta del pool las conexiones cerradas y las de hilos terminados.
+        
+        Un hilo que termina sin llamar a release_connection() deja su
+        conexión abierta; nadie más puede usarla, así que se cierra aquí.
+        """
+        with self._connections_lock:
+            descartadas = []
+            for conn, hilo in list(self._connections.items()):
+                if hilo is not None and not hilo.is_alive():
+                    descartadas.append(conn)
+                    del self._connections[conn]
+                    continue
+                try:
+                    conn.total_changes
+                except sqlite3.ProgrammingError:
+                    # Ya cerrada
+                    del self._connections[conn]
+        
+        for conn in descartadas:
+            try:
+                conn.close()
+            except sqlite3.Error as e:
+                logger.error("Error al cerrar conexión de un hilo terminado: %s", e)
+        if descartadas:
+            logger.debug("Conexiones de hilos terminados cerradas: %s", len(descartadas))
+    
+    def close_connection(self) -> None:
+        """Cierra todas las conexiones abiertas del pool."""
+        with self._connections_lock:
+            conexiones = list(self._connections)
+            self._connections.clear()
+        
+        for conn in conexiones:
+            try:
+                conn.close()
+            except sqlite3.Error as e:
+                logger.error("Error al cerrar conexión: %s", e)
+        
+        self._local = threading.local()
+        with self._monitor_lock:
+            self._monitor = None
+        logger.info("Conexiones a base de datos cerradas: %s", len(conexiones))
     
     def execute_query(self, query: str, params: tuple = ()) -> sqlite3.Cursor:
         """
-        Ejecuta una consulta SQL.
+        Ejecuta una consulta SQL y la confirma (salvo dentro de una unidad de trabajo).
         
         Args:
             query (str): Consulta SQL a ejecutar
@@ -105,10 +642,11 @@ class DatabaseConnection:
             sqlite3.Cursor: Cursor con el resultado de la consulta
         """
         try:
-            cursor = self._connection.cursor()
+            conn = self.get_connection()
+            cursor = conn.cursor()
             cursor.execute(query, params)
-            self._connection.commit()
+            self.commit(conn)
             return cursor
         except sqlite3.Error as e:
-            logger.error(f"Error ejecutando consulta: {e}")
+            logger.error("Error ejecutando consulta: %s", e)
             raise
\ No newline at end of file
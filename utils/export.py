@@ -2,13 +2,21 @@
 Sistema de exportación y reportes.
 """
 import csv
+import os
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Iterable, Optional, Sequence
 from pathlib import Path
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Columnas de los CSV exportados (también es el formato que acepta utils.importer)
+CLIENTES_CSV_FIELDS = ['Nombre', 'Apellido', 'DNI', 'Teléfono', 'Estado']
+SERVICIOS_CSV_FIELDS = [
+    'Descripción', 'Estado', 'Fecha Ingreso', 'Fecha Estimada',
+    'Costo', 'Cliente ID', 'Cliente', 'DNI Cliente', 'Estado Registro'
+]
+
 
 class ReportGenerator:
     """
@@ -40,7 +48,7 @@ class ReportGenerator:
         
         try:
             with open(filepath, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=['Nombre', 'Apellido', 'DNI', 'Teléfono', 'Estado'])
+                writer = csv.DictWriter(f, fieldnames=CLIENTES_CSV_FIELDS)
                 writer.writeheader()
                 
                 for cliente in clientes:
@@ -52,11 +60,11 @@ class ReportGenerator:
                         'Estado': 'Activo' if not cliente.get('baja', False) else 'Inactivo'
                     })
             
-            logger.info(f"Clientes exportados a {filepath}")
+            logger.info("Clientes exportados a %s", filepath)
             return str(filepath)
         
         except Exception as e:
-            logger.error(f"Error exportando clientes: {e}")
+            logger.error("Error exportando clientes: %s", e)
             return ""
     
     def export_servicios_csv(self, servicios: List[Dict[str, Any]]) -> str:
@@ -79,10 +87,7 @@ class ReportGenerator:
         
         try:
             with open(filepath, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=[
-                    'Descripción', 'Estado', 'Fecha Ingreso', 'Fecha Estimada', 
-                    'Costo', 'Cliente ID', 'Estado Registro'
-                ])
+                writer = csv.DictWriter(f, fieldnames=SERVICIOS_CSV_FIELDS)
                 writer.writeheader()
                 
                 for servicio in servicios:
@@ -96,13 +101,120 @@ class ReportGenerator:
                         'Estado Registro': 'Activo' if not servicio.get('baja', False) else 'Inactivo'
                     })
             
-            logger.info(f"Servicios exportados a {filepath}")
+            logger.info("Servicios exportados a %s", filepath)
             return str(filepath)
         
         except Exception as e:
-            logger.error(f"Error exportando servicios: {e}")
+            logger.error("Error exportando servicios: %s", e)
             return ""
     
+    def export_csv_stream(self, prefijo: str, campos: List[str],
+                          lotes: Iterable[Sequence[Sequence[Any]]],
+                          total: Optional[int] = None,
+                          on_progress: Optional[Callable[[int, int], None]] = None,
+                          is_cancelled: Optional[Callable[[], bool]] = None) -> str:
+        """
+        Exporta filas a CSV en streaming, sin materializar la lista completa.
+        
+        Se escribe en un archivo temporal del mismo directorio que se renombra
+        de forma atómica al terminar; si se cancela o falla, se elimina y no
+        queda ningún CSV a medio escribir. En ambos casos se cierra también
+        el iterador de lotes, para que libere su cursor. Una cancelación que
+        llega después de escribir el último lote no descarta el archivo.
+        
+        Args:
+            prefijo: Prefijo del nombre de archivo (p. ej. 'clientes')
+            campos: Encabezados del CSV
+            lotes: Lotes de filas ya formateadas (p. ej. de cursor.fetchmany)
+            total: Cantidad total de filas esperada, para informar progreso
+            on_progress: Función (filas_escritas, total) llamada tras cada lote
+            is_cancelled: Función que devuelve True si se pidió cancelar
+        
+        Returns:
+            str: Ruta del archivo creado o cadena vacía si se canceló
+        
+        Raises:
+            Exception: El error de lectura o escritura que interrumpió la
+                exportación (el archivo parcial ya se eliminó)
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filepath = self.export_dir / f"{prefijo}_{timestamp}.csv"
+        
+        temp_path = self.export_dir / f".{filepath.name}.tmp"
+        escritas = 0
+        try:
+            with open(temp_path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(campos)
+                
+                # La cancelación solo descarta lotes aún no escritos: si llega
+                # cuando ya no quedan lotes, el archivo está completo y se guarda
+                for lote in lotes:
+                    if is_cancelled and is_cancelled():
+                        logger.info("Exportación de %s cancelada tras %s filas",
+                                    prefijo, escritas)
+                        return ""
+                    writer.writerows(lote)
+                    escritas += len(lote)
+                    if on_progress:
+                        on_progress(escritas, total if total is not None else escritas)
+            
+            os.replace(temp_path, filepath)
+            logger.info("%s filas exportadas a %s", escritas, filepath)
+            return str(filepath)
+        
+        except Exception as e:
+            logger.error("Error exportando %s: %s", prefijo, e)
+            raise
+        
+        finally:
+            # Un generador a medio recorrer mantiene abierto su cursor
+            cerrar = getattr(lotes, 'close', None)
+            if cerrar is not None:
+                cerrar()
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+    
+    def export_clientes_csv_stream(self, lotes: Iterable[Sequence[Sequence[Any]]],
+                                   total: Optional[int] = None,
+                                   on_progress: Optional[Callable[[int, int], None]] = None,
+                                   is_cancelled: Optional[Callable[[], bool]] = None) -> str:
+        """
+        Exporta clientes a CSV en streaming.
+        
+        Args:
+            lotes: Lotes de filas en el orden de CLIENTES_CSV_FIELDS
+                (ver ClienteController.iterar_clientes_export)
+            total: Cantidad total de clientes
+            on_progress: Función (filas_escritas, total)
+            is_cancelled: Función que devuelve True si se pidió cancelar
+        
+        Returns:
+            str: Ruta del archivo creado o cadena vacía si se canceló
+        """
+        return self.export_csv_stream('clientes', CLIENTES_CSV_FIELDS, lotes,
+                                      total, on_progress, is_cancelled)
+    
+    def export_servicios_csv_stream(self, lotes: Iterable[Sequence[Sequence[Any]]],
+                                    total: Optional[int] = None,
+                                    on_progress: Optional[Callable[[int, int], None]] = None,
+                                    is_cancelled: Optional[Callable[[], bool]] = None) -> str:
+        """
+        Exporta servicios a CSV en streaming.
+        
+        Args:
+            lotes: Lotes de filas en el orden de SERVICIOS_CSV_FIELDS
+                (ver ServicioController.iterar_servicios_export)
+            total: Cantidad total de servicios
+            on_progress: Función (filas_escritas, total)
+            is_cancelled: Función que devuelve True si se pidió cancelar
+        
+        Returns:
+            str: Ruta del archivo creado o cadena vacía si se canceló
+        """
+        return self.export_csv_stream('servicios', SERVICIOS_CSV_FIELDS, lotes,
+                                      total, on_progress, is_cancelled)
+    
     def generate_resumen_servicios(self, servicios_por_estado: Dict[str, int], 
                                    total_costo: float) -> str:
         """
@@ -133,11 +245,11 @@ class ReportGenerator:
                 writer.writerow([])
                 writer.writerow(['Costo Total', f"${total_costo:,.2f}"])
             
-            logger.info(f"Resumen generado a {filepath}")
+            logger.info("Resumen generado a %s", filepath)
             return str(filepath)
         
         except Exception as e:
-            logger.error(f"Error generando resumen: {e}")
+            logger.error("Error generando resumen: %s", e)
             return ""
     
     def get_exports_dir(self) -> str:
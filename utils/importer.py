@@ -0,0 +1,236 @@
+"""
+Importación masiva de clientes y servicios desde CSV.
+"""
+import csv
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+from controllers.cliente_controller import ClienteController
+from controllers.servicio_controller import ServicioController
+from models.cliente import Cliente
+from models.servicio import Servicio
+from utils.export import CLIENTES_CSV_FIELDS, SERVICIOS_CSV_FIELDS
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class _ReporteErrores:
+    """
+    Archivo CSV con las filas rechazadas durante una importación.
+
+    El archivo se crea recién con el primer error, de modo que una
+    importación sin errores no deja archivos vacíos.
+    """
+
+    def __init__(self, filepath: Path, campos: List[str]):
+        """
+        Inicializa el reporte.
+
+        Args:
+            filepath: Ruta del archivo a crear
+            campos: Columnas originales del CSV importado
+        """
+        self.filepath = filepath
+        self.campos = ['Fila', 'Motivo'] + campos
+        self.cantidad = 0
+        self._archivo = None
+        self._writer = None
+
+    def agregar(self, fila: int, motivo: str, datos: Dict[str, Any]) -> None:
+        """Registra una fila rechazada."""
+        if self._writer is None:
+            self._archivo = open(self.filepath, 'w', newline='', encoding='utf-8')
+            self._writer = csv.DictWriter(self._archivo, fieldnames=self.campos,
+                                          extrasaction='ignore')
+            self._writer.writeheader()
+
+        self._writer.writerow({**datos, 'Fila': fila, 'Motivo': motivo})
+        self.cantidad += 1
+
+    def cerrar(self) -> str:
+        """
+        Cierra el archivo.
+
+        Returns:
+            str: Ruta del reporte o cadena vacía si no hubo errores
+        """
+        if self._archivo is None:
+            return ""
+        self._archivo.close()
+        return str(self.filepath)
+
+
+class BulkImporter:
+    """
+    Importador masivo en streaming.
+
+    Lee los CSV con el mismo formato que generan ReportGenerator.export_*_csv,
+    valida cada fila con el modelo correspondiente e inserta por lotes con
+    executemany, un lote por transacción.
+    """
+
+    def __init__(self, chunk_size: int = 5000):
+        """
+        Inicializa el importador.
+
+        Args:
+            chunk_size: Filas por lote (y por transacción)
+        """
+        self.chunk_size = chunk_size
+        self.report_dir = Path("exports")
+        self.report_dir.mkdir(exist_ok=True)
+        self.cliente_controller = ClienteController()
+        self.servicio_controller = ServicioController()
+
+    def _leer_lotes(self, filepath: str) -> Iterator[List[Tuple[int, Dict[str, str]]]]:
+        """
+        Lee el CSV en lotes de (número de fila, datos) sin cargarlo entero.
+
+        Args:
+            filepath: Ruta del CSV
+
+        Yields:
+            Lista de filas del lote
+        """
+        # utf-8-sig acepta archivos guardados con BOM (p. ej. desde Excel)
+        with open(filepath, newline='', encoding='utf-8-sig') as f:
+            lote = []
+            # La fila 1 es el encabezado
+            for numero, fila in enumerate(csv.DictReader(f), start=2):
+                lote.append((numero, fila))
+                if len(lote) >= self.chunk_size:
+                    yield lote
+                    lote = []
+            if lote:
+                yield lote
+
+    def _nuevo_reporte(self, prefijo: str, campos: List[str]) -> _ReporteErrores:
+        """Crea el reporte de errores para una importación."""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filepath = self.report_dir / f"errores_importacion_{prefijo}_{timestamp}.csv"
+        return _ReporteErrores(filepath, campos)
+
+    @staticmethod
+    def _cliente_desde_fila(fila: Dict[str, str]) -> Dict[str, Any]:
+        """Convierte una fila del CSV de clientes al formato del modelo."""
+        return {
+            'nombre': (fila.get('Nombre') or '').strip(),
+            'apellido': (fila.get('Apellido') or '').strip(),
+            'dni': (fila.get('DNI') or '').strip(),
+            'telefono': (fila.get('Teléfono') or '').strip(),
+            'baja': (fila.get('Estado') or '').strip().lower() == 'inactivo'
+        }
+
+    @staticmethod
+    def _servicio_desde_fila(fila: Dict[str, str]) -> Dict[str, Any]:
+        """Convierte una fila del CSV de servicios al formato del modelo."""
+        cliente_id = (fila.get('Cliente ID') or '').strip()
+        return {
+            'descripcion': (fila.get('Descripción') or '').strip(),
+            'estado': (fila.get('Estado') or 'PENDIENTE').strip().upper(),
+            'fecha_ingreso': (fila.get('Fecha Ingreso') or '').strip() or None,
+            'fecha_estimada': (fila.get('Fecha Estimada') or '').strip() or None,
+            'costo': (fila.get('Costo') or '0').strip() or '0',
+            'idCliente': int(cliente_id) if cliente_id.isdigit() else None,
+            'baja': (fila.get('Estado Registro') or '').strip().lower() == 'inactivo'
+        }
+
+    def import_clientes_csv(self, filepath: str,
+                            on_conflict: str = 'skip') -> Dict[str, Any]:
+        """
+        Importa clientes desde un CSV.
+
+        Args:
+            filepath: Ruta del CSV (columnas de CLIENTES_CSV_FIELDS)
+            on_conflict: Qué hacer si el DNI ya existe ('skip', 'upsert', 'fail').
+                Con 'fail' la importación se detiene en el primer lote con un
+                DNI repetido; ese lote se revierte y los anteriores se conservan.
+
+        Returns:
+            Dict[str, Any]: Conteos ('insertados', 'actualizados', 'omitidos',
+            'errores'), 'abortado' y la ruta de 'reporte_errores'
+        """
+        if on_conflict not in ClienteController.CONFLICTOS_DNI:
+            raise ValueError(f"Modo de conflicto inválido: {on_conflict}")
+
+        resultado: Dict[str, Any] = {'insertados': 0, 'actualizados': 0,
+                                     'omitidos': 0, 'errores': 0, 'abortado': False}
+        reporte = self._nuevo_reporte('clientes', CLIENTES_CSV_FIELDS)
+
+        try:
+            for lote in self._leer_lotes(filepath):
+                datos = [self._cliente_desde_fila(fila) for _, fila in lote]
+                validos = []
+                for (numero, fila), cliente_data, motivo in zip(
+                        lote, datos, Cliente.validar_lote(datos)):
+                    if motivo is None:
+                        validos.append(cliente_data)
+                    else:
+                        reporte.agregar(numero, motivo, fila)
+
+                try:
+                    parcial = self.cliente_controller.insertar_clientes_lote(
+                        validos, on_conflict
+                    )
+                except sqlite3.IntegrityError as e:
+                    primera, ultima = lote[0][0], lote[-1][0]
+                    reporte.agregar(primera, f"Lote {primera}-{ultima} revertido: {e}", {})
+                    resultado['abortado'] = True
+                    break
+
+                for clave, cantidad in parcial.items():
+                    resultado[clave] += cantidad
+        finally:
+            resultado['errores'] = reporte.cantidad
+            resultado['reporte_errores'] = reporte.cerrar()
+
+        logger.info("Importación de clientes desde %s: %s", filepath, resultado)
+        return resultado
+
+    def import_servicios_csv(self, filepath: str) -> Dict[str, Any]:
+        """
+        Importa servicios desde un CSV.
+
+        Las filas cuyo 'Cliente ID' no existe se rechazan y van al reporte.
+
+        Args:
+            filepath: Ruta del CSV (columnas de SERVICIOS_CSV_FIELDS)
+
+        Returns:
+            Dict[str, Any]: Conteos ('insertados', 'errores') y la ruta de
+            'reporte_errores'
+        """
+        resultado: Dict[str, Any] = {'insertados': 0, 'errores': 0}
+        reporte = self._nuevo_reporte('servicios', SERVICIOS_CSV_FIELDS)
+
+        try:
+            for lote in self._leer_lotes(filepath):
+                datos = [self._servicio_desde_fila(fila) for _, fila in lote]
+                candidatos = []
+                for (numero, fila), servicio_data, motivo in zip(
+                        lote, datos, Servicio.validar_lote(datos)):
+                    if motivo is None:
+                        candidatos.append((numero, fila, servicio_data))
+                    else:
+                        reporte.agregar(numero, motivo, fila)
+
+                existentes = self.cliente_controller.obtener_ids_existentes(
+                    [datos['idCliente'] for _, _, datos in candidatos]
+                )
+                validos = []
+                for numero, fila, servicio_data in candidatos:
+                    if servicio_data['idCliente'] in existentes:
+                        validos.append(servicio_data)
+                    else:
+                        reporte.agregar(numero, "Cliente inexistente", fila)
+
+                resultado['insertados'] += self.servicio_controller.insertar_servicios_lote(validos)
+        finally:
+            resultado['errores'] = reporte.cantidad
+            resultado['reporte_errores'] = reporte.cerrar()
+
+        logger.info("Importación de servicios desde %s: %s", filepath, resultado)
+        return resultado
@@ -1,41 +1,205 @@
 """
 Configuración centralizada de logging.
+
+Todos los loggers comparten una única cola: los hilos que registran solo
+encolan el registro (sin formatear ni escribir) y un QueueListener en su
+propio hilo lo formatea y lo escribe en el archivo y la consola. El logger
+de consultas lentas (LOGGER_CONSULTAS_LENTAS) escribe en su propio archivo,
+consultas_lentas_AAAAMMDD.log, en lugar del archivo de la aplicación.
 """
+import atexit
 import logging
 import os
-from datetime import datetime
+import queue
+import threading
+from datetime import date, timedelta
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Optional
+
+import config
+
+FORMATO = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+FORMATO_FECHA = '%Y-%m-%d %H:%M:%S'
+# Logger del perfilador de consultas (ver utils.profiler)
+LOGGER_CONSULTAS_LENTAS = 'consultas_lentas'
+
+_cola: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[QueueHandler] = None
+_lock = threading.Lock()
+
+
+class DailyRotatingFileHandler(RotatingFileHandler):
+    """
+    Archivo de log por día (prefijo_AAAAMMDD.log) rotado también por tamaño.
+
+    Al superar max_bytes el archivo del día se renombra a .1, .2, etc.
+    (como RotatingFileHandler); al cambiar el día se pasa a un archivo
+    nuevo y se eliminan los de más de dias_retencion días.
+    """
+
+    def __init__(self, directorio: str, prefijo: str = 'app', max_bytes: int = 0,
+                 backup_count: int = 0, dias_retencion: int = 0):
+        """
+        Inicializa el handler; el archivo se abre con el primer registro.
+
+        Args:
+            directorio: Carpeta de los archivos de log
+            prefijo: Prefijo del nombre de archivo
+            max_bytes: Tamaño máximo por archivo (0 sin límite)
+            backup_count: Archivos rotados por tamaño que se conservan
+            dias_retencion: Días de archivos que se conservan (0 todos)
+        """
+        self.directorio = directorio
+        self.prefijo = prefijo
+        self.dias_retencion = dias_retencion
+        self._dia = date.today()
+        super().__init__(self._ruta(self._dia), maxBytes=max_bytes,
+                         backupCount=backup_count, encoding='utf-8', delay=True)
+
+    def _ruta(self, dia: date) -> str:
+        """Ruta del archivo de log del día indicado."""
+        return os.path.join(self.directorio, f'{self.prefijo}_{dia:%Y%m%d}.log')
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        """Rota al cambiar el día o al superar el tamaño máximo."""
+        if date.today() != self._dia:
+            return True
+        return bool(super().shouldRollover(record))
+
+    def doRollover(self) -> None:
+        """Pasa al archivo del nuevo día o rota el actual por tamaño."""
+        hoy = date.today()
+        if hoy == self._dia:
+            super().doRollover()
+            return
+
+        if self.stream:
+            self.stream.close()
+            self.stream = None  # type: ignore
+        self._dia = hoy
+        self.baseFilename = os.path.abspath(self._ruta(hoy))
+        self._purgar()
+
+    def _purgar(self) -> None:
+        """Elimina los archivos de días anteriores al período de retención."""
+        if self.dias_retencion <= 0:
+            return
+        limite = (self._dia - timedelta(days=self.dias_retencion)).strftime('%Y%m%d')
+        inicio = f'{self.prefijo}_'
+        for nombre in os.listdir(self.directorio):
+            dia = nombre[len(inicio):len(inicio) + 8]
+            if nombre.startswith(inicio) and dia.isdigit() and dia < limite:
+                try:
+                    os.remove(os.path.join(self.directorio, nombre))
+                except OSError:
+                    pass
+
+
+class LazyQueueHandler(QueueHandler):
+    """
+    QueueHandler que encola el registro sin formatearlo.
+
+    QueueHandler.prepare() formatea el mensaje en el hilo que registra para
+    poder enviarlo a otro proceso; la cola es local, así que el formateo
+    (%-style con los argumentos del registro) se deja al hilo del listener.
+    Los argumentos deben ser valores que no se modifiquen después de
+    registrarse.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Devuelve el registro tal cual."""
+        return record
+
 
+def _nivel(level: Optional[int]) -> int:
+    """Nivel indicado o, por defecto, el de config.LOG_LEVEL."""
+    if level is not None:
+        return level
+    return getattr(logging, str(config.LOG_LEVEL).upper(), logging.INFO)
 
-def setup_logger(name: str, level: int = logging.INFO) -> logging.Logger:
+
+def _es_consulta_lenta(record: logging.LogRecord) -> bool:
+    """Indica si el registro va al archivo de consultas lentas."""
+    return record.name == LOGGER_CONSULTAS_LENTAS
+
+
+def _iniciar_registro() -> QueueHandler:
+    """Crea la cola, los handlers y el listener compartidos (una sola vez)."""
+    global _listener, _queue_handler
+
+    with _lock:
+        if _queue_handler is not None:
+            return _queue_handler
+
+        os.makedirs(config.LOG_DIR, exist_ok=True)
+        formatter = logging.Formatter(FORMATO, datefmt=FORMATO_FECHA)
+
+        file_handler = DailyRotatingFileHandler(
+            config.LOG_DIR, max_bytes=config.LOG_MAX_BYTES,
+            backup_count=config.LOG_BACKUP_COUNT,
+            dias_retencion=config.LOG_RETENTION_DAYS
+        )
+        file_handler.setFormatter(formatter)
+        file_handler.addFilter(lambda record: not _es_consulta_lenta(record))
+
+        lentas_handler = DailyRotatingFileHandler(
+            config.LOG_DIR, prefijo=LOGGER_CONSULTAS_LENTAS,
+            max_bytes=config.LOG_MAX_BYTES, backup_count=config.LOG_BACKUP_COUNT,
+            dias_retencion=config.LOG_RETENTION_DAYS
+        )
+        lentas_handler.setFormatter(formatter)
+        lentas_handler.addFilter(_es_consulta_lenta)
+
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(logging.WARNING)
+        console_handler.setFormatter(formatter)
+
+        _listener = QueueListener(_cola, file_handler, lentas_handler, console_handler,
+                                  respect_handler_level=True)
+        _listener.start()
+        atexit.register(detener_registro)
+
+        _queue_handler = LazyQueueHandler(_cola)
+        return _queue_handler
+
+
+def detener_registro() -> None:
+    """
+    Procesa los registros pendientes, detiene el listener y cierra el archivo.
+
+    Se ejecuta automáticamente al terminar el intérprete.
+    """
+    global _listener
+
+    with _lock:
+        if _listener is None:
+            return
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+def setup_logger(name: str, level: Optional[int] = None) -> logging.Logger:
     """
     Configure and return a logger instance.
-    
+
+    Calling it again for the same name does not add handlers again; every
+    logger shares the same queue, listener thread and log file.
+
     Args:
         name: Logger name
-        level: Logging level (default: INFO)
-    
+        level: Logging level (default: config.LOG_LEVEL)
+
     Returns:
         Configured logger instance
     """
+    queue_handler = _iniciar_registro()
+
     logger = logging.getLogger(name)
-    logger.setLevel(level)
-    
-    os.makedirs('logs', exist_ok=True)
-    
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
-    file_handler = logging.FileHandler(f'logs/app_{datetime.now().strftime("%Y%m%d")}.log')
-    file_handler.setLevel(level)
-    file_handler.setFormatter(formatter)
-    
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.WARNING)
-    console_handler.setFormatter(formatter)
-    
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
-    
+    logger.setLevel(_nivel(level))
+    if queue_handler not in logger.handlers:
+        logger.addHandler(queue_handler)
+
     return logger
@@ -0,0 +1,106 @@
+"""
+Utilidades para paginación por clave (keyset / seek pagination).
+"""
+from typing import Any, Dict, List, Optional, Tuple
+
+DIRECCIONES = ('ASC', 'DESC')
+
+
+class Pagina:
+    """
+    Página de resultados de un listado paginado por clave.
+
+    Attributes:
+        items (List): Elementos de la página
+        siguiente_cursor: Clave a pasar como ``after_key`` para obtener la
+            página siguiente, o None si no hay más resultados
+        page_size (int): Tamaño de página solicitado
+    """
+
+    def __init__(self, items: List[Any], siguiente_cursor: Any = None,
+                 page_size: int = 0):
+        """
+        Inicializa una página de resultados.
+
+        Args:
+            items: Elementos de la página
+            siguiente_cursor: Clave de continuación (None si es la última)
+            page_size: Tamaño de página solicitado
+        """
+        self.items = items
+        self.siguiente_cursor = siguiente_cursor
+        self.page_size = page_size
+
+    @property
+    def hay_mas(self) -> bool:
+        """Indica si existen más páginas después de esta."""
+        return self.siguiente_cursor is not None
+
+    def __len__(self) -> int:
+        """Cantidad de elementos en la página."""
+        return len(self.items)
+
+    def __iter__(self):
+        """Itera sobre los elementos de la página."""
+        return iter(self.items)
+
+
+def build_keyset_clause(orden: str, direccion: str, after_key: Any,
+                        tabla: Optional[str] = None) -> Tuple[str, str, tuple]:
+    """
+    Construye la condición de búsqueda y el ORDER BY para paginar por clave.
+
+    Cuando se ordena por una columna no única se desempata por ``id``, y la
+    clave de continuación es la tupla ``(valor, id)``.
+
+    Args:
+        orden: Columna de ordenamiento (ya validada por el llamador)
+        direccion: 'ASC' o 'DESC'
+        after_key: Clave de la última fila de la página anterior o None
+        tabla: Alias para calificar las columnas en consultas con JOIN
+
+    Returns:
+        Tuple[str, str, tuple]: (condición WHERE, ORDER BY, parámetros)
+    """
+    operador = '>' if direccion == 'ASC' else '<'
+    prefijo = f'{tabla}.' if tabla else ''
+    id_col = f'{prefijo}id'
+
+    if orden == 'id':
+        order_by = f'{id_col} {direccion}'
+        if after_key is None:
+            return '', order_by, ()
+        return f'{id_col} {operador} ?', order_by, (after_key,)
+
+    columna = f'{prefijo}{orden}'
+    order_by = f'{columna} {direccion}, {id_col} {direccion}'
+    if after_key is None:
+        return '', order_by, ()
+    valor, ultimo_id = after_key
+    return f'({columna}, {id_col}) {operador} (?, ?)', order_by, (valor, ultimo_id)
+
+
+def next_cursor(rows: List[Dict[str, Any]], orden: str,
+                page_size: int) -> Optional[Any]:
+    """
+    Calcula la clave de continuación a partir de las filas leídas.
+
+    Se espera que el llamador haya pedido ``page_size + 1`` filas: si llegó
+    la fila extra hay otra página, y se descarta antes de devolver.
+
+    Args:
+        rows: Filas obtenidas (se recortan a page_size en el lugar)
+        orden: Columna de ordenamiento
+        page_size: Tamaño de página
+
+    Returns:
+        Clave de la última fila de la página, o None si no hay más
+    """
+    if len(rows) <= page_size:
+        return None
+
+    del rows[page_size:]
+    ultima = rows[-1]
+    if orden == 'id':
+        return ultima['id']
+    return (ultima[orden], ultima['id'])
@@ -0,0 +1,356 @@
+"""
+Perfilado de sentencias SQL y registro de consultas lentas.
+"""
+import json
+import re
+import sqlite3
+import sys
+import threading
+import time
+from collections import Counter, deque
+from typing import Any, Deque, Dict, List, Optional
+
+from utils.logger import LOGGER_CONSULTAS_LENTAS, setup_logger
+
+logger = setup_logger(__name__)
+logger_lentas = setup_logger(LOGGER_CONSULTAS_LENTAS)
+
+# Módulos de infraestructura que no cuentan como origen de una consulta
+_MODULOS_INTERNOS = ('utils.database', 'utils.profiler', 'contextlib')
+# Solo estas sentencias admiten EXPLAIN QUERY PLAN con sentido
+_SENTENCIAS_EXPLICABLES = ('SELECT', 'WITH', 'INSERT', 'UPDATE', 'DELETE', 'REPLACE')
+
+_ESPACIOS = re.compile(r'\s+')
+_LISTA_MARCADORES = re.compile(r'\?(?:\s*,\s*\?)+')
+
+
+def normalizar_sentencia(sql: str) -> str:
+    """
+    Clave de agrupación de una sentencia.
+
+    Colapsa los espacios y las listas de marcadores de largo variable
+    (IN (?, ?, ...)) para que las variantes de una misma consulta sumen
+    a un único histograma.
+
+    Args:
+        sql: Texto de la sentencia
+
+    Returns:
+        str: Sentencia normalizada
+    """
+    return _LISTA_MARCADORES.sub('?, ...', _ESPACIOS.sub(' ', sql).strip())
+
+
+def _nombre_calificado(frame: Any) -> str:
+    """Nombre de la función de un marco, con su clase si es un método."""
+    codigo = frame.f_code
+    # co_qualname existe desde Python 3.11
+    calificado = getattr(codigo, 'co_qualname', None)
+    if calificado is not None:
+        return calificado
+    instancia = frame.f_locals.get('self', frame.f_locals.get('cls'))
+    if instancia is None:
+        return codigo.co_name
+    clase = instancia if isinstance(instancia, type) else type(instancia)
+    return f"{clase.__name__}.{codigo.co_name}"
+
+
+def _origen() -> str:
+    """
+    Método que originó la consulta en curso.
+
+    Busca en la pila el primer marco de un controlador; si no hay, usa el
+    primer marco fuera de la capa de base de datos.
+    """
+    frame = sys._getframe(2)
+    primero = None
+    while frame is not None:
+        modulo = frame.f_globals.get('__name__', '')
+        if modulo.startswith('controllers.'):
+            return _nombre_calificado(frame)
+        if primero is None and not modulo.startswith(_MODULOS_INTERNOS):
+            primero = frame
+        frame = frame.f_back
+    if primero is None:
+        return '?'
+    return f"{primero.f_globals.get('__name__', '?')}.{_nombre_calificado(primero)}"
+
+
+def _percentil(ordenadas: List[float], p: float) -> float:
+    """Percentil por rango más cercano de una lista ordenada."""
+    indice = max(0, min(len(ordenadas) - 1, round(p / 100 * len(ordenadas) + 0.5) - 1))
+    return ordenadas[indice]
+
+
+class _EstadisticaSentencia:
+    """Acumulados y muestras recientes de una sentencia normalizada."""
+
+    __slots__ = ('llamadas', 'total_ms', 'maximo_ms', 'filas', 'muestras', 'origenes')
+
+    def __init__(self, max_muestras: int):
+        self.llamadas = 0
+        self.total_ms = 0.0
+        self.maximo_ms = 0.0
+        self.filas = 0
+        self.muestras: Deque[float] = deque(maxlen=max_muestras)
+        self.origenes: Counter = Counter()
+
+
+class QueryProfiler:
+    """
+    Estadísticas de tiempo por sentencia SQL.
+
+    Por cada sentencia normalizada guarda llamadas, tiempo total y máximo,
+    filas devueltas, los métodos que la ejecutaron y las últimas
+    max_muestras duraciones, de las que se calculan p50/p95/p99. Las
+    ejecuciones que superan umbral_lento_ms se escriben en el logger
+    'consultas_lentas' junto con su EXPLAIN QUERY PLAN.
+    """
+
+    def __init__(self, umbral_lento_ms: float = 100.0, max_muestras: int = 1000):
+        """
+        Inicializa el perfilador vacío.
+
+        Args:
+            umbral_lento_ms: Duración a partir de la cual una consulta es lenta
+            max_muestras: Duraciones recientes guardadas por sentencia
+        """
+        self.umbral_lento_ms = umbral_lento_ms
+        self.max_muestras = max_muestras
+        self._sentencias: Dict[str, _EstadisticaSentencia] = {}
+        self._lentas = 0
+        self._lock = threading.Lock()
+
+    def registrar(self, conn: sqlite3.Connection, sql: str, params: Any,
+                  duracion_ms: float, filas: int, origen: str) -> None:
+        """
+        Registra una ejecución terminada.
+
+        Args:
+            conn: Conexión donde se ejecutó (para obtener el plan si es lenta)
+            sql: Texto de la sentencia
+            params: Parámetros usados
+            duracion_ms: Tiempo de ejecución y lectura de filas
+            filas: Filas devueltas (o afectadas si no es una consulta)
+            origen: Método que ejecutó la sentencia
+        """
+        clave = normalizar_sentencia(sql)
+        with self._lock:
+            estadistica = self._sentencias.get(clave)
+            if estadistica is None:
+                estadistica = _EstadisticaSentencia(self.max_muestras)
+                self._sentencias[clave] = estadistica
+            estadistica.llamadas += 1
+            estadistica.total_ms += duracion_ms
+            estadistica.maximo_ms = max(estadistica.maximo_ms, duracion_ms)
+            estadistica.filas += filas
+            estadistica.muestras.append(duracion_ms)
+            estadistica.origenes[origen] += 1
+            lenta = duracion_ms >= self.umbral_lento_ms
+            if lenta:
+                self._lentas += 1
+
+        if lenta:
+            logger_lentas.warning(
+                "%.1f ms, %s filas, %s\n  %s\n  params=%r\n  plan: %s",
+                duracion_ms, filas, origen, clave, params,
+                ' | '.join(self._plan(conn, sql, params)) or '-'
+            )
+
+    @staticmethod
+    def _plan(conn: sqlite3.Connection, sql: str, params: Any) -> List[str]:
+        """EXPLAIN QUERY PLAN de la sentencia (vacío si no aplica)."""
+        if params is None or not sql.lstrip().upper().startswith(_SENTENCIAS_EXPLICABLES):
+            return []
+        try:
+            # Cursor base: el EXPLAIN no se perfila a sí mismo
+            cursor = sqlite3.Cursor(conn)
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+            return [row[3] for row in cursor.fetchall()]
+        except sqlite3.Error as e:
+            return [f'(sin plan: {e})']
+
+    def estadisticas(self) -> List[Dict[str, Any]]:
+        """
+        Resumen por sentencia, de mayor a menor tiempo total.
+
+        Returns:
+            List[Dict[str, Any]]: 'sentencia', 'llamadas', 'total_ms',
+            'promedio_ms', 'maximo_ms', 'p50_ms', 'p95_ms', 'p99_ms',
+            'filas_promedio' y 'origenes' (método -> llamadas)
+        """
+        with self._lock:
+            copia = [(clave, e.llamadas, e.total_ms, e.maximo_ms, e.filas,
+                      sorted(e.muestras), dict(e.origenes))
+                     for clave, e in self._sentencias.items()]
+
+        resumen = []
+        for clave, llamadas, total, maximo, filas, muestras, origenes in copia:
+            resumen.append({
+                'sentencia': clave,
+                'llamadas': llamadas,
+                'total_ms': round(total, 3),
+                'promedio_ms': round(total / llamadas, 3),
+                'maximo_ms': round(maximo, 3),
+                'p50_ms': round(_percentil(muestras, 50), 3),
+                'p95_ms': round(_percentil(muestras, 95), 3),
+                'p99_ms': round(_percentil(muestras, 99), 3),
+                'filas_promedio': round(filas / llamadas, 1),
+                'origenes': origenes
+            })
+        resumen.sort(key=lambda r: r['total_ms'], reverse=True)
+        return resumen
+
+    def reporte(self, limite: int = 20) -> str:
+        """
+        Tabla de texto con las sentencias que más tiempo consumieron.
+
+        Args:
+            limite: Cantidad de sentencias a incluir
+
+        Returns:
+            str: Reporte legible
+        """
+        lineas = [f"{'llamadas':>8} {'total ms':>10} {'p50':>8} {'p95':>8} "
+                  f"{'p99':>8} {'filas':>8}  sentencia"]
+        for r in self.estadisticas()[:limite]:
+            lineas.append(
+                f"{r['llamadas']:>8} {r['total_ms']:>10.1f} {r['p50_ms']:>8.2f} "
+                f"{r['p95_ms']:>8.2f} {r['p99_ms']:>8.2f} {r['filas_promedio']:>8.1f}  "
+                f"{r['sentencia'][:100]}"
+            )
+        return '\n'.join(lineas)
+
+    def guardar(self, ruta: str) -> None:
+        """
+        Escribe las estadísticas en un archivo JSON.
+
+        Args:
+            ruta: Ruta del archivo
+        """
+        with self._lock:
+            lentas = self._lentas
+        with open(ruta, 'w', encoding='utf-8') as archivo:
+            json.dump({
+                'umbral_lento_ms': self.umbral_lento_ms,
+                'consultas_lentas': lentas,
+                'sentencias': self.estadisticas()
+            }, archivo, ensure_ascii=False, indent=2)
+        logger.info("Perfil de consultas guardado en %s", ruta)
+
+    def reiniciar(self) -> None:
+        """Descarta todas las estadísticas acumuladas."""
+        with self._lock:
+            self._sentencias.clear()
+            self._lentas = 0
+
+
+class CursorPerfilado(sqlite3.Cursor):
+    """
+    Cursor que mide cada sentencia desde execute() hasta leer la última fila.
+
+    La medición se cierra al agotar las filas, al ejecutar otra sentencia,
+    al cerrar el cursor o al liberarlo.
+    """
+
+    def __init__(self, conn: 'ConexionPerfilada'):
+        super().__init__(conn)
+        self._profiler: QueryProfiler = conn.profiler
+        self._medicion: Optional[list] = None
+
+    def execute(self, sql: str, parameters: Any = ()) -> 'CursorPerfilado':  # type: ignore[override]
+        self._finalizar()
+        inicio = time.perf_counter()
+        super().execute(sql, parameters)
+        # [sql, params, origen, ms acumulados, filas]
+        self._medicion = [sql, parameters, _origen(),
+                          (time.perf_counter() - inicio) * 1000, 0]
+        if self.description is None:
+            self._medicion[4] = max(self.rowcount, 0)
+            self._finalizar()
+        return self
+
+    def executemany(self, sql: str, seq_of_parameters: Any) -> 'CursorPerfilado':  # type: ignore[override]
+        self._finalizar()
+        inicio = time.perf_counter()
+        super().executemany(sql, seq_of_parameters)
+        # Sin parámetros únicos: el plan no se puede obtener
+        self._medicion = [sql, None, _origen(),
+                          (time.perf_counter() - inicio) * 1000, max(self.rowcount, 0)]
+        self._finalizar()
+        return self
+
+    def _leido(self, inicio: float, filas: int, agotado: bool) -> None:
+        """Suma el tiempo y las filas de una lectura."""
+        if self._medicion is not None:
+            self._medicion[3] += (time.perf_counter() - inicio) * 1000
+            self._medicion[4] += filas
+            if agotado:
+                self._finalizar()
+
+    def fetchone(self) -> Any:
+        inicio = time.perf_counter()
+        fila = super().fetchone()
+        self._leido(inicio, fila is not None, fila is None)
+        return fila
+
+    def fetchmany(self, size: int = -1) -> List[Any]:  # type: ignore[override]
+        inicio = time.perf_counter()
+        filas = super().fetchmany(self.arraysize if size == -1 else size)
+        self._leido(inicio, len(filas), not filas)
+        return filas
+
+    def fetchall(self) -> List[Any]:
+        inicio = time.perf_counter()
+        filas = super().fetchall()
+        self._leido(inicio, len(filas), True)
+        return filas
+
+    def __next__(self) -> Any:
+        inicio = time.perf_counter()
+        try:
+            fila = super().__next__()
+        except StopIteration:
+            self._leido(inicio, 0, True)
+            raise
+        self._leido(inicio, 1, False)
+        return fila
+
+    def close(self) -> None:
+        self._finalizar()
+        super().close()
+
+    def __del__(self) -> None:
+        try:
+            self._finalizar()
+        except Exception:
+            pass
+
+    def _finalizar(self) -> None:
+        """Entrega la medición en curso al perfilador."""
+        medicion, self._medicion = self._medicion, None
+        if medicion is not None:
+            sql, params, origen, duracion_ms, filas = medicion
+            self._profiler.registrar(self.connection, sql, params, duracion_ms, filas, origen)
+
+
+class ConexionPerfilada(sqlite3.Connection):
+    """
+    Conexión cuyos cursores (incluidos los de execute() y executemany())
+    se perfilan.
+
+    Se usa como factory de sqlite3.connect(); el perfilador se asigna en
+    el atributo profiler después de abrirla.
+    """
+
+    profiler: QueryProfiler
+
+    def cursor(self, factory: Any = CursorPerfilado) -> sqlite3.Cursor:  # type: ignore[override]
+        return super().cursor(factory)
+
+    # Connection.execute() nativo crea un cursor base sin pasar por cursor()
+    def execute(self, sql: str, parameters: Any = ()) -> sqlite3.Cursor:  # type: ignore[override]
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql: str, seq_of_parameters: Any) -> sqlite3.Cursor:  # type: ignore[override]
+        return self.cursor().executemany(sql, seq_of_parameters)
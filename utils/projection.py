@@ -0,0 +1,38 @@
+"""
+Proyección de columnas para consultas de listado.
+"""
+from typing import Iterable, Optional, Sequence
+
+
+def select_columns(fields: Optional[Sequence[str]], permitidas: Sequence[str],
+                   obligatorias: Iterable[str] = (), tabla: Optional[str] = None) -> str:
+    """
+    Construye la lista de columnas de un SELECT.
+
+    Sin proyección se seleccionan todas las columnas de la tabla. Con
+    proyección se seleccionan solo las pedidas, más las obligatorias que
+    necesite la consulta (por ejemplo, las claves de paginación).
+
+    Args:
+        fields: Columnas pedidas por el llamador (None para todas)
+        permitidas: Columnas válidas de la tabla
+        obligatorias: Columnas que se agregan siempre a la proyección
+        tabla: Nombre de la tabla para calificar las columnas (opcional)
+
+    Returns:
+        str: Lista de columnas para el SELECT
+
+    Raises:
+        ValueError: Si se pide una columna que no pertenece a la tabla
+    """
+    prefijo = f'{tabla}.' if tabla else ''
+    if fields is None:
+        return f'{prefijo}*'
+
+    invalidas = [campo for campo in fields if campo not in permitidas]
+    if invalidas or not fields:
+        raise ValueError(f"Columnas inválidas en la proyección: {invalidas or fields}")
+
+    # dict.fromkeys conserva el orden y quita duplicados
+    columnas = dict.fromkeys(list(obligatorias) + list(fields))
+    return ', '.join(f'{prefijo}{columna}' for columna in columnas)
@@ -0,0 +1,67 @@
+"""
+Medición de los tiempos de arranque de la aplicación.
+"""
+import sys
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Tuple
+
+
+class StartupTimer:
+    """
+    Registra la duración de cada fase del arranque y arma un reporte.
+
+    Para el detalle por módulo de las importaciones, ejecutar además
+    la aplicación con python -X importtime.
+    """
+
+    def __init__(self) -> None:
+        """Inicia el cronómetro en el momento de la creación."""
+        self.inicio = time.perf_counter()
+        self.fases: List[Tuple[str, float]] = []
+
+    @contextmanager
+    def fase(self, nombre: str) -> Iterator[None]:
+        """
+        Mide la duración del bloque como una fase del arranque.
+
+        Args:
+            nombre: Nombre de la fase en el reporte
+        """
+        inicio = time.perf_counter()
+        modulos = len(sys.modules)
+        try:
+            yield
+        finally:
+            nuevos = len(sys.modules) - modulos
+            if nuevos:
+                nombre = f"{nombre} ({nuevos} módulos)"
+            self.registrar(nombre, (time.perf_counter() - inicio) * 1000)
+
+    def registrar(self, nombre: str, milisegundos: float) -> None:
+        """
+        Registra una fase medida por otro componente.
+
+        Args:
+            nombre: Nombre de la fase en el reporte
+            milisegundos: Duración de la fase
+        """
+        self.fases.append((nombre, milisegundos))
+
+    def total_ms(self) -> float:
+        """Milisegundos transcurridos desde la creación del cronómetro."""
+        return (time.perf_counter() - self.inicio) * 1000
+
+    def reporte(self) -> str:
+        """
+        Arma el reporte de tiempos de arranque.
+
+        Returns:
+            str: Una línea por fase más el total transcurrido
+        """
+        ancho = max([len(nombre) for nombre, _ in self.fases] + [5])
+        lineas = ["Tiempos de arranque:"]
+        lineas += [f"  {nombre:<{ancho}}  {ms:8.1f} ms" for nombre, ms in self.fases]
+        lineas.append(f"  {'Total':<{ancho}}  {self.total_ms():8.1f} ms")
+        lineas.append("Detalle por módulo: python -X importtime main.py 2> importtime.log")
+        return "\n".join(lineas)
@@ -0,0 +1,197 @@
+"""
+Modelos de tabla virtualizados para listados grandes.
+"""
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt6.QtGui import QColor
+
+from utils.pagination import Pagina
+
+# (encabezado, función que extrae el valor, función de color opcional)
+Columna = Tuple[str, Callable[[Any], Any], Optional[Callable[[Any], Optional[str]]]]
+FetchPage = Callable[[int, Any], Pagina]
+
+
+def pagina_de_lista(items: List[Any]) -> FetchPage:
+    """
+    Adapta una lista ya cargada a la interfaz de páginas del modelo.
+
+    La clave de continuación es el desplazamiento dentro de la lista.
+
+    Args:
+        items: Lista completa de elementos
+
+    Returns:
+        FetchPage: Función (page_size, after_key) -> Pagina
+    """
+    def fetch(page_size: int, after_key: Any) -> Pagina:
+        inicio = after_key or 0
+        fin = inicio + page_size
+        siguiente = fin if fin < len(items) else None
+        return Pagina(items[inicio:fin], siguiente, page_size)
+
+    return fetch
+
+
+class LazyTableModel(QAbstractTableModel):
+    """
+    Modelo de tabla que obtiene filas por bloques a demanda.
+
+    Las filas se agregan con canFetchMore/fetchMore a medida que la vista
+    se desplaza. Solo se mantiene en memoria una ventana de bloques
+    decodificados (LRU); de cada bloque se conserva además su clave de
+    inicio, de modo que un bloque descartado puede volver a leerse con la
+    misma consulta paginada cuando la vista lo necesita.
+    """
+
+    def __init__(self, columnas: List[Columna], block_size: int = 200,
+                 max_bloques: int = 25, parent=None):
+        """
+        Inicializa el modelo.
+
+        Args:
+            columnas: Definición de columnas (encabezado, getter, color)
+            block_size: Filas por bloque (tamaño de página solicitado)
+            max_bloques: Bloques decodificados que se mantienen en memoria
+            parent: Objeto padre
+        """
+        super().__init__(parent)
+        self._columnas = columnas
+        self._block_size = block_size
+        self._max_bloques = max_bloques
+        self._fetch_page: Optional[FetchPage] = None
+        self._claves_bloque: List[Any] = []
+        self._bloques: 'OrderedDict[int, List[Any]]' = OrderedDict()
+        self._siguiente_cursor: Any = None
+        self._filas = 0
+
+    def set_fuente(self, fetch_page: FetchPage) -> None:
+        """
+        Reemplaza la fuente de datos y carga el primer bloque.
+
+        Args:
+            fetch_page: Función (page_size, after_key) -> Pagina
+        """
+        self.beginResetModel()
+        self._fetch_page = fetch_page
+        self._claves_bloque = []
+        self._bloques.clear()
+        self._siguiente_cursor = None
+        self._filas = 0
+        self.endResetModel()
+        self._agregar_bloque(None)
+
+    def _agregar_bloque(self, after_key: Any) -> None:
+        """Lee el bloque que comienza después de after_key y lo agrega al final."""
+        pagina = self._fetch_page(self._block_size, after_key)
+        if not pagina.items:
+            self._siguiente_cursor = None
+            return
+
+        indice = len(self._claves_bloque)
+        self.beginInsertRows(QModelIndex(), self._filas,
+                             self._filas + len(pagina.items) - 1)
+        self._claves_bloque.append(after_key)
+        self._guardar_bloque(indice, pagina.items)
+        self._filas += len(pagina.items)
+        self._siguiente_cursor = pagina.siguiente_cursor
+        self.endInsertRows()
+
+    def _guardar_bloque(self, indice: int, items: List[Any]) -> None:
+        """Guarda un bloque en la ventana y descarta el menos usado."""
+        self._bloques[indice] = items
+        self._bloques.move_to_end(indice)
+        while len(self._bloques) > self._max_bloques:
+            self._bloques.popitem(last=False)
+
+    def _bloque(self, indice: int) -> List[Any]:
+        """Obtiene un bloque, releyéndolo si fue descartado de la ventana."""
+        items = self._bloques.get(indice)
+        if items is None:
+            pagina = self._fetch_page(self._block_size, self._claves_bloque[indice])
+            items = pagina.items
+            self._guardar_bloque(indice, items)
+        else:
+            self._bloques.move_to_end(indice)
+        return items
+
+    def item(self, fila: int) -> Optional[Any]:
+        """
+        Obtiene el elemento de una fila.
+
+        Args:
+            fila: Número de fila
+
+        Returns:
+            Elemento de la fila o None si está fuera de rango
+        """
+        if fila < 0 or fila >= self._filas:
+            return None
+        items = self._bloque(fila // self._block_size)
+        posicion = fila % self._block_size
+        return items[posicion] if posicion < len(items) else None
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Cantidad de filas cargadas hasta el momento."""
+        return 0 if parent.isValid() else self._filas
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Cantidad de columnas."""
+        return 0 if parent.isValid() else len(self._columnas)
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        """Indica si hay más bloques por leer."""
+        return not parent.isValid() and self._siguiente_cursor is not None
+
+    def fetchMore(self, parent: QModelIndex) -> None:
+        """Lee el siguiente bloque cuando la vista llega al final."""
+        if self.canFetchMore(parent):
+            self._agregar_bloque(self._siguiente_cursor)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """Devuelve el texto o color de una celda según el rol."""
+        if not index.isValid():
+            return None
+
+        if role not in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ForegroundRole):
+            return None
+
+        elemento = self.item(index.row())
+        if elemento is None:
+            return None
+
+        _, getter, color = self._columnas[index.column()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return str(getter(elemento))
+
+        if color is not None:
+            nombre_color = color(elemento)
+            if nombre_color:
+                return QColor(nombre_color)
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """Devuelve los encabezados de columna."""
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self._columnas[section][0]
+        return None
+
+
+def color_baja(elemento: Any) -> str:
+    """Color para la columna de estado de registro (activo/inactivo)."""
+    return 'red' if elemento.baja else '#008000'
+
+
+COLORES_ESTADO_SERVICIO: Dict[str, str] = {
+    'COMPLETADO': '#008000',
+    'CANCELADO': 'red',
+    'EN_PROCESO': 'blue',
+}
+
+
+def color_estado_servicio(servicio: Any) -> Optional[str]:
+    """Color para la columna de estado de un servicio."""
+    return COLORES_ESTADO_SERVICIO.get(servicio.estado)
@@ -1,10 +1,11 @@
 """
 Utilidades para componentes UI reutilizables.
 """
-from PyQt6.QtWidgets import QTableWidget, QTableWidgetItem
-from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QTableWidget, QTableWidgetItem, QProgressDialog, QWidget
+from PyQt6.QtCore import Qt, QThreadPool
 from PyQt6.QtGui import QColor
-from typing import List, Callable, Tuple
+from typing import Any, List, Callable, Tuple
+from utils.workers import TareaCancelable
 
 
 def populate_table(
@@ -34,3 +35,54 @@ def populate_table(
                     table_item.setForeground(QColor(color_func(item)))
             
             table.setItem(row_idx, col_idx, table_item)
+
+
+def run_with_progress(
+    parent: QWidget,
+    label: str,
+    funcion: Callable[[Callable[[int, int], None], Callable[[], bool]], Any],
+    on_finished: Callable[[Any], None],
+    on_error: Callable[[str], None]
+) -> TareaCancelable:
+    """
+    Run a long task in the thread pool behind a cancellable progress dialog.
+    
+    Args:
+        parent: Widget that owns the progress dialog
+        label: Text shown in the progress dialog
+        funcion: Task function (on_progress, is_cancelled) -> result
+        on_finished: Called on the GUI thread with the task result
+        on_error: Called on the GUI thread with the error message
+    
+    Returns:
+        The running task (kept referenced by the parent until it finishes)
+    """
+    tarea = TareaCancelable(funcion)
+    
+    dialog = QProgressDialog(label, "Cancelar", 0, 0, parent)
+    dialog.setWindowModality(Qt.WindowModality.WindowModal)
+    dialog.setMinimumDuration(300)
+    dialog.setAutoClose(False)
+    dialog.setAutoReset(False)
+    dialog.canceled.connect(tarea.cancelar)
+    
+    def actualizar_progreso(actual: int, total: int) -> None:
+        dialog.setMaximum(max(total, 1))
+        dialog.setValue(actual)
+    
+    def finalizar(callback: Callable[[Any], None], valor: Any) -> None:
+        dialog.close()
+        parent._tareas_en_curso.discard(tarea)
+        callback(valor)
+    
+    tarea.signals.progreso.connect(actualizar_progreso)
+    tarea.signals.terminado.connect(lambda resultado: finalizar(on_finished, resultado))
+    tarea.signals.error.connect(lambda mensaje: finalizar(on_error, mensaje))
+    
+    # Evita que la tarea y sus señales se liberen antes de terminar
+    if not hasattr(parent, '_tareas_en_curso'):
+        parent._tareas_en_curso = set()
+    parent._tareas_en_curso.add(tarea)
+    
+    QThreadPool.globalInstance().start(tarea)
+    return tarea
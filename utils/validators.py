@@ -1,7 +1,30 @@
 """
 Módulo con funciones de validación.
+
+Las funciones validar_* revisan un valor; las versiones en plural
+(validar_dnis, validar_telefonos, validar_fechas_iso) revisan una columna
+entera y devuelven una máscara con un booleano por valor, con el mismo
+criterio que la versión individual.
 """
 import re
+from datetime import date
+from itertools import repeat
+from typing import Iterable, Iterator, List, Optional
+
+# Separadores que se ignoran en un teléfono (\s incluye los espacios Unicode)
+_SEPARADORES_TELEFONO = re.compile(r'[\s\-()]')
+# Carácter con el que se une una columna para limpiarla de una vez
+_UNION = '\x00'
+
+
+def _limpiar_telefono(telefono: str) -> str:
+    """Quita los separadores de un teléfono."""
+    # Los separadores ASCII cubren casi todos los casos sin pasar por re
+    limpio = telefono.replace(' ', '').replace('-', '').replace('(', '').replace(')', '')
+    if not limpio.isdigit():
+        limpio = _SEPARADORES_TELEFONO.sub('', limpio)
+    return limpio
+
 
 def validar_dni(dni: str) -> bool:
     """
@@ -36,7 +59,7 @@ def validar_telefono(telefono: str) -> bool:
         bool: True si el teléfono es válido
     """
     # Eliminar espacios, guiones y paréntesis
-    telefono_limpio = re.sub(r'[\s\-\(\)]', '', telefono)
+    telefono_limpio = _limpiar_telefono(telefono)
     
     # Validar que sean solo números y tenga entre 8 y 15 dígitos
     if not telefono_limpio.isdigit():
@@ -45,4 +68,108 @@ def validar_telefono(telefono: str) -> bool:
     if len(telefono_limpio) < 8 or len(telefono_limpio) > 15:
         return False
     
-    return True
\ No newline at end of file
+    return True
+
+
+def _limpiar_columna(valores: List[str], separadores: str) -> List[str]:
+    """
+    Quita caracteres de todos los valores de una columna a la vez.
+
+    Une la columna en un solo texto y aplica un replace por separador, en
+    lugar de limpiar valor por valor.
+    """
+    texto = _UNION.join(valores)
+    for separador in separadores:
+        texto = texto.replace(separador, '')
+    limpios = texto.split(_UNION)
+    if len(limpios) != len(valores):
+        # Algún valor contenía el carácter de unión
+        limpios = list(valores)
+        for separador in separadores:
+            limpios = [valor.replace(separador, '') for valor in limpios]
+    return limpios
+
+
+def validar_dnis(dnis: Iterable[str]) -> List[bool]:
+    """
+    Valida una columna de DNIs.
+
+    Args:
+        dnis: DNIs a validar
+
+    Returns:
+        List[bool]: True en la posición de cada DNI válido
+    """
+    return [limpio.isdigit() and 7 <= len(limpio) <= 8
+            for limpio in _limpiar_columna(list(dnis), '. ')]
+
+
+def validar_telefonos(telefonos: Iterable[Optional[str]],
+                      opcional: bool = False) -> List[bool]:
+    """
+    Valida una columna de teléfonos.
+
+    Args:
+        telefonos: Teléfonos a validar
+        opcional: Si True, los valores vacíos (o None) cuentan como válidos
+
+    Returns:
+        List[bool]: True en la posición de cada teléfono válido
+    """
+    telefonos = [telefono or '' for telefono in telefonos]
+    limpios = _limpiar_columna(telefonos, ' -()')
+    validos = [limpio.isdigit() and 8 <= len(limpio) <= 15 for limpio in limpios]
+    for i in posiciones_invalidas(validos):
+        if opcional and not telefonos[i]:
+            validos[i] = True
+        elif not limpios[i].isdigit():
+            # Separadores no ASCII (p. ej. espacios Unicode)
+            limpio = _SEPARADORES_TELEFONO.sub('', limpios[i])
+            validos[i] = limpio.isdigit() and 8 <= len(limpio) <= 15
+    return validos
+
+
+def posiciones_invalidas(mascara: List[bool]) -> Iterator[int]:
+    """
+    Recorre las posiciones en False de una máscara.
+
+    La búsqueda la hace list.index, así que una máscara casi toda válida se
+    recorre sin iterar en Python sobre cada posición.
+
+    Args:
+        mascara: Máscara de validación
+
+    Yields:
+        int: Posición de cada valor inválido, en orden
+    """
+    i = -1
+    while True:
+        try:
+            i = mascara.index(False, i + 1)
+        except ValueError:
+            return
+        yield i
+
+
+def validar_fechas_iso(fechas: Iterable[Optional[str]]) -> List[bool]:
+    """
+    Valida una columna de fechas en formato ISO (date.fromisoformat).
+
+    Los valores vacíos y los que no son texto (p. ej. objetos date) se
+    consideran válidos. Cada valor distinto se analiza una sola vez.
+
+    Args:
+        fechas: Fechas a validar
+
+    Returns:
+        List[bool]: True en la posición de cada fecha válida
+    """
+    fechas = list(fechas)
+    invalidas = {}
+    for fecha in set(fechas):
+        if fecha and isinstance(fecha, str):
+            try:
+                date.fromisoformat(fecha)
+            except ValueError:
+                invalidas[fecha] = False
+    return list(map(invalidas.get, fechas, repeat(True)))
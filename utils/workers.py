@@ -0,0 +1,178 @@
+"""
+Tareas en segundo plano sobre QThreadPool.
+"""
+import threading
+from typing import Any, Callable
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+from utils.database import DatabaseConnection
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class TareaSignals(QObject):
+    """
+    Señales emitidas por una TareaConsulta.
+
+    Cada señal incluye el número de generación de la tarea para que el
+    receptor pueda descartar resultados de tareas ya reemplazadas.
+    """
+    terminado = pyqtSignal(int, object)
+    error = pyqtSignal(int, str)
+
+
+class TareaConsulta(QRunnable):
+    """
+    Ejecuta una función en un hilo del pool y publica su resultado.
+
+    Los controladores usan la conexión SQLite propia de cada hilo, por lo
+    que es seguro llamarlos desde aquí. La conexión que abra la tarea se
+    cierra al terminar, antes de emitir el resultado.
+    """
+
+    def __init__(self, generacion: int, funcion: Callable[..., Any], *args: Any):
+        """
+        Inicializa la tarea.
+
+        Args:
+            generacion: Número de generación de la solicitud
+            funcion: Función a ejecutar en segundo plano
+            *args: Argumentos para la función
+        """
+        super().__init__()
+        self.generacion = generacion
+        self.funcion = funcion
+        self.args = args
+        self.signals = TareaSignals()
+
+    def run(self) -> None:
+        """Ejecuta la función y emite el resultado o el error."""
+        try:
+            resultado = self.funcion(*self.args)
+        except Exception as e:
+            logger.error("Error en tarea de segundo plano: %s", e)
+            self.signals.error.emit(self.generacion, str(e))
+            return
+        finally:
+            DatabaseConnection().release_connection()
+        self.signals.terminado.emit(self.generacion, resultado)
+
+
+class BusquedaDiferida(QObject):
+    """
+    Búsqueda con espera (debounce) ejecutada en un hilo del pool.
+
+    Cada llamada a solicitar() reinicia la espera; solo cuando el usuario
+    deja de escribir se lanza una consulta. Si llega una nueva solicitud
+    mientras otra consulta está en curso, el resultado anterior se descarta
+    y solo se emite el de la solicitud más reciente.
+    """
+    resultados = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+    def __init__(self, funcion: Callable[..., Any], demora_ms: int = 250,
+                 parent: QObject = None):
+        """
+        Inicializa la búsqueda diferida.
+
+        Args:
+            funcion: Función de consulta que se ejecuta en segundo plano
+            demora_ms: Milisegundos sin nuevas solicitudes antes de consultar
+            parent: Objeto padre
+        """
+        super().__init__(parent)
+        self._funcion = funcion
+        self._args: tuple = ()
+        self._generacion = 0
+        self._signals_actuales = None
+        self._pool = QThreadPool.globalInstance()
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(demora_ms)
+        self._timer.timeout.connect(self._ejecutar)
+
+    def solicitar(self, *args: Any) -> None:
+        """
+        Programa una búsqueda con los argumentos dados.
+
+        Args:
+            *args: Argumentos para la función de consulta (se leen en el
+                hilo de la interfaz y se pasan al hilo de trabajo)
+        """
+        self._args = args
+        self._timer.start()
+
+    def cancelar(self) -> None:
+        """Cancela la búsqueda pendiente y descarta la que esté en curso."""
+        self._timer.stop()
+        self._generacion += 1
+
+    def _ejecutar(self) -> None:
+        """Lanza la consulta en el pool con una nueva generación."""
+        self._generacion += 1
+        tarea = TareaConsulta(self._generacion, self._funcion, *self._args)
+        tarea.signals.terminado.connect(self._on_terminado)
+        tarea.signals.error.connect(self._on_error)
+        # Mantiene vivas las señales de la última tarea hasta recibir el resultado
+        self._signals_actuales = tarea.signals
+        self._pool.start(tarea)
+
+    def _on_terminado(self, generacion: int, resultado: Any) -> None:
+        """Emite el resultado solo si corresponde a la última solicitud."""
+        if generacion == self._generacion:
+            self.resultados.emit(resultado)
+
+    def _on_error(self, generacion: int, mensaje: str) -> None:
+        """Emite el error solo si corresponde a la última solicitud."""
+        if generacion == self._generacion:
+            self.error.emit(mensaje)
+
+
+class TareaCancelableSignals(QObject):
+    """Señales emitidas por una TareaCancelable."""
+    progreso = pyqtSignal(int, int)
+    terminado = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+
+class TareaCancelable(QRunnable):
+    """
+    Tarea larga en segundo plano con progreso y cancelación.
+
+    La función recibe dos argumentos: on_progress(actual, total), que
+    publica el avance como señal, e is_cancelled(), que indica si el
+    usuario pidió cancelar. Como en TareaConsulta, la conexión SQLite del
+    hilo se cierra al terminar.
+    """
+
+    def __init__(self, funcion: Callable[[Callable[[int, int], None],
+                                          Callable[[], bool]], Any]):
+        """
+        Inicializa la tarea.
+
+        Args:
+            funcion: Función (on_progress, is_cancelled) -> resultado
+        """
+        super().__init__()
+        self.funcion = funcion
+        self.signals = TareaCancelableSignals()
+        self._cancelado = threading.Event()
+
+    def cancelar(self) -> None:
+        """Solicita la cancelación; la función la verá en is_cancelled()."""
+        self._cancelado.set()
+
+    def run(self) -> None:
+        """Ejecuta la función y emite el resultado o el error."""
+        try:
+            resultado = self.funcion(self.signals.progreso.emit, self._cancelado.is_set)
+        except Exception as e:
+            logger.error("Error en tarea cancelable: %s", e)
+            self.signals.error.emit(str(e))
+            return
+        finally:
+            DatabaseConnection().release_connection()
+        self.signals.terminado.emit(resultado)
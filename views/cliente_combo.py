@@ -0,0 +1,209 @@
+"""
+Selector de clientes con autocompletado para formularios.
+"""
+from typing import Any, List, Optional, Tuple
+
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, Qt
+from PyQt6.QtWidgets import QComboBox, QCompleter
+
+from controllers.cliente_controller import ClienteController
+from utils.cache import RecentItems
+from utils.workers import BusquedaDiferida
+
+# Columnas mínimas que necesita el selector
+CAMPOS_CLIENTE_SELECTOR = ('id', 'nombre', 'apellido', 'dni')
+
+
+def texto_cliente(cliente: Any) -> str:
+    """
+    Texto con el que se muestra un cliente en el selector.
+
+    Args:
+        cliente: Cliente o fila con nombre, apellido y dni
+
+    Returns:
+        str: "Nombre Apellido - DNI"
+    """
+    return f"{cliente['nombre']} {cliente['apellido']} - {cliente['dni']}"
+
+
+class SugerenciasClienteModel(QAbstractListModel):
+    """
+    Modelo de sugerencias sobre el índice de texto completo de clientes.
+
+    Recibe el primer lote de resultados de una búsqueda y pide los lotes
+    siguientes con cargar_mas() cuando el desplegable llega al final. No se
+    usa canFetchMore/fetchMore porque QCompleter los invoca hasta agotar el
+    modelo, lo que leería todos los resultados de una vez.
+    """
+
+    def __init__(self, controller: ClienteController, lote: int = 50, parent=None):
+        """
+        Inicializa el modelo.
+
+        Args:
+            controller: Controlador de clientes
+            lote: Resultados por consulta
+            parent: Objeto padre
+        """
+        super().__init__(parent)
+        self._controller = controller
+        self.lote = lote
+        self._consulta = ""
+        self._filas: List[Tuple[int, str]] = []
+        self._hay_mas = False
+
+    def set_resultados(self, consulta: str, clientes: List[Any]) -> None:
+        """
+        Reemplaza las sugerencias con el primer lote de una búsqueda.
+
+        Args:
+            consulta: Texto buscado
+            clientes: Primer lote de resultados
+        """
+        self.beginResetModel()
+        self._consulta = consulta
+        self._filas = [(cliente['id'], texto_cliente(cliente)) for cliente in clientes]
+        self._hay_mas = len(clientes) >= self.lote
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Cantidad de sugerencias cargadas."""
+        return 0 if parent.isValid() else len(self._filas)
+
+    def cargar_mas(self) -> None:
+        """Pide el siguiente lote de resultados de la búsqueda actual."""
+        if not self._hay_mas:
+            return
+
+        clientes = self._controller.buscar_clientes_fulltext(
+            self._consulta, self.lote, None, CAMPOS_CLIENTE_SELECTOR, len(self._filas)
+        )
+        self._hay_mas = len(clientes) >= self.lote
+        if not clientes:
+            return
+
+        inicio = len(self._filas)
+        self.beginInsertRows(QModelIndex(), inicio, inicio + len(clientes) - 1)
+        self._filas.extend((cliente['id'], texto_cliente(cliente)) for cliente in clientes)
+        self.endInsertRows()
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """Devuelve el texto o el id del cliente según el rol."""
+        if not index.isValid():
+            return None
+        cliente_id, texto = self._filas[index.row()]
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return texto
+        if role == Qt.ItemDataRole.UserRole:
+            return cliente_id
+        return None
+
+
+class ClienteComboBox(QComboBox):
+    """
+    Combo editable para elegir un cliente sin cargarlos todos.
+
+    El combo solo contiene los clientes usados recientemente (compartidos
+    entre formularios) y los que se van seleccionando; al escribir, un
+    completer consulta el índice de texto completo en segundo plano. Abrir
+    el formulario no depende de la cantidad de clientes.
+    """
+
+    # Clientes elegidos recientemente, compartidos por todos los selectores
+    _recientes = RecentItems(10)
+
+    def __init__(self, parent=None):
+        """
+        Inicializa el selector.
+
+        Args:
+            parent: Widget padre
+        """
+        super().__init__(parent)
+        self.controller = ClienteController()
+        self._consulta = ""
+        self.setEditable(True)
+        self.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
+        self.lineEdit().setPlaceholderText("Escriba nombre, apellido o DNI...")
+
+        self._sugerencias = SugerenciasClienteModel(self.controller, parent=self)
+        self._completer = QCompleter(self._sugerencias, self)
+        self._completer.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
+        self._completer.activated[QModelIndex].connect(self._sugerencia_elegida)
+        # Se asigna al QLineEdit para manejar la selección por id y no por texto
+        self.lineEdit().setCompleter(self._completer)
+        self._completer.popup().verticalScrollBar().valueChanged.connect(self._desplazado)
+
+        self._busqueda = BusquedaDiferida(self.controller.buscar_clientes_fulltext,
+                                          parent=self)
+        self._busqueda.resultados.connect(self._mostrar_sugerencias)
+        self.lineEdit().textEdited.connect(self._buscar)
+
+        for cliente_id, texto in self._recientes.items():
+            self.addItem(texto, cliente_id)
+        self.setCurrentIndex(-1)
+
+    def _buscar(self, texto: str) -> None:
+        """Programa la búsqueda de sugerencias para el texto ingresado."""
+        self._consulta = texto.strip()
+        if not self._consulta:
+            self._busqueda.cancelar()
+            self._sugerencias.set_resultados("", [])
+            return
+        self._busqueda.solicitar(self._consulta, self._sugerencias.lote, None,
+                                 CAMPOS_CLIENTE_SELECTOR)
+
+    def _mostrar_sugerencias(self, clientes: List[Any]) -> None:
+        """Carga el primer lote de sugerencias y abre el desplegable."""
+        self._sugerencias.set_resultados(self._consulta, clientes)
+        if clientes and self.lineEdit().hasFocus():
+            self._completer.complete()
+
+    def _desplazado(self, valor: int) -> None:
+        """Carga más sugerencias al llegar al final del desplegable."""
+        if valor == self._completer.popup().verticalScrollBar().maximum():
+            self._sugerencias.cargar_mas()
+
+    def _sugerencia_elegida(self, index: QModelIndex) -> None:
+        """Selecciona el cliente elegido en el completer."""
+        self.seleccionar_cliente(index.data(Qt.ItemDataRole.UserRole),
+                                 index.data(Qt.ItemDataRole.DisplayRole))
+
+    def seleccionar_cliente(self, cliente_id: int, texto: Optional[str] = None) -> None:
+        """
+        Selecciona un cliente, agregándolo al combo si no estaba.
+
+        Args:
+            cliente_id: ID del cliente
+            texto: Texto a mostrar; si no se indica se lee el cliente
+        """
+        index = self.findData(cliente_id)
+        if index < 0:
+            if texto is None:
+                cliente = self.controller.obtener_cliente(cliente_id)
+                if cliente is None:
+                    return
+                texto = texto_cliente(cliente.to_dict())
+            self.insertItem(0, texto, cliente_id)
+            index = 0
+        self.setCurrentIndex(index)
+
+    def cliente_id(self) -> Optional[int]:
+        """
+        Obtiene el cliente seleccionado.
+
+        Returns:
+            Optional[int]: ID del cliente o None si el texto escrito no
+            corresponde a un cliente elegido
+        """
+        index = self.currentIndex()
+        if index < 0 or self.currentText() != self.itemText(index):
+            return None
+        return self.itemData(index)
+
+    def registrar_uso(self) -> None:
+        """Agrega el cliente seleccionado a los recientes."""
+        cliente_id = self.cliente_id()
+        if cliente_id is not None:
+            self._recientes.add(cliente_id, self.itemText(self.currentIndex()))
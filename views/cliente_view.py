@@ -2,7 +2,7 @@
 Vista para la gestión de clientes.
 """
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-                             QTableWidget, QTableWidgetItem, QLabel, QLineEdit,
+                             QTableView, QAbstractItemView, QLabel, QLineEdit,
                              QMessageBox, QDialog, QFormLayout, QComboBox,
                              QCheckBox, QHeaderView, QFrame)
 from PyQt6.QtCore import Qt
@@ -10,7 +10,18 @@ from PyQt6.QtGui import QFont
 from controllers.cliente_controller import ClienteController
 from utils.styles import get_stylesheet
 from utils.icons import icon_button_text
-from utils.export import ReportGenerator
+from utils.table_models import LazyTableModel, pagina_de_lista, color_baja
+from utils.workers import BusquedaDiferida
+from utils.ui_helpers import run_with_progress
+
+COLUMNAS_CLIENTES = [
+    ("ID", lambda c: c.id, None),
+    ("Nombre", lambda c: c.nombre, None),
+    ("Apellido", lambda c: c.apellido, None),
+    ("DNI", lambda c: c.dni, None),
+    ("Teléfono", lambda c: c.telefono, None),
+    ("Estado", lambda c: "Activo" if not c.baja else "Inactivo", color_baja),
+]
 
 class ClienteDialog(QDialog):
     """
@@ -138,11 +149,16 @@ class ClienteView(QWidget):
     Vista principal para la gestión de clientes.
     """
     
+    PAGE_SIZE = 200
+    LIMITE_BUSQUEDA = 500
+    
     def __init__(self):
         """Inicializa la vista de clientes."""
         super().__init__()
         self.controller = ClienteController()
-        self.report_generator = ReportGenerator()
+        self.busqueda = BusquedaDiferida(self.controller.buscar_clientes_fulltext, parent=self)
+        self.busqueda.resultados.connect(self.mostrar_resultados_busqueda)
+        self.report_generator = None
         self.setStyleSheet(get_stylesheet())
         self.init_ui()
         self.cargar_clientes()
@@ -165,12 +181,13 @@ class ClienteView(QWidget):
         
         search_label = QLabel(icon_button_text("filter", "Filtrar por:"))
         self.search_combo = QComboBox()
-        self.search_combo.addItems(["Nombre", "Apellido", "DNI"])
+        self.search_combo.addItems(["Todos", "Nombre", "Apellido", "DNI"])
         self.search_combo.setMaximumWidth(150)
         
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Ingrese el valor a buscar...")
         self.search_input.textChanged.connect(self.buscar_clientes)
+        self.search_combo.currentTextChanged.connect(self.buscar_clientes)
         
         search_layout.addWidget(search_label)
         search_layout.addWidget(self.search_combo)
@@ -179,18 +196,18 @@ class ClienteView(QWidget):
         
         layout.addLayout(search_layout)
         
-        self.clientes_table = QTableWidget()
-        self.clientes_table.setColumnCount(6)
-        self.clientes_table.setHorizontalHeaderLabels([
-            "ID", "Nombre", "Apellido", "DNI", "Teléfono", "Estado"
-        ])
+        self.clientes_model = LazyTableModel(COLUMNAS_CLIENTES, block_size=self.PAGE_SIZE)
+        self.clientes_table = QTableView()
+        self.clientes_table.setModel(self.clientes_model)
         
         header = self.clientes_table.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
-        self.clientes_table.setColumnWidth(0, 0)
+        # ResizeToContents recorre todas las filas: con modelos grandes se usa Interactive
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        header.setStretchLastSection(True)
         self.clientes_table.horizontalHeader().hideSection(0)
+        self.clientes_table.verticalHeader().setDefaultSectionSize(30)
         self.clientes_table.setAlternatingRowColors(True)
-        self.clientes_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.clientes_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         
         layout.addWidget(self.clientes_table)
         
@@ -230,51 +247,29 @@ class ClienteView(QWidget):
         self.setLayout(layout)
     
     def cargar_clientes(self):
-        """Carga todos los clientes en la tabla."""
-        clientes = self.controller.obtener_todos_clientes()
-        self.clientes_table.setRowCount(len(clientes))
-        
-        for i, cliente in enumerate(clientes):
-            self.clientes_table.setItem(i, 0, QTableWidgetItem(str(cliente.id)))
-            self.clientes_table.setItem(i, 1, QTableWidgetItem(cliente.nombre))
-            self.clientes_table.setItem(i, 2, QTableWidgetItem(cliente.apellido))
-            self.clientes_table.setItem(i, 3, QTableWidgetItem(cliente.dni))
-            self.clientes_table.setItem(i, 4, QTableWidgetItem(cliente.telefono))
-            
-            estado = "Activo" if not cliente.baja else "Inactivo"
-            estado_item = QTableWidgetItem(estado)
-            if cliente.baja:
-                estado_item.setForeground(Qt.GlobalColor.red)
-            else:
-                estado_item.setForeground(Qt.GlobalColor.darkGreen)
-            self.clientes_table.setItem(i, 5, estado_item)
+        """Carga los clientes en la tabla; las filas se leen por bloques al desplazarse."""
+        self.clientes_model.set_fuente(
+            lambda page_size, after_key: self.controller.obtener_clientes_paginados(
+                page_size, after_key
+            )
+        )
     
     def buscar_clientes(self):
-        """Busca clientes según el criterio seleccionado."""
+        """Programa la búsqueda de clientes según el criterio seleccionado."""
         criterio = self.search_combo.currentText().lower()
         valor = self.search_input.text()
         
         if not valor:
+            self.busqueda.cancelar()
             self.cargar_clientes()
             return
         
-        clientes = self.controller.buscar_clientes(criterio, valor)
-        self.clientes_table.setRowCount(len(clientes))
-        
-        for i, cliente in enumerate(clientes):
-            self.clientes_table.setItem(i, 0, QTableWidgetItem(str(cliente.id)))
-            self.clientes_table.setItem(i, 1, QTableWidgetItem(cliente.nombre))
-            self.clientes_table.setItem(i, 2, QTableWidgetItem(cliente.apellido))
-            self.clientes_table.setItem(i, 3, QTableWidgetItem(cliente.dni))
-            self.clientes_table.setItem(i, 4, QTableWidgetItem(cliente.telefono))
-            
-            estado = "Activo" if not cliente.baja else "Inactivo"
-            estado_item = QTableWidgetItem(estado)
-            if cliente.baja:
-                estado_item.setForeground(Qt.GlobalColor.red)
-            else:
-                estado_item.setForeground(Qt.GlobalColor.darkGreen)
-            self.clientes_table.setItem(i, 5, estado_item)
+        columna = None if criterio == "todos" else criterio
+        self.busqueda.solicitar(valor, self.LIMITE_BUSQUEDA, columna)
+    
+    def mostrar_resultados_busqueda(self, clientes):
+        """Muestra en la tabla el resultado de la última búsqueda."""
+        self.clientes_model.set_fuente(pagina_de_lista(clientes))
     
     def obtener_cliente_seleccionado(self):
         """Obtiene el cliente seleccionado en la tabla."""
@@ -282,24 +277,46 @@ class ClienteView(QWidget):
         if not selected_rows:
             return None
         
-        row = selected_rows[0].row()
-        cliente_id = int(self.clientes_table.item(row, 0).text())
-        return self.controller.obtener_cliente(cliente_id)
+        cliente = self.clientes_model.item(selected_rows[0].row())
+        if cliente is None:
+            return None
+        return self.controller.obtener_cliente(cliente.id)
     
     def exportar_clientes(self):
-        """Exporta todos los clientes a CSV."""
-        clientes = self.controller.obtener_todos_clientes(incluir_bajas=True)
-        clientes_data = [c.to_dict() for c in clientes]
+        """Exporta todos los clientes a CSV en segundo plano."""
+        total = self.controller.obtener_estadisticas()['total']
         
-        filepath = self.report_generator.export_clientes_csv(clientes_data)
+        if self.report_generator is None:
+            from utils.export import ReportGenerator
+            self.report_generator = ReportGenerator()
+        
+        def exportar(on_progress, is_cancelled):
+            return self.report_generator.export_clientes_csv_stream(
+                self.controller.iterar_clientes_export(incluir_bajas=True),
+                total, on_progress, is_cancelled
+            )
+        
+        self.exportar_btn.setEnabled(False)
+        run_with_progress(self, "Exportando clientes...", exportar,
+                          self._exportacion_terminada, self._exportacion_fallida)
+    
+    def _exportacion_terminada(self, filepath):
+        """Informa el resultado de la exportación."""
+        self.exportar_btn.setEnabled(True)
+        # Sin ruta: el usuario canceló y el archivo parcial ya se eliminó
         if filepath:
             QMessageBox.information(
                 self, 
                 "Éxito", 
                 f"Archivo exportado a:\n{filepath}"
             )
-        else:
-            QMessageBox.warning(self, "Error", "No se pudo exportar los clientes.")
+    
+    def _exportacion_fallida(self, mensaje):
+        """Informa un error durante la exportación."""
+        self.exportar_btn.setEnabled(True)
+        QMessageBox.warning(
+            self, "Error", f"No se pudo exportar los clientes:\n{mensaje}"
+        )
     
     def nuevo_cliente(self):
         """Abre el diálogo para crear un nuevo cliente."""
@@ -1,14 +1,23 @@
 """
 Vista principal del dashboard.
 """
+from typing import Any, Dict, List, Optional
+
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-                             QFrame, QPushButton, QGridLayout)
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont, QColor
+                             QFrame, QPushButton, QGridLayout, QToolTip)
+from PyQt6.QtCore import Qt, QPointF, QRectF, QThreadPool, QTimer
+from PyQt6.QtGui import QFont, QColor, QPainter, QPen
+from controllers.analitica_controller import AnaliticaController
 from controllers.cliente_controller import ClienteController
 from controllers.servicio_controller import ServicioController
+from config import DASHBOARD_REFRESH_MS
+from utils.database import DatabaseConnection
+from utils.logger import setup_logger
 from utils.styles import CURRENT_THEME
 from utils.icons import icon_button_text
+from utils.workers import TareaConsulta
+
+logger = setup_logger(__name__)
 
 
 class StatCard(QFrame):
@@ -53,17 +62,17 @@ class StatCard(QFrame):
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         title_label.setStyleSheet(f"color: {CURRENT_THEME['text_secondary']};")
         
-        value_label = QLabel(value)
+        self.value_label = QLabel(value)
         value_font = QFont()
         value_font.setPointSize(28)
         value_font.setWeight(QFont.Weight.Bold)
-        value_label.setFont(value_font)
-        value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        value_label.setStyleSheet(f"color: {CURRENT_THEME['primary']};")
+        self.value_label.setFont(value_font)
+        self.value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.value_label.setStyleSheet(f"color: {CURRENT_THEME['primary']};")
         
         layout.addWidget(icon_label)
         layout.addWidget(title_label)
-        layout.addWidget(value_label)
+        layout.addWidget(self.value_label)
         
         if subtitle:
             subtitle_label = QLabel(subtitle)
@@ -75,18 +84,124 @@ class StatCard(QFrame):
             layout.addWidget(subtitle_label)
         
         self.setLayout(layout)
+    
+    def set_value(self, value: str) -> None:
+        """
+        Actualiza el valor principal de la tarjeta.
+        
+        Args:
+            value: Nuevo valor
+        """
+        self.value_label.setText(value)
+
+
+class TrendChart(QWidget):
+    """
+    Gráfico de tendencia: barras con la cantidad de servicios por período y
+    una línea con el costo total.
+    """
+    
+    MARGEN = 30
+    
+    def __init__(self):
+        """Inicializa el gráfico vacío."""
+        super().__init__()
+        self.serie: List[Dict[str, Any]] = []
+        self.setMinimumHeight(220)
+        self.setMouseTracking(True)
+    
+    def set_serie(self, serie: List[Dict[str, Any]]) -> None:
+        """
+        Reemplaza los datos del gráfico.
+        
+        Args:
+            serie: Períodos devueltos por AnaliticaController.obtener_tendencia
+        """
+        self.serie = serie
+        self.update()
+    
+    def _barra(self, indice: int) -> QRectF:
+        """Rectángulo disponible para la barra de un período."""
+        ancho = (self.width() - 2 * self.MARGEN) / max(len(self.serie), 1)
+        alto = self.height() - 2 * self.MARGEN
+        return QRectF(self.MARGEN + indice * ancho, self.MARGEN, ancho, alto)
+    
+    def paintEvent(self, event) -> None: # type: ignore
+        """Dibuja las barras, la línea de costo y las etiquetas de período."""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        if not self.serie:
+            painter.setPen(QColor(CURRENT_THEME['text_tertiary']))
+            painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, "Sin datos")
+            return
+        
+        max_cantidad = max(p['cantidad'] for p in self.serie) or 1
+        max_costo = max(p['costo_total'] for p in self.serie) or 1
+        puntos = []
+        
+        for indice, punto in enumerate(self.serie):
+            area = self._barra(indice)
+            alto = area.height() * punto['cantidad'] / max_cantidad
+            barra = QRectF(area.x() + area.width() * 0.15, area.bottom() - alto,
+                           area.width() * 0.7, alto)
+            painter.fillRect(barra, QColor(CURRENT_THEME['primary']))
+            
+            puntos.append(QPointF(area.center().x(),
+                                  area.bottom() - area.height() * punto['costo_total'] / max_costo))
+            
+            painter.setPen(QColor(CURRENT_THEME['text_secondary']))
+            etiqueta = QRectF(area.x(), area.bottom() + 4, area.width(), self.MARGEN - 4)
+            painter.drawText(etiqueta, Qt.AlignmentFlag.AlignHCenter, punto['periodo'][2:])
+        
+        painter.setPen(QPen(QColor(CURRENT_THEME['secondary']), 2))
+        painter.drawPolyline(puntos)
+    
+    def mouseMoveEvent(self, event) -> None: # type: ignore
+        """Muestra el detalle del período bajo el cursor."""
+        for indice, punto in enumerate(self.serie):
+            if self._barra(indice).contains(event.position()):
+                demora = punto['demora_promedio']
+                texto = (f"{punto['periodo']}\n"
+                         f"Servicios: {punto['cantidad']}\n"
+                         f"Costo: ${punto['costo_total']:,.2f}")
+                if demora is not None:
+                    texto += f"\nDemora estimada promedio: {demora:.1f} días"
+                QToolTip.showText(event.globalPosition().toPoint(), texto, self)
+                return
+        QToolTip.hideText()
 
 
 class Dashboard(QWidget):
     """
     Vista del dashboard principal con estadísticas.
+    
+    Las estadísticas se calculan en un hilo del pool y se aplican al recibir
+    la señal de la tarea, por lo que la interfaz no se bloquea. Antes de
+    lanzar el cálculo se compara PRAGMA data_version con el valor de la
+    última carga: si ninguna conexión confirmó cambios, no se recalcula.
+    Mientras la vista está visible, un temporizador repite esa comparación
+    cada DASHBOARD_REFRESH_MS milisegundos.
     """
     
+    MESES_TENDENCIA = 12
+    
     def __init__(self):
         """Inicializa el dashboard."""
         super().__init__()
+        self.db = DatabaseConnection()
         self.cliente_controller = ClienteController()
         self.servicio_controller = ServicioController()
+        self.analitica_controller = AnaliticaController()
+        self._version: Optional[int] = None
+        self._generacion = 0
+        self._signals_actuales = None
+        self._pool = QThreadPool.globalInstance()
+        
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setInterval(DASHBOARD_REFRESH_MS)
+        self._refresh_timer.timeout.connect(self.cargar_estadisticas)
+        
         self.init_ui()
         self.cargar_estadisticas()
     
@@ -138,6 +253,16 @@ class Dashboard(QWidget):
         grid_layout.addWidget(self.costo_total_card, 1, 3)
         
         layout.addLayout(grid_layout)
+        
+        tendencia_label = QLabel(f"📈 Tendencia de {self.MESES_TENDENCIA} meses (servicios y costo)")
+        tendencia_font = QFont()
+        tendencia_font.setPointSize(12)
+        tendencia_font.setBold(True)
+        tendencia_label.setFont(tendencia_font)
+        layout.addWidget(tendencia_label)
+        
+        self.tendencia_chart = TrendChart()
+        layout.addWidget(self.tendencia_chart)
         layout.addStretch()
         
         button_layout = QHBoxLayout()
@@ -146,37 +271,97 @@ class Dashboard(QWidget):
         refresh_btn = QPushButton("🔄  Actualizar")
         refresh_btn.setMinimumHeight(40)
         refresh_btn.setMinimumWidth(150)
-        refresh_btn.clicked.connect(self.cargar_estadisticas)
+        refresh_btn.clicked.connect(lambda: self.cargar_estadisticas(forzar=True))
         button_layout.addWidget(refresh_btn)
         
         layout.addLayout(button_layout)
         
         self.setLayout(layout)
     
-    def cargar_estadisticas(self) -> None:
-        """Carga todas las estadísticas."""
+    def showEvent(self, event) -> None: # type: ignore
+        """Inicia la actualización automática mientras la vista está visible."""
+        super().showEvent(event)
+        if DASHBOARD_REFRESH_MS > 0:
+            self._refresh_timer.start()
+    
+    def hideEvent(self, event) -> None: # type: ignore
+        """Detiene la actualización automática al ocultar la vista."""
+        super().hideEvent(event)
+        self._refresh_timer.stop()
+    
+    def cargar_estadisticas(self, forzar: bool = False) -> None:
+        """
+        Recalcula las estadísticas en segundo plano si los datos cambiaron.
+        
+        Args:
+            forzar: Si se recalcula aunque data_version no haya cambiado
+        """
+        if self._signals_actuales is not None:
+            return
+        
         try:
-            clientes = self.cliente_controller.obtener_todos_clientes()
-            clientes_activos = len([c for c in clientes if not c.baja])
-            
-            self.total_clientes_card.findChild(QLabel).setText(str(len(clientes)))
-            self.clientes_activos_card.findChild(QLabel).setText(str(clientes_activos))
-            
-            servicios = self.servicio_controller.obtener_todos_servicios()
+            if not forzar and self.db.data_version() == self._version:
+                return
+        except Exception as e:
+            logger.error("Error al consultar la versión de datos: %s", e)
+            return
+        
+        self._generacion += 1
+        tarea = TareaConsulta(self._generacion, self._calcular_estadisticas)
+        tarea.signals.terminado.connect(self._on_estadisticas)
+        tarea.signals.error.connect(self._on_error)
+        # Mantiene vivas las señales hasta recibir el resultado
+        self._signals_actuales = tarea.signals
+        self._pool.start(tarea)
+    
+    def _calcular_estadisticas(self) -> Dict[str, Any]:
+        """
+        Calcula todas las estadísticas (se ejecuta en un hilo del pool).
+        
+        Los rollups se actualizan antes de leer data_version, así la
+        escritura propia no provoca un recálculo en la siguiente verificación.
+        
+        Returns:
+            Dict[str, Any]: Versión de datos leída y estadísticas calculadas
+        """
+        self.analitica_controller.actualizar_rollups()
+        version = self.db.data_version()
+        return {
+            'version': version,
+            'clientes': self.cliente_controller.obtener_estadisticas(),
+            'servicios': self.servicio_controller.obtener_estadisticas(),
+            'tendencia': self.analitica_controller.obtener_tendencia_mensual(
+                self.MESES_TENDENCIA, actualizar=False
+            )
+        }
+    
+    def _on_estadisticas(self, generacion: int, datos: Dict[str, Any]) -> None:
+        """Aplica las estadísticas calculadas en segundo plano."""
+        self._signals_actuales = None
+        if generacion != self._generacion:
+            return
+        
+        try:
+            stats_clientes = datos['clientes']
+            self.total_clientes_card.set_value(str(stats_clientes['total']))
+            self.clientes_activos_card.set_value(str(stats_clientes['activos']))
             
-            pendientes = len([s for s in servicios if s.estado == 'PENDIENTE'])
-            proceso = len([s for s in servicios if s.estado == 'EN_PROCESO'])
-            completados = len([s for s in servicios if s.estado == 'COMPLETADO'])
-            cancelados = len([s for s in servicios if s.estado == 'CANCELADO'])
+            stats_servicios = datos['servicios']
+            por_estado = stats_servicios['por_estado']
             
-            costo_total = sum(s.costo for s in servicios)
+            self.total_servicios_card.set_value(str(stats_servicios['activos']))
+            self.servicios_pendientes_card.set_value(str(por_estado['PENDIENTE']))
+            self.servicios_proceso_card.set_value(str(por_estado['EN_PROCESO']))
+            self.servicios_completados_card.set_value(str(por_estado['COMPLETADO']))
+            self.servicios_cancelados_card.set_value(str(por_estado['CANCELADO']))
+            self.costo_total_card.set_value(f"${stats_servicios['costo_total']:,.2f}")
             
-            self.total_servicios_card.findChild(QLabel).setText(str(len(servicios)))
-            self.servicios_pendientes_card.findChild(QLabel).setText(str(pendientes))
-            self.servicios_proceso_card.findChild(QLabel).setText(str(proceso))
-            self.servicios_completados_card.findChild(QLabel).setText(str(completados))
-            self.servicios_cancelados_card.findChild(QLabel).setText(str(cancelados))
-            self.costo_total_card.findChild(QLabel).setText(f"${costo_total:,.2f}")
+            self.tendencia_chart.set_serie(datos['tendencia'])
+            self._version = datos['version']
         
         except Exception as e:
-            print(f"Error cargando estadísticas: {e}")
+            logger.error("Error aplicando estadísticas: %s", e)
+    
+    def _on_error(self, generacion: int, mensaje: str) -> None:
+        """Libera la tarea fallida; se reintentará en la próxima verificación."""
+        self._signals_actuales = None
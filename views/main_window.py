@@ -1,14 +1,14 @@
 """
 Ventana principal de la aplicación.
 """
+import time
+from typing import Dict
+
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QPushButton, QStackedWidget,
                              QMessageBox, QLabel, QFrame)
-from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtCore import Qt, QSize, QTimer, pyqtSignal
 from PyQt6.QtGui import QFont
-from views.dashboard import Dashboard
-from views.cliente_view import ClienteView
-from views.servicio_view import ServicioView
 from utils.logger import setup_logger
 from utils.styles import get_stylesheet
 from utils.icons import icon_button_text
@@ -20,11 +20,23 @@ logger = setup_logger(__name__)
 class MainWindow(QMainWindow):
     """
     Ventana principal que contiene las diferentes vistas de la aplicación.
+    
+    Cada vista (y su módulo) se crea la primera vez que se muestra, de modo
+    que la ventana aparece antes de importar las vistas o abrir la base de
+    datos. La vista inicial se construye en el primer ciclo del bucle de
+    eventos, después de pintar la ventana.
     """
     
+    DASHBOARD, CLIENTES, SERVICIOS = range(3)
+    NOMBRES_VISTAS = ('Dashboard', 'Clientes', 'Servicios')
+    
+    # Nombre de la vista y milisegundos que tomó construirla
+    vista_creada = pyqtSignal(str, float)
+    
     def __init__(self) -> None:
         """Inicializa la ventana principal."""
         super().__init__()
+        self._vistas: Dict[int, QWidget] = {}
         self.init_ui()
     
     def init_ui(self) -> None:
@@ -91,44 +103,78 @@ class MainWindow(QMainWindow):
         
         main_layout.addWidget(nav_widget)
         
-        # Widget apilado
+        # Widget apilado: un marcador vacío por vista hasta que se muestre
         self.stacked_widget = QStackedWidget()
+        for _ in self.NOMBRES_VISTAS:
+            self.stacked_widget.addWidget(QWidget())
         
-        # Crear vistas
-        self.dashboard_view = Dashboard()
-        self.cliente_view = ClienteView()
-        self.servicio_view = ServicioView()
+        main_layout.addWidget(self.stacked_widget)
         
-        self.stacked_widget.addWidget(self.dashboard_view)
-        self.stacked_widget.addWidget(self.cliente_view)
-        self.stacked_widget.addWidget(self.servicio_view)
+        # Estado inicial (la vista se construye al mostrarse la ventana)
+        self.dashboard_btn.setChecked(True)
+    
+    def showEvent(self, event) -> None: # type: ignore
+        """Programa la construcción de la vista inicial tras el primer pintado."""
+        super().showEvent(event)
+        if not self._vistas:
+            QTimer.singleShot(0, self.mostrar_dashboard)
+    
+    def _crear_vista(self, indice: int) -> QWidget:
+        """Importa y construye la vista del índice indicado."""
+        if indice == self.DASHBOARD:
+            from views.dashboard import Dashboard
+            return Dashboard()
+        if indice == self.CLIENTES:
+            from views.cliente_view import ClienteView
+            return ClienteView()
+        from views.servicio_view import ServicioView
+        return ServicioView()
+    
+    def vista(self, indice: int) -> QWidget:
+        """
+        Obtiene una vista, construyéndola si es la primera vez.
         
-        main_layout.addWidget(self.stacked_widget)
+        Args:
+            indice: DASHBOARD, CLIENTES o SERVICIOS
         
-        # Estado inicial
-        self.mostrar_dashboard()
+        Returns:
+            QWidget: Vista ubicada en su posición del widget apilado
+        """
+        vista = self._vistas.get(indice)
+        if vista is None:
+            inicio = time.perf_counter()
+            vista = self._crear_vista(indice)
+            marcador = self.stacked_widget.widget(indice)
+            self.stacked_widget.removeWidget(marcador)
+            marcador.deleteLater()
+            self.stacked_widget.insertWidget(indice, vista)
+            self._vistas[indice] = vista
+            
+            ms = (time.perf_counter() - inicio) * 1000
+            logger.info("Vista %s creada en %.1f ms", self.NOMBRES_VISTAS[indice], ms)
+            self.vista_creada.emit(self.NOMBRES_VISTAS[indice], ms)
+        return vista
+    
+    def _mostrar(self, indice: int) -> QWidget:
+        """Marca el botón de la vista, la construye si hace falta y la muestra."""
+        botones = (self.dashboard_btn, self.clientes_btn, self.servicios_btn)
+        for posicion, boton in enumerate(botones):
+            boton.setChecked(posicion == indice)
+        vista = self.vista(indice)
+        self.stacked_widget.setCurrentIndex(indice)
+        return vista
     
     def mostrar_dashboard(self) -> None:
         """Muestra la vista del dashboard."""
-        self.dashboard_btn.setChecked(True)
-        self.clientes_btn.setChecked(False)
-        self.servicios_btn.setChecked(False)
-        self.dashboard_view.cargar_estadisticas()
-        self.stacked_widget.setCurrentIndex(0)
+        self._mostrar(self.DASHBOARD).cargar_estadisticas()
     
     def mostrar_clientes(self) -> None:
         """Muestra la vista de clientes."""
-        self.dashboard_btn.setChecked(False)
-        self.clientes_btn.setChecked(True)
-        self.servicios_btn.setChecked(False)
-        self.stacked_widget.setCurrentIndex(1)
+        self._mostrar(self.CLIENTES)
     
     def mostrar_servicios(self) -> None:
         """Muestra la vista de servicios."""
-        self.dashboard_btn.setChecked(False)
-        self.clientes_btn.setChecked(False)
-        self.servicios_btn.setChecked(True)
-        self.stacked_widget.setCurrentIndex(2)
+        self._mostrar(self.SERVICIOS)
     
     def closeEvent(self, event): # type: ignore
         """
@@ -2,10 +2,10 @@
 Vista para la gestión de servicios.
 """
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-                             QTableWidget, QTableWidgetItem, QLabel, QLineEdit,
+                             QTableView, QAbstractItemView, QLabel, QLineEdit,
                              QMessageBox, QDialog, QFormLayout, QComboBox,
                              QCheckBox, QDateEdit, QDoubleSpinBox, QSpinBox,
-                             QHeaderView, QFrame)
+                             QHeaderView, QFrame, QInputDialog)
 from PyQt6.QtCore import Qt, QDate
 from PyQt6.QtGui import QFont
 from datetime import date
@@ -15,7 +15,23 @@ from controllers.servicio_controller import ServicioController
 from models.servicio import Servicio
 from utils.styles import get_stylesheet
 from utils.icons import icon_button_text
-from utils.export import ReportGenerator
+from utils.workers import BusquedaDiferida
+from utils.ui_helpers import run_with_progress
+from views.cliente_combo import ClienteComboBox, CAMPOS_CLIENTE_SELECTOR, texto_cliente
+from utils.table_models import (LazyTableModel, pagina_de_lista, color_baja,
+                                color_estado_servicio)
+
+COLUMNAS_SERVICIOS = [
+    ("ID", lambda s: s.id, None),
+    ("Descripción", lambda s: s.descripcion, None),
+    ("Estado", lambda s: s.estado, color_estado_servicio),
+    ("F. Ingreso", lambda s: s.fecha_ingreso.isoformat() if s.fecha_ingreso else "", None),
+    ("F. Estimada", lambda s: s.fecha_estimada.isoformat() if s.fecha_estimada else "", None),
+    ("Costo", lambda s: f"$ {s.costo:.2f}", None),
+    ("Cliente", lambda s: s.cliente_nombre_completo, None),
+    ("DNI Cliente", lambda s: s.cliente_dni, None),
+    ("Estado", lambda s: "Activo" if not s.baja else "Inactivo", color_baja),
+]
 
 
 class ServicioDialog(QDialog):
@@ -78,8 +94,7 @@ class ServicioDialog(QDialog):
         self.costo_input.setDecimals(2)
         
         cliente_layout = QHBoxLayout()
-        self.cliente_combo = QComboBox()
-        self.cargar_clientes()
+        self.cliente_combo = ClienteComboBox()
         
         buscar_cliente_btn = QPushButton("🔍")
         buscar_cliente_btn.setMaximumWidth(45)
@@ -121,13 +136,6 @@ class ServicioDialog(QDialog):
         
         self.setLayout(layout)
     
-    def cargar_clientes(self):
-        """Carga los clientes activos en el combobox."""
-        clientes = self.cliente_controller.obtener_todos_clientes()
-        self.cliente_combo.clear()
-        for cliente in clientes:
-            self.cliente_combo.addItem(cliente.nombre_completo, cliente.id)
-    
     def buscar_cliente(self):
         """Abre un diálogo de búsqueda de cliente."""
         from PyQt6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLineEdit, QListWidget, QListWidgetItem, QPushButton
@@ -154,31 +162,35 @@ class ServicioDialog(QDialog):
         button_layout.addWidget(cancel_btn)
         layout.addLayout(button_layout)
         
+        busqueda = BusquedaDiferida(self.cliente_controller.buscar_clientes_fulltext,
+                                    parent=dialog)
+        
         def actualizar_busqueda():
-            client_list.clear()
-            criterio = search_input.text().lower()
+            criterio = search_input.text()
             if not criterio:
+                busqueda.cancelar()
+                client_list.clear()
                 return
             
-            clientes = self.cliente_controller.obtener_todos_clientes()
+            busqueda.solicitar(criterio, 50, None, CAMPOS_CLIENTE_SELECTOR)
+        
+        def mostrar_resultados(clientes):
+            client_list.clear()
             for cliente in clientes:
-                if (criterio in cliente.nombre.lower() or 
-                    criterio in cliente.apellido.lower() or 
-                    criterio in cliente.dni):
-                    item = QListWidgetItem(f"{cliente.nombre_completo} - {cliente.dni}")
-                    item.setData(Qt.ItemDataRole.UserRole, cliente.id)
-                    client_list.addItem(item)
+                item = QListWidgetItem(texto_cliente(cliente))
+                item.setData(Qt.ItemDataRole.UserRole, cliente['id'])
+                client_list.addItem(item)
         
         def seleccionar_cliente():
             current_item = client_list.currentItem()
             if current_item:
-                cliente_id = current_item.data(Qt.ItemDataRole.UserRole)
-                index = self.cliente_combo.findData(cliente_id)
-                if index >= 0:
-                    self.cliente_combo.setCurrentIndex(index)
+                self.cliente_combo.seleccionar_cliente(
+                    current_item.data(Qt.ItemDataRole.UserRole), current_item.text()
+                )
                 dialog.accept()
         
         search_input.textChanged.connect(actualizar_busqueda)
+        busqueda.resultados.connect(mostrar_resultados)
         select_btn.clicked.connect(seleccionar_cliente)
         cancel_btn.clicked.connect(dialog.reject)
         
@@ -205,17 +217,14 @@ class ServicioDialog(QDialog):
             
             self.costo_input.setValue(self.servicio.costo)
             
-            index = self.cliente_combo.findData(self.servicio.idCliente)
-            if index >= 0:
-                self.cliente_combo.setCurrentIndex(index)
+            self.cliente_combo.seleccionar_cliente(self.servicio.idCliente)
             
             self.baja_checkbox.setChecked(self.servicio.baja)
         else:
             ultimo_cliente = self.cliente_controller.obtener_ultimo_cliente()
             if ultimo_cliente:
-                index = self.cliente_combo.findData(ultimo_cliente.id)
-                if index >= 0:
-                    self.cliente_combo.setCurrentIndex(index)
+                self.cliente_combo.seleccionar_cliente(ultimo_cliente.id,
+                                                       texto_cliente(ultimo_cliente.to_dict()))
     
     def guardar(self):
         """Guarda los datos del servicio."""
@@ -226,7 +235,7 @@ class ServicioDialog(QDialog):
             'fecha_ingreso': self.fecha_ingreso_input.date().toPyDate().isoformat(),
             'fecha_estimada': self.fecha_estimada_input.date().toPyDate().isoformat(),
             'costo': self.costo_input.value(),
-            'idCliente': self.cliente_combo.currentData(),
+            'idCliente': self.cliente_combo.cliente_id(),
             'baja': self.baja_checkbox.isChecked()
         }
         
@@ -242,6 +251,7 @@ class ServicioDialog(QDialog):
                 self.servicio.id, servicio_data
             )
             if success:
+                self.cliente_combo.registrar_uso()
                 QMessageBox.information(self, "Éxito", "Servicio actualizado correctamente.")
                 self.accept()
             else:
@@ -250,6 +260,7 @@ class ServicioDialog(QDialog):
             # Modo creación
             nuevo_servicio = self.servicio_controller.crear_servicio(servicio_data)
             if nuevo_servicio:
+                self.cliente_combo.registrar_uso()
                 QMessageBox.information(self, "Éxito", "Servicio creado correctamente.")
                 self.accept()
             else:
@@ -260,11 +271,13 @@ class ServicioView(QWidget):
     Vista principal para la gestión de servicios.
     """
     
+    PAGE_SIZE = 200
+    
     def __init__(self):
         """Inicializa la vista de servicios."""
         super().__init__()
         self.controller = ServicioController()
-        self.report_generator = ReportGenerator()
+        self.report_generator = None
         self.setStyleSheet(get_stylesheet())
         self.init_ui()
         self.cargar_servicios()
@@ -297,20 +310,20 @@ class ServicioView(QWidget):
         
         layout.addLayout(filter_layout)
         
-        self.servicios_table = QTableWidget()
-        self.servicios_table.setColumnCount(8)
-        self.servicios_table.setHorizontalHeaderLabels([
-            "ID", "Descripción", "Estado", "F. Ingreso", "F. Estimada", 
-            "Costo", "ID Cliente", "Estado"
-        ])
+        self.servicios_model = LazyTableModel(COLUMNAS_SERVICIOS, block_size=self.PAGE_SIZE)
+        self.servicios_table = QTableView()
+        self.servicios_table.setModel(self.servicios_model)
         
         header = self.servicios_table.horizontalHeader()
         if header:
-            header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+            # ResizeToContents recorre todas las filas: con modelos grandes se usa Interactive
+            header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+            header.setStretchLastSection(True)
             header.hideSection(0)
-        self.servicios_table.setColumnWidth(0, 0)
+        self.servicios_table.verticalHeader().setDefaultSectionSize(30) # type: ignore
         self.servicios_table.setAlternatingRowColors(True)
-        self.servicios_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.servicios_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.servicios_table.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         
         layout.addWidget(self.servicios_table)
         
@@ -330,6 +343,10 @@ class ServicioView(QWidget):
         self.eliminar_btn.setObjectName("dangerBtn")
         self.eliminar_btn.clicked.connect(self.eliminar_servicio)
         
+        self.estado_btn = QPushButton(icon_button_text("edit", "Cambiar Estado"))
+        self.estado_btn.setMinimumHeight(40)
+        self.estado_btn.clicked.connect(self.cambiar_estado_seleccionados)
+        
         self.actualizar_btn = QPushButton(icon_button_text("refresh", "Actualizar"))
         self.actualizar_btn.setMinimumHeight(40)
         self.actualizar_btn.clicked.connect(self.cargar_servicios)
@@ -341,6 +358,7 @@ class ServicioView(QWidget):
         button_layout.addWidget(self.nuevo_btn)
         button_layout.addWidget(self.editar_btn)
         button_layout.addWidget(self.eliminar_btn)
+        button_layout.addWidget(self.estado_btn)
         button_layout.addStretch()
         button_layout.addWidget(self.exportar_btn)
         button_layout.addWidget(self.actualizar_btn)
@@ -350,55 +368,23 @@ class ServicioView(QWidget):
         self.setLayout(layout)
     
     def cargar_servicios(self):
-        """Carga todos los servicios en la tabla."""
-        servicios = self.controller.obtener_todos_servicios()
-        self.actualizar_tabla(servicios)
+        """Carga los servicios en la tabla; las filas se leen por bloques al desplazarse."""
+        estado = self.filter_combo.currentText()
+        estado_filtro = None if estado == "Todos" else estado
+        
+        self.servicios_model.set_fuente(
+            lambda page_size, after_key: self.controller.obtener_servicios_con_cliente(
+                page_size, after_key, estado=estado_filtro
+            )
+        )
     
     def filtrar_servicios(self, estado):
         """Filtra servicios por estado."""
-        if estado == "Todos":
-            servicios = self.controller.obtener_todos_servicios()
-        else:
-            servicios = self.controller.obtener_servicios_por_estado(estado)
-        
-        self.actualizar_tabla(servicios)
+        self.cargar_servicios()
     
     def actualizar_tabla(self, servicios):
-        """Actualiza la tabla con la lista de servicios."""
-        self.servicios_table.setRowCount(len(servicios))
-        
-        for i, servicio in enumerate(servicios):
-            self.servicios_table.setItem(i, 0, QTableWidgetItem(str(servicio.id)))
-            self.servicios_table.setItem(i, 1, QTableWidgetItem(servicio.descripcion))
-            self.servicios_table.setItem(i, 2, QTableWidgetItem(servicio.estado))
-            
-            # Aplicar color según el estado
-            estado_item = self.servicios_table.item(i, 2)
-            if servicio.estado == "COMPLETADO":
-                estado_item.setForeground(Qt.GlobalColor.darkGreen) # pyright: ignore[reportOptionalMemberAccess]
-            elif servicio.estado == "CANCELADO":
-                estado_item.setForeground(Qt.GlobalColor.red) # pyright: ignore[reportOptionalMemberAccess]
-            elif servicio.estado == "EN_PROCESO":
-                estado_item.setForeground(Qt.GlobalColor.blue) # pyright: ignore[reportOptionalMemberAccess]
-            
-            self.servicios_table.setItem(i, 3, 
-                QTableWidgetItem(servicio.fecha_ingreso.isoformat() if servicio.fecha_ingreso else ""))
-            
-            self.servicios_table.setItem(i, 4, 
-                QTableWidgetItem(servicio.fecha_estimada.isoformat() if servicio.fecha_estimada else ""))
-            
-            self.servicios_table.setItem(i, 5, 
-                QTableWidgetItem(f"$ {servicio.costo:.2f}"))
-            
-            self.servicios_table.setItem(i, 6, QTableWidgetItem(str(servicio.idCliente)))
-            
-            estado_servicio = "Activo" if not servicio.baja else "Inactivo"
-            estado_item = QTableWidgetItem(estado_servicio)
-            if servicio.baja:
-                estado_item.setForeground(Qt.GlobalColor.red)
-            else:
-                estado_item.setForeground(Qt.GlobalColor.darkGreen)
-            self.servicios_table.setItem(i, 7, estado_item)
+        """Actualiza la tabla con una lista de servicios (ServicioDetalle)."""
+        self.servicios_model.set_fuente(pagina_de_lista(servicios))
     
     def obtener_servicio_seleccionado(self):
         """Obtiene el servicio seleccionado en la tabla."""
@@ -406,24 +392,81 @@ class ServicioView(QWidget):
         if not selected_rows:
             return None
         
-        row = selected_rows[0].row()
-        servicio_id = int(self.servicios_table.item(row, 0).text()) # type: ignore
-        return self.controller.obtener_servicio(servicio_id)
+        servicio = self.servicios_model.item(selected_rows[0].row())
+        if servicio is None:
+            return None
+        return self.controller.obtener_servicio(servicio.id)
+    
+    def obtener_ids_seleccionados(self):
+        """Obtiene los IDs de todos los servicios seleccionados en la tabla."""
+        selected_rows = self.servicios_table.selectionModel().selectedRows() # type: ignore
+        ids = []
+        for index in selected_rows:
+            servicio = self.servicios_model.item(index.row())
+            if servicio is not None:
+                ids.append(servicio.id)
+        return ids
+    
+    def cambiar_estado_seleccionados(self):
+        """Cambia el estado de todos los servicios seleccionados en una sola operación."""
+        ids = self.obtener_ids_seleccionados()
+        if not ids:
+            QMessageBox.warning(self, "Advertencia", "Seleccione uno o más servicios.")
+            return
+        
+        nuevo_estado, ok = QInputDialog.getItem(
+            self, "Cambiar Estado",
+            f"Nuevo estado para {len(ids)} servicio(s):",
+            Servicio.ESTADOS, 0, False
+        )
+        if not ok:
+            return
+        
+        actualizados = self.controller.actualizar_estado_servicios(ids, nuevo_estado)
+        if actualizados < 0:
+            QMessageBox.critical(self, "Error", "Error al cambiar el estado de los servicios.")
+            return
+        
+        QMessageBox.information(
+            self, "Éxito", f"Servicios actualizados a {nuevo_estado}: {actualizados}"
+        )
+        self.cargar_servicios()
     
     def exportar_servicios(self):
-        """Exporta todos los servicios a CSV."""
-        servicios = self.controller.obtener_todos_servicios(incluir_bajas=True)
-        servicios_data = [s.to_dict() for s in servicios]
+        """Exporta todos los servicios a CSV en segundo plano."""
+        total = self.controller.obtener_estadisticas()['total']
+        
+        if self.report_generator is None:
+            from utils.export import ReportGenerator
+            self.report_generator = ReportGenerator()
+        
+        def exportar(on_progress, is_cancelled):
+            return self.report_generator.export_servicios_csv_stream(
+                self.controller.iterar_servicios_export(incluir_bajas=True),
+                total, on_progress, is_cancelled
+            )
         
-        filepath = self.report_generator.export_servicios_csv(servicios_data)
+        self.exportar_btn.setEnabled(False)
+        run_with_progress(self, "Exportando servicios...", exportar,
+                          self._exportacion_terminada, self._exportacion_fallida)
+    
+    def _exportacion_terminada(self, filepath):
+        """Informa el resultado de la exportación."""
+        self.exportar_btn.setEnabled(True)
+        # Sin ruta: el usuario canceló y el archivo parcial ya se eliminó
         if filepath:
             QMessageBox.information(
                 self,
                 "Éxito",
                 f"Archivo exportado a:\n{filepath}"
             )
-        else:
-            QMessageBox.warning(self, "Error", "No se pudo exportar los servicios.")
+    
+    def _exportacion_fallida(self, mensaje):
+        """Informa un error durante la exportación."""
+        self.exportar_btn.setEnabled(True)
+        QMessageBox.warning(
+            self, "Error", f"No se pudo exportar los servicios:\n{mensaje}"
+        )
     
     def nuevo_servicio(self):
         """Abre el diálogo para crear un nuevo servicio."""